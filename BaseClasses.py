@@ -1,8 +1,12 @@
 import copy
 from enum import Enum, unique
+import io
 import logging
 from collections import OrderedDict
 
+from Progress import SeedProgress
+from RuleNodes import FORM_ITEMS, HUMAN_ITEMS, TRUE, helper_function
+
 """
 World object:
 Creates the world we're gonna start with and which will be populated.
@@ -36,6 +40,8 @@ class World(object):
                 , place_dungeon_items
                 , check_beatable_only
                 , hints):
+        # constructor arguments, used to build more worlds with the same settings
+        self.settings = (moon, open_ocarina, shuffle_owls, place_dungeon_items, check_beatable_only, hints)
         self.shuffle = 'vanilla' # option for entrance shuffle
         self.moon = moon         # beatable requirement option
         self.dungeons = []       # contains dungeons for dungeon item pools
@@ -47,7 +53,13 @@ class World(object):
         self._entrance_cache = {} # internally used by `get_entrance`
         self._region_cache = {}  # internally used by `get_region`
         self._location_cache = {} # internally used by `get_location`
+        self._item_locations = {} # item name -> Locations holding it, kept up to date by `set_item`/`remove_item`
         self.required_locations = [] # used for statistical analysis (`create_playthrough`)
+        self.shuffled_entrances = [] # Entrances connected by the seed, disconnected again by `reset`
+        self.timings = OrderedDict() # seconds spent in each stage of `Main.main`
+        self.reach_stats = OrderedDict() # reachability counters of each stage, with `--reach_stats`
+        self.requirements = None # minimal item requirements of the seed, with `--fast_reachability` (see Requirements.py)
+        self.progress = SeedProgress() # stage tracking and progress events, set by `Main.main`
         self.check_beatable_only = check_beatable_only
         self.place_dungeon_items = place_dungeon_items
         self.open_ocarina = open_ocarina
@@ -62,6 +74,38 @@ class World(object):
         for region in self.regions:
             region.world = self
 
+    '''
+    Clears everything a seed put into the world, so it can be used
+    for the next seed without being built again.
+    - Removes all items, events and the item pool
+    - Disconnects the `shuffled_entrances`
+    - Starts a new CollectionState and Spoiler
+    Regions, dungeons, the fixed connections and all rules are kept.
+    '''
+    def reset(self):
+        for location in self.get_locations():
+            if location.item is not None:
+                location.item.location = None
+                location.item = None
+            location.event = False
+            location.recursion_count = 0
+        for entrance in self.shuffled_entrances:
+            entrance.disconnect()
+        for region in self.regions:
+            region.recursion_count = 0
+            for entrance in region.exits:
+                entrance.recursion_count = 0
+        self.shuffled_entrances = []
+        self._item_locations = {}
+        self.itempool = []
+        self.seed = None
+        self.required_locations = []
+        self.timings = OrderedDict()
+        self.reach_stats = OrderedDict()
+        self.requirements = None
+        self.state = CollectionState(self)
+        self.spoiler = Spoiler(self)
+
     # Checks if `regionname` is actually a Region
     # If not, will try to find that name in `World.regions` if
     # you only gave the name of the Region and cache it to
@@ -145,13 +189,29 @@ class World(object):
         return [loc.item for loc
                 in self.get_filled_locations()] + self.itempool
 
-    # Takes an item(name?) and gives the location(s) where
+    # Takes an item name and gives the location(s) where
     # that item can be found.
     def find_items(self, item):
-        return [location for location
-                in self.get_locations()
-                        if location.item is not None
-                                        and location.item.name == item]
+        return list(self._item_locations.get(item, ()))
+
+    # Puts the item in the Location without any checks and
+    # keeps the item -> locations index up to date.
+    def set_item(self, location, item):
+        location = self.get_location(location)
+        if location.item is not None:
+            self.remove_item(location)
+        location.item = item
+        item.location = location
+        self._item_locations.setdefault(item.name, []).append(location)
+
+    # Takes the item out of the Location (if there is one) and returns it.
+    def remove_item(self, location):
+        location = self.get_location(location)
+        item = location.item
+        if item is not None:
+            self._item_locations[item.name].remove(location)
+            location.item = None
+        return item
 
 
     # Takes a Location and an Item and tries to put the item in the
@@ -164,8 +224,7 @@ class World(object):
             location = self.get_location(location)
 
         if location.can_fill(self.state, item, False):
-            location.item = item
-            item.location = location
+            self.set_item(location, item)
             if collect:
                 self.state.collect(item, location.event, location)
 
@@ -265,9 +324,15 @@ class World(object):
             # in dependencies and only depends on lower spheres
             sphere = []
 
+            # With `.requirements` most locations are checked against the inventory alone
+            inventory = self.requirements.inventory(state) if self.requirements is not None else None
+
             # Check if any of the reachable locations contains Majora's Mask
             for location in prog_locations:
-                if state.can_reach(location):
+                reachable = self.requirements.can_reach(location, inventory) if inventory is not None else None
+                if reachable is None:
+                    reachable = state.can_reach(location)
+                if reachable:
                     if location.item.name == 'Majora Mask':
                         return True
                     sphere.append(location)
@@ -407,11 +472,14 @@ class CollectionState(object):
 
     # Checks to see if any of the event Locations that have an item
     # are reachable, and considers them done/collected.
+    # Returns the number of passes it took.
     def sweep_for_events(self, key_only=False):
         # this may need improvement
         new_locations = True
         checked_locations = 0
+        iterations = 0
         while new_locations:
+            iterations += 1
             reachable_events = [location for location
                                 in self.world.get_filled_locations()
                                         if location.event
@@ -423,6 +491,7 @@ class CollectionState(object):
                     self.collect(event.item, True, event)
             new_locations = len(reachable_events) > checked_locations
             checked_locations = len(reachable_events)
+        return iterations
 
     # Check if the given (number of) item(s) is in `.prog_items`
     def has(self, item, count=1):
@@ -439,8 +508,9 @@ class CollectionState(object):
                   )
 
     # Checks if explosions are possible given the current state.
+    # (This and the other helpers made of items are defined in `RuleNodes.HELPERS`)
     def can_blast(self):
-        return (self.form('Human') and (self.has('Bomb Bag') or self.has('Blast Mask'))) or self.can_use('Powder Keg')
+        return helper_function('can_blast')(self)
 
     # Checks if bottles have been obtained
     def has_bottle(self):
@@ -457,20 +527,11 @@ class CollectionState(object):
     def has_hearts(self, count):
         # Warning: This only considers items that are marked as advancement items
         # (Vlix' comment: I don't know what this comment above means, but I'll keep it in)
-        return self.heart_count() >= count
+        return helper_function('has_hearts', count)(self)
 
-    # Checks if paper has been obtained.
+    # Checks if paper (any of `RuleNodes.PAPER_ITEMS`) has been obtained.
     def has_paper(self):
-        paper_list = [ 'Town Title Deed'
-                     , 'Swamp Title Deed'
-                     , 'Mountain Title Deed'
-                     , 'Ocean Title Deed'
-                     , 'Letter to Mama'
-                     , 'Letter to Anju']  # TODO: needs more?
-        for p in paper_list:
-            if self.has(p):
-                return True
-        return False
+        return helper_function('has_paper')(self)
 
     # TODO: consider can_wear(mask_name), rather than just using has(item)
     # would do a check to see if you have the mask and can do human form
@@ -487,15 +548,14 @@ class CollectionState(object):
     def can_kill_lizalfos(self):
         # I figure they use lizalfos as a miniboss enough that this is a check worth abstracting
         # I imagine deku can't deal with them, goron /probably/ can? to test, easy enough to chance later
-        return self.form('Human') or self.form('Zora') or self.form('Goron')
+        return helper_function('can_kill_lizalfos')(self)
 
     def can_kill_gekkos(self):
         # same as with lizalfos, it's common enough
         # I wonder, can zora hit with their blades in place of the bow? or hookshot maybe?
-        return (self.form('Deku') or self.can_blast() or self.form('Goron')) and self.can_use('Bow')
+        return helper_function('can_kill_gekkos')(self)
 
     def can_use(self, item):
-        human_items = ['Hookshot', 'Bow']
         # yeah, just write this out at some point
         # all masks (aside from transform ones), plus bombs etc.
         # hold on, better version
@@ -504,7 +564,7 @@ class CollectionState(object):
         # for stuff like 'Bow', it's ['Human']
         # for stuff like 'Fire Arrow', it's ['Human', 'Bow']
         # then just loop through it and check
-        if item in human_items:
+        if item in HUMAN_ITEMS:
             return self.form('Human') and self.has(item)
         return self.has(item)
 
@@ -514,9 +574,7 @@ class CollectionState(object):
     # Checks to see if balloons are poppable.
     def can_pop_balloon(self):
         # TODO: test for other ways of popping balloons (in the air)
-        return (self.form('Zora')
-            or (self.form('Deku') and self.has('Magic Meter'))
-            or (self.form('Human') and (self.has('Bow') or self.has('Hookshot'))))
+        return helper_function('can_pop_balloon')(self)
 
     def can(self, trick):
         # still don't know exactly how this should work, but the idea is to have a collection of tricks the user has
@@ -533,25 +591,20 @@ class CollectionState(object):
         )
 
     # Checks if the given form is accessable.
+    # (The masks are in `RuleNodes.FORM_ITEMS`, compiled rules check them directly)
     def form(self, form):
-        if form == 'Deku':
-            return self.has('Deku Mask')
-        if form == 'Goron':
-            return self.has('Goron Mask')
-        if form == 'Zora':
-            return self.has('Zora Mask')
         # TODO: This probably needs to change to something like:
         # `starting_form('Human') or has('Song of Healing')`
         # (or instead of Song of Healing, just Ocarina, or 'Cured by HMS' or something)
-        if form == 'Human':
-            return self.has('Fierce Deity Mask')
+        if form in FORM_ITEMS:
+            return self.has(FORM_ITEMS[form])
 
     def any_form_but(self, excl_form):
-        return True in [self.form(x) for x in ['Deku', 'Human', 'Goron', 'Zora'] if x != excl_form]
+        return helper_function('any_form_but', excl_form)(self)
 
     # Checks to see if fire can be generated autonomously
     def has_fire_source(self):
-        return self.has('Bow') and self.has('Fire Arrows') and self.has('Magic Meter')
+        return helper_function('has_fire_source')(self)
 
     # Not used anywhere, but used in ZOoTR in `Location.access_rule`s as a requirement?
     def guarantee_hint(self):
@@ -689,6 +742,7 @@ class Entrance(object):
         self.vanilla = None         # !!! NEVER USED
         # Function that takes a state and determines if the Entrance is reachable
         self.access_rule = lambda state: True
+        self.rule = TRUE            # `access_rule` as a RuleNodes tree, both set by `Rules.set_rule`
 
     # Checks if the Entrance is reachable
     # - Checks `self.access_rule` and if the region this Entrance is in is reachable
@@ -715,6 +769,14 @@ class Entrance(object):
         self.vanilla = vanilla
         region.entrances.append(self)
 
+    # Undoes `connect`
+    def disconnect(self):
+        self.connected_region.entrances.remove(self)
+        self.connected_region = None
+        self.target = None
+        self.addresses = None
+        self.vanilla = None
+
     def __str__(self):
         return str(self.__unicode__())
 
@@ -757,12 +819,17 @@ class Dungeon(object):
         return '%s' % self.name
 
 
+# The default `always_allow` of a Location, no item is always allowed
+def never_allow(item, state):
+    return False
+
+
 '''
 Location object:
 Information about the location where an item can be or is placed.
 
-!!! Type of Location is only used in Rom.py to differentiate
-between handling of certain Locations.
+!!! Type of Location is only used to pick the ROM `writer`
+(LocationWriters.py) for certain Locations.
 
 * `.default` is only used at the bottom of Rom.py. unclear
 '''
@@ -786,14 +853,17 @@ class Location(object):
         self.recursion_count = 0 # Used to stop infinite loops when calling `can_reach`
         self.staleness_count = 0 # !!! NEVER USED
         self.event = False      # Is this Location an event
+        self.writer = None      # Function patching the placed item into the ROM (see LocationWriters.py)
         # Function that takes an item and a state and determines
         # if the item can (always) be filled into this Location.
-        self.always_allow = lambda item, state: False
+        self.always_allow = never_allow
         # Function that takes a state and determines if the Location is reachable
         self.access_rule = lambda state: True
+        self.rule = TRUE        # `access_rule` as a RuleNodes tree, both set by `Rules.set_rule`
         # Function that takes an item and determines if the item
         # can be filled into this Location
         self.item_rule = lambda item: True
+        self.item_rule_node = TRUE # `item_rule` as a RuleNodes tree, both set by `Rules.forbid_item`
 
     '''
     Takes a state and item and checks if the item can be filled into this Location.
@@ -805,11 +875,13 @@ class Location(object):
 
     * Check_access can be set to False to ignore the `self.can_reach` rule
       This is done when `has_beaten_game` is True and `beatable_only` is set.
+    * `reachable` can be given when the access check is already known
+      (see `World.requirements`), it's used instead of `self.can_reach`.
     '''
-    def can_fill(self, state, item, check_access=True):
+    def can_fill(self, state, item, check_access=True, reachable=None):
         return self.always_allow(item, self) or (self.parent_region.can_fill(item)
                     and self.item_rule(item)
-                    and (not check_access or self.can_reach(state))
+                    and (not check_access or (reachable if reachable is not None else self.can_reach(state)))
                    )
 
     # Like `can_fill`, but only checks `self.item_rule`
@@ -949,33 +1021,39 @@ class Spoiler(object):
                          'completeable': not self.world.check_beatable_only,
                          'dungeonitems': self.world.place_dungeon_items}
 
+    # Renders the spoiler log as text.
+    def to_string(self):
+        self.parse_data()
+        outfile = io.StringIO()
+        outfile.write('MM Randomizer Version %s  -  Seed: %s\n\n' % (self.metadata['version'], self.metadata['seed']))
+        # TODO: needs to be updated for MM
+        outfile.write('Rainbow Bridge Requirement:      %s\n' % self.metadata['bridge'])
+        outfile.write('Open Forest:                     %s\n' % ('Yes' if self.metadata['forest'] else 'No'))
+        outfile.write('Open Door of Time:               %s\n' % ('Yes' if self.metadata['door'] else 'No'))
+        outfile.write('All Locations Accessible:        %s\n' % ('Yes' if self.metadata['completeable'] else 'No, some locations may be unreachable'))
+        outfile.write('Maps and Compasses in Dungeons:  %s\n' % ('Yes' if self.metadata['dungeonitems'] else 'No'))
+        outfile.write('\n\nEntrances:\n\n')
+        outfile.write('\n'.join(['%s %s %s' % (entry['entrance'], '<=>' if entry['direction'] == 'both' else '<=' if entry['direction'] == 'exit' else '=>', entry['exit']) for entry in self.entrances]))
+        outfile.write('\n\nLocations:\n\n')
+        outfile.write('\n'.join(['%s: %s' % (location, item) for (location, item) in self.locations['other locations'].items()]))
+        outfile.write('\n\nPlaythrough:\n\n')
+        outfile.write('\n'.join(['%s: {\n%s\n}' % (sphere_nr, '\n'.join(['  %s: %s' % (location, item) for (location, item) in sphere.items()])) for (sphere_nr, sphere) in self.playthrough.items()]))
+        outfile.write('\n\nPaths:\n\n')
+
+        path_listings = []
+        for location, path in sorted(self.paths.items()):
+            path_lines = []
+            for region, exit in path:
+                if exit is not None:
+                    path_lines.append("{} -> {}".format(region, exit))
+                else:
+                    path_lines.append(region)
+            path_listings.append("{}\n        {}".format(location, "\n   =>   ".join(path_lines)))
+
+        outfile.write('\n'.join(path_listings))
+        return outfile.getvalue()
+
     # Prints the spoiler log to a file.
     def to_file(self, filename):
-        self.parse_data()
         with open(filename, 'w') as outfile:
-            outfile.write('MM Randomizer Version %s  -  Seed: %s\n\n' % (self.metadata['version'], self.metadata['seed']))
-            # TODO: needs to be updated for MM
-            outfile.write('Rainbow Bridge Requirement:      %s\n' % self.metadata['bridge'])
-            outfile.write('Open Forest:                     %s\n' % ('Yes' if self.metadata['forest'] else 'No'))
-            outfile.write('Open Door of Time:               %s\n' % ('Yes' if self.metadata['door'] else 'No'))
-            outfile.write('All Locations Accessible:        %s\n' % ('Yes' if self.metadata['completeable'] else 'No, some locations may be unreachable'))
-            outfile.write('Maps and Compasses in Dungeons:  %s\n' % ('Yes' if self.metadata['dungeonitems'] else 'No'))
-            outfile.write('\n\nEntrances:\n\n')
-            outfile.write('\n'.join(['%s %s %s' % (entry['entrance'], '<=>' if entry['direction'] == 'both' else '<=' if entry['direction'] == 'exit' else '=>', entry['exit']) for entry in self.entrances]))
-            outfile.write('\n\nLocations:\n\n')
-            outfile.write('\n'.join(['%s: %s' % (location, item) for (location, item) in self.locations['other locations'].items()]))
-            outfile.write('\n\nPlaythrough:\n\n')
-            outfile.write('\n'.join(['%s: {\n%s\n}' % (sphere_nr, '\n'.join(['  %s: %s' % (location, item) for (location, item) in sphere.items()])) for (sphere_nr, sphere) in self.playthrough.items()]))
-            outfile.write('\n\nPaths:\n\n')
-
-            path_listings = []
-            for location, path in sorted(self.paths.items()):
-                path_lines = []
-                for region, exit in path:
-                    if exit is not None:
-                        path_lines.append("{} -> {}".format(region, exit))
-                    else:
-                        path_lines.append(region)
-                path_listings.append("{}\n        {}".format(location, "\n   =>   ".join(path_lines)))
-
-            outfile.write('\n'.join(path_listings))
+            outfile.write(self.to_string())
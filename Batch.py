@@ -0,0 +1,204 @@
+import logging
+import multiprocessing
+import queue
+import random
+import traceback
+
+from Main import main
+from OutputWriter import OutputWriter
+
+'''
+Batch generation:
+Generates `--count` seeds with the same settings, either one after the
+other in this process or spread over a pool of `--workers` processes.
+
+- The seeds of a batch are all derived up front from the first seed, so
+  a batch produces the same seeds whatever the number of workers and
+  whatever order they finish in.
+- A seed that fails is logged and reported at the end, the rest of the
+  batch keeps going.
+'''
+
+MAX_SEED = 999999999
+
+
+# Returns the `count` seeds of a batch. The first one is `seed` (random
+# if None), the others are drawn from a generator seeded with it.
+def derive_seeds(seed, count):
+    if seed is None:
+        seed = random.SystemRandom().randint(0, MAX_SEED)
+    rng = random.Random(seed)
+    return [seed] + [rng.randint(0, MAX_SEED) for _ in range(count - 1)]
+
+
+'''
+BatchResult object:
+Collects the outcome of every seed of a batch.
+
+`succeeded` -> seeds generated successfully, in the order they finished
+`failed` -> (seed, error message) pairs, in the order they finished
+`cancelled` -> True if the batch was cancelled before every seed was generated
+'''
+class BatchResult(object):
+
+    def __init__(self, total):
+        self.total = total
+        self.succeeded = []
+        self.failed = []
+        self.cancelled = False
+
+    def add(self, seed, error):
+        if error is None:
+            self.succeeded.append(seed)
+        else:
+            self.failed.append((seed, error))
+
+    @property
+    def success(self):
+        return not self.failed and not self.cancelled
+
+    def log_summary(self):
+        logger = logging.getLogger('')
+        logger.info('Batch %s: %d of %d seeds generated, %d failed.', 'cancelled' if self.cancelled else 'finished', len(self.succeeded), self.total, len(self.failed))
+        for seed, error in sorted(self.failed):
+            logger.error('Seed %s failed: %s', seed, error)
+
+
+# Generates every seed of the batch described by `args` and returns a BatchResult.
+# `workers` -> number of worker processes; None generates in this process
+# `on_result` -> optional callback(seed, error) called as each seed finishes
+# `on_progress` -> optional callback(event) called with the progress events of every seed (see Progress.py)
+# `cancel` -> optional threading.Event; once set no more seeds are started
+#             and, with `workers`, the seeds being generated are stopped
+# The callbacks are called on the thread running `generate_batch`.
+def generate_batch(args, workers=None, on_result=None, on_progress=None, cancel=None):
+    if workers is not None and workers < 1:
+        raise RuntimeError('A batch needs at least one worker, not %d.' % workers)
+    seeds = derive_seeds(args.seed, args.count)
+    result = BatchResult(len(seeds))
+
+    # load the base rom once and let every seed patch a private view of it
+    base_rom = None
+    if not args.suppress_rom:
+        from Rom import SharedBaseRom
+        base_rom = SharedBaseRom(args.rom)
+    try:
+        if workers is None:
+            outcomes = _generate_sequential(args, seeds, base_rom, on_progress, cancel)
+        else:
+            outcomes = _generate_parallel(args, seeds, base_rom, workers, on_progress, cancel)
+        for seed, error in outcomes:
+            result.add(seed, error)
+            if on_result is not None:
+                on_result(seed, error)
+    finally:
+        if base_rom is not None:
+            base_rom.close()
+
+    result.cancelled = cancel is not None and cancel.is_set()
+    result.log_summary()
+    return result
+
+
+def _generate_sequential(args, seeds, base_rom, on_progress, cancel):
+    # write each finished seed in the background while the next one generates.
+    # A seed is done once its output is written, a write that fails fails its seed.
+    errors = {}
+    with OutputWriter() as output:
+        for seed in seeds:
+            if cancel is not None and cancel.is_set():
+                break
+            output.begin(seed)
+            try:
+                main(seed=seed, args=args, base_rom=base_rom, output=output, progress=on_progress)
+            except Exception as e:
+                logging.getLogger('').exception('Seed %s failed.', seed)
+                errors[seed] = str(e)
+            finally:
+                output.end()
+            for outcome in _written(output.finished(), errors):
+                yield outcome
+        output.flush()
+        for outcome in _written(output.finished(), errors):
+            yield outcome
+
+# The outcome of the seeds whose output is written, a generation error comes first
+def _written(finished, errors):
+    for seed, write_error in finished:
+        error = errors.pop(seed, None)
+        if error is None and write_error is not None:
+            error = 'Writing the output failed: %s' % write_error
+        yield seed, error
+
+
+def _generate_parallel(args, seeds, base_rom, workers, on_progress, cancel):
+    loglevel = logging.getLogger('').getEffectiveLevel()
+    progress_queue = multiprocessing.Queue() if on_progress is not None else None
+    pool = multiprocessing.Pool(min(workers, len(seeds)), _init_worker, (args, base_rom, loglevel, progress_queue))
+
+    def report_progress():
+        while progress_queue is not None:
+            try:
+                event = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            on_progress(event)
+
+    try:
+        outcomes = pool.imap_unordered(_generate_seed, seeds)
+        for _ in seeds:
+            # wake up regularly to pass on progress and to notice a cancel
+            while True:
+                if cancel is not None and cancel.is_set():
+                    pool.terminate()
+                    return
+                try:
+                    outcome = outcomes.next(timeout=0.1)
+                except multiprocessing.TimeoutError:
+                    report_progress()
+                else:
+                    break
+            report_progress()
+            yield outcome
+        pool.close()
+        # the workers flush their last events when they exit
+        pool.join()
+        report_progress()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+
+# per worker process state, set up by `_init_worker`
+_worker_args = None
+_worker_base_rom = None
+_worker_progress = None
+
+def _init_worker(args, base_rom, loglevel, progress_queue):
+    global _worker_args, _worker_base_rom, _worker_progress
+    _worker_args = args
+    _worker_base_rom = base_rom
+
+    # tag every line with the worker it came from
+    logger = logging.getLogger('')
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logging.basicConfig(format='[%(processName)s] %(message)s', level=loglevel)
+
+    if progress_queue is not None:
+        _worker_progress = progress_queue.put
+
+    if args.compress_rom and not args.suppress_rom:
+        # pool workers are daemonic and can't start a compression pool of their own
+        from RomCompress import get_compressor
+        get_compressor(workers=1, cache_dir=args.cache_dir)
+
+def _generate_seed(seed):
+    try:
+        main(seed=seed, args=_worker_args, base_rom=_worker_base_rom, progress=_worker_progress)
+    except Exception as e:
+        logging.getLogger('').error('Seed %s failed.\n%s', seed, traceback.format_exc())
+        return seed, str(e)
+    return seed, None
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+import argparse
+from collections import OrderedDict
+from itertools import product
+import json
+import logging
+import multiprocessing
+import os
+import platform
+from queue import Empty
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None # not available on Windows, peak memory is not reported there
+
+from Batch import derive_seeds
+from Main import main, __version__
+from MMRandomizer import get_parser
+from SyntheticRom import write_synthetic_rom
+from TimingReport import load_timing_records, summarize
+from Utils import output_path
+
+'''
+Benchmark:
+Generates a fixed set of seeds for every combination of the settings
+MMRandomizer exposes (with --suppress_rom, or with `--patch` against a
+synthetic base rom, see SyntheticRom.py) and reports, per combination:
+
+- seeds/sec over the whole set, the first seed building the world included
+- p50/p95/max of the wall and CPU time of every stage (see TimingReport.py)
+- the peak memory of the process that generated it
+
+Every combination runs in a fresh process, so each starts cold and its
+peak memory is its own. `--save` stores the results as a baseline and
+`--baseline` compares against one: a combination whose throughput drops,
+or whose stage p50 or peak memory grows, by more than `--threshold` is
+reported as a regression and the benchmark exits with 1.
+
+It also times importing the command line entry points in a fresh
+interpreter. A headless run must not import the GUI, the ROM layer or
+the optional diagnostics; any of FORBIDDEN_IMPORTS showing up, or an
+import getting slower by more than `--import_threshold` (import times
+are noisy, so it's looser), is a regression too.
+'''
+
+FLAGS = ['open_forest', 'open_door_of_time', 'nodungeonitems', 'beatableonly', 'hints']
+
+# stages faster than this are too noisy to compare against a baseline
+MIN_STAGE_SECONDS = 0.005
+
+# the modules whose import time is checked, and what they must not pull in
+IMPORT_TARGETS = ['MMRandomizer', 'Main']
+FORBIDDEN_IMPORTS = ['tkinter', 'urllib.request', 'Gui', 'Rom', 'Hints', 'HintList', 'RomCompress', 'Batch', 'multiprocessing', 'pickle', 'cProfile', 'tracemalloc']
+IMPORT_REPEAT = 10
+
+# how often the benchmark checks that the process of a combination is still alive
+POLL_SECONDS = 1.0
+
+_import_script = '''\
+import sys, time
+start = time.perf_counter()
+import %s
+seconds = time.perf_counter() - start
+import json
+print(json.dumps([seconds, sorted(sys.modules)]))
+'''
+
+
+# Returns the values each setting of the matrix takes
+def settings_matrix(vary=None):
+    parser = get_parser()
+    bridge = next(action for action in parser._actions if action.dest == 'bridge') # pylint: disable=protected-access
+    axes = OrderedDict([('bridge', list(bridge.choices))])
+    axes.update((flag, [False, True]) for flag in FLAGS)
+    for name in axes:
+        if vary is not None and name not in vary:
+            axes[name] = [parser.get_default(name)]
+    return axes
+
+# Returns every combination of the matrix as a settings dict
+def combinations(axes):
+    return [OrderedDict(zip(axes, values)) for values in product(*axes.values())]
+
+def settings_name(settings):
+    return ','.join('%s=%s' % (name, value if not isinstance(value, bool) else int(value)) for name, value in settings.items())
+
+
+def peak_memory():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes everywhere but on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+# Generates `seeds` with `settings` and returns the result of the combination.
+# With a `rom` the seeds are patched and written (next to `report_path`).
+def run_combination(settings, seeds, report_path, rom=None, compress_rom=False):
+    args = get_parser().parse_args([])
+    for name, value in settings.items():
+        setattr(args, name, value)
+    args.suppress_rom = rom is None
+    args.rom = rom
+    args.compress_rom = compress_rom
+    args.timing_report = report_path
+    output_path.cached_path = os.path.dirname(report_path)
+
+    failed = []
+    start = time.perf_counter()
+    for seed in seeds:
+        try:
+            main(seed=seed, args=args)
+        except Exception as e:
+            failed.append((seed, str(e)))
+    wall = time.perf_counter() - start
+
+    records = load_timing_records(report_path) if os.path.exists(report_path) else []
+    summary = summarize(records)
+    result = OrderedDict()
+    result['seeds'] = len(seeds)
+    result['failed'] = failed
+    result['wall'] = wall
+    result['seeds_per_second'] = len(records) / wall if records else 0.0
+    result['peak_memory'] = peak_memory()
+    result['total'] = summary.get('total')
+    result['stages'] = summary['stages']
+    return result
+
+# The result of a combination whose process died before reporting
+def crashed_result(seeds, exitcode):
+    result = OrderedDict()
+    result['seeds'] = len(seeds)
+    result['failed'] = [(seed, 'benchmark process exited with code %s' % exitcode) for seed in seeds]
+    result['wall'] = None
+    result['seeds_per_second'] = 0.0
+    result['peak_memory'] = None
+    result['total'] = None
+    result['stages'] = OrderedDict()
+    return result
+
+def _run_in_process(settings, seeds, report_path, rom, compress_rom, results):
+    # keep the output of the seeds out of the benchmark's
+    logging.getLogger('').setLevel(logging.ERROR)
+    results.put(run_combination(settings, seeds, report_path, rom, compress_rom))
+
+
+# Runs every combination in its own process and returns the results by settings name.
+# `patch` -> also patch and write every seed, using a synthetic base rom
+def run_benchmark(axes, seeds, patch=False, compress_rom=False):
+    results = OrderedDict()
+    report_dir = tempfile.mkdtemp(prefix='benchmark')
+    try:
+        rom = None
+        if patch:
+            rom = os.path.join(report_dir, 'synthetic.z64')
+            write_synthetic_rom(rom)
+        for index, settings in enumerate(combinations(axes)):
+            name = settings_name(settings)
+            queue = multiprocessing.Queue()
+            process = multiprocessing.Process(target=_run_in_process, args=(settings, seeds, os.path.join(report_dir, '%d.jsonl' % index), rom, compress_rom, queue))
+            process.start()
+            result = None
+            while result is None:
+                try:
+                    result = queue.get(timeout=POLL_SECONDS)
+                except Empty:
+                    if process.exitcode is not None:
+                        break
+            process.join()
+            if result is None:
+                logging.getLogger('').error('%s: the benchmark process died with exit code %s.', name, process.exitcode)
+                result = crashed_result(seeds, process.exitcode)
+            results[name] = result
+            logging.getLogger('').info('%s: %.2f seeds/sec, %d failed', name, result['seeds_per_second'], len(result['failed']))
+    finally:
+        shutil.rmtree(report_dir, ignore_errors=True)
+    return results
+
+
+# Imports `module` in a fresh interpreter (the best of IMPORT_REPEAT runs) and
+# returns how long it took, how many modules it loaded and which forbidden ones
+def import_profile(module):
+    times = []
+    for _ in range(IMPORT_REPEAT):
+        output = subprocess.check_output([sys.executable, '-c', _import_script % module], cwd=os.path.dirname(os.path.abspath(__file__)))
+        seconds, modules = json.loads(output.decode('utf-8'))
+        times.append(seconds)
+    return OrderedDict([('seconds', min(times)), ('modules', len(modules)), ('forbidden', [name for name in FORBIDDEN_IMPORTS if name in modules])])
+
+def run_import_benchmark():
+    return OrderedDict((module, import_profile(module)) for module in IMPORT_TARGETS)
+
+
+def environment():
+    return OrderedDict([('version', __version__), ('python', platform.python_version()), ('platform', platform.platform())])
+
+
+# Returns a description of every regression of `results` against `baseline`
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if base['seeds_per_second'] and result['seeds_per_second'] < base['seeds_per_second'] * (1 - threshold):
+            regressions.append('%s: %.2f seeds/sec, baseline %.2f' % (name, result['seeds_per_second'], base['seeds_per_second']))
+        if base['peak_memory'] and result['peak_memory'] and result['peak_memory'] > base['peak_memory'] * (1 + threshold):
+            regressions.append('%s: peak memory %.1f MB, baseline %.1f MB' % (name, result['peak_memory'] / 2**20, base['peak_memory'] / 2**20))
+        for stage, timing in result['stages'].items():
+            base_timing = base['stages'].get(stage)
+            if base_timing is None:
+                continue
+            now, before = timing['wall']['p50'], base_timing['wall']['p50']
+            if max(now, before) >= MIN_STAGE_SECONDS and now > before * (1 + threshold):
+                regressions.append('%s: stage %s p50 %.4fs, baseline %.4fs' % (name, stage, now, before))
+    return regressions
+
+
+# Returns a description of every import regression of `imports` against `baseline` (may be None)
+def compare_imports(imports, baseline, threshold):
+    regressions = []
+    for module, result in imports.items():
+        if result['forbidden']:
+            regressions.append('import %s loads %s' % (module, ', '.join(result['forbidden'])))
+        base = (baseline or {}).get(module)
+        if base is None:
+            continue
+        now, before = result['seconds'], base['seconds']
+        if max(now, before) >= MIN_STAGE_SECONDS and now > before * (1 + threshold):
+            regressions.append('import %s %.4fs, baseline %.4fs' % (module, now, before))
+    return regressions
+
+
+def format_imports(imports):
+    return '\n'.join('import %-20s %8.4fs, %d modules' % (module, result['seconds'], result['modules']) for module, result in imports.items())
+
+def format_results(results):
+    lines = []
+    for name, result in results.items():
+        memory = '%.1f MB' % (result['peak_memory'] / 2**20) if result['peak_memory'] else 'n/a'
+        lines.append('%s\n  %.2f seeds/sec, %d of %d failed, peak memory %s' % (name, result['seeds_per_second'], len(result['failed']), result['seeds'], memory))
+        for stage, timing in result['stages'].items():
+            lines.append('  %-22s wall p50 %8.4f p95 %8.4f  cpu p50 %8.4f p95 %8.4f' % (stage, timing['wall']['p50'], timing['wall']['p95'], timing['cpu']['p50'], timing['cpu']['p95']))
+    return '\n'.join(lines)
+
+
+def start():
+    parser = argparse.ArgumentParser(description='Benchmark seed generation across the settings matrix.')
+    parser.add_argument('--seed', default=1, type=int, help='Seed the fixed seed set is derived from. (default: %(default)s)')
+    parser.add_argument('--seeds', default=10, type=int, help='Number of seeds per combination of settings. (default: %(default)s)')
+    parser.add_argument('--vary', action='append', choices=['bridge'] + FLAGS, help='Setting to vary, may be repeated. (default: all of them)')
+    parser.add_argument('--patch', action='store_true', help='Also patch and write the rom of every seed, using a synthetic base rom.')
+    parser.add_argument('--compress_rom', action='store_true', help='With --patch, also compress the roms.')
+    parser.add_argument('--save', help='Write the results as JSON to this file, to be used as a --baseline later.')
+    parser.add_argument('--baseline', help='Compare the results against this baseline file.')
+    parser.add_argument('--threshold', default=0.1, type=float, help='Relative change counted as a regression. (default: %(default)s)')
+    parser.add_argument('--import_threshold', default=0.5, type=float, help='Relative change of an import time counted as a regression. (default: %(default)s)')
+    parser.add_argument('--imports_only', action='store_true', help='Only check the import times, don\'t generate any seeds.')
+    parser.add_argument('--loglevel', default='info', choices=['error', 'info', 'warning', 'debug'], help='Select level of logging for output.')
+    args = parser.parse_args()
+
+    loglevel = {'error': logging.ERROR, 'info': logging.INFO, 'warning': logging.WARNING, 'debug': logging.DEBUG}[args.loglevel]
+    logging.basicConfig(format='%(message)s', level=loglevel)
+
+    imports = run_import_benchmark()
+    print(format_imports(imports))
+
+    seeds = derive_seeds(args.seed, args.seeds)
+    results = OrderedDict()
+    if not args.imports_only:
+        results = run_benchmark(settings_matrix(args.vary), seeds, args.patch, args.compress_rom)
+        print(format_results(results))
+
+    report = OrderedDict([('environment', environment()), ('seeds', seeds), ('imports', imports), ('results', results)])
+    if args.save is not None:
+        with open(args.save, 'w') as outfile:
+            json.dump(report, outfile, indent=2)
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as infile:
+            baseline = json.load(infile)
+        if baseline['seeds'] != seeds and not args.imports_only:
+            logging.getLogger('').warning('The baseline was run with different seeds, the comparison may not be meaningful.')
+
+    # forbidden imports are regressions even without a baseline
+    regressions = compare_imports(imports, baseline.get('imports') if baseline is not None else None, args.import_threshold)
+    if baseline is not None:
+        regressions.extend(compare(results, baseline['results'], args.threshold))
+    for regression in regressions:
+        print('REGRESSION %s' % regression)
+    if regressions:
+        sys.exit(1)
+    if baseline is not None:
+        print('No regressions above %d%% against %s.' % (args.threshold * 100, args.baseline))
+
+if __name__ == '__main__':
+    start()
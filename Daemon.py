@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import logging
+import os
+import socketserver
+import sys
+import threading
+import time
+
+from Main import main
+from MMRandomizer import get_parser
+
+'''
+Generation daemon:
+Generates seeds on request, one JSON object per line, read from stdin
+or from clients of a local Unix socket. The process stays up between
+requests, so the modules, the worlds of every settings combination
+already used and the base ROMs are all kept warm.
+
+Request:   {"id": 1, "seed": 12345, "settings": {"create_spoiler": true}}
+  `id` is optional and copied to the response, `seed` is optional (random
+  if missing) and `settings` takes the randomizer options of the command
+  line by name (see REQUEST_SETTINGS and `python MMRandomizer.py -h`),
+  anything missing uses the daemon's own.
+Response:  {"id": 1, "ok": true, "seed": 12345, "total": 1.93,
+            "timings": {"world": 0.0012, "entrances": 0.0001, ...}}
+  or       {"id": 1, "ok": false, "error": "..."}
+With `"progress": true` in the request, every progress event of the seed
+(see Progress.py) is sent first as its own line: {"id": 1, "progress": {...}}
+
+Every socket client is served on its own thread, so a client that keeps
+its connection open doesn't hold up the others, but seeds are generated
+one at a time: the generator uses the global `random` module and shares
+its warm worlds, so generating holds `GenerationDaemon.lock`.
+'''
+
+# the options a request may set, the randomizer settings. Paths, the caches
+# and diagnostics (--rom, --cache_dir, --rule_profile, ...) are only set by
+# the daemon's own command line, a request setting any other option fails.
+REQUEST_SETTINGS = frozenset(['create_spoiler', 'bridge', 'open_forest', 'open_door_of_time', 'nodungeonitems',
+                              'beatableonly', 'hints', 'suppress_rom', 'fast_reachability'])
+
+
+class GenerationDaemon(object):
+
+    def __init__(self, defaults):
+        self.defaults = defaults
+        self.base_roms = {}
+        self.lock = threading.Lock()
+        # the command line options by name, to check the settings of requests
+        self.actions = dict((action.dest, action) for action in get_parser()._actions)
+
+    # Returns the shared base rom for `path`, loading it on first use
+    def get_base_rom(self, path):
+        path = os.path.realpath(path)
+        base_rom = self.base_roms.get(path)
+        if base_rom is None:
+            if not os.path.isfile(path):
+                raise RuntimeError('Could not find base rom %s.' % path)
+            from Rom import SharedBaseRom
+            base_rom = self.base_roms[path] = SharedBaseRom(path)
+        return base_rom
+
+    # Builds the settings of a request on top of the defaults
+    def get_args(self, settings):
+        args = argparse.Namespace(**vars(self.defaults))
+        for name, value in settings.items():
+            if not hasattr(args, name) or name not in self.actions:
+                raise RuntimeError('Unknown setting %s.' % name)
+            if name not in REQUEST_SETTINGS:
+                raise RuntimeError('Setting %s can not be used in a request.' % name)
+            setattr(args, name, self.parse_setting(self.actions[name], value))
+        args.count = None
+        return args
+
+    # Checks the value of a setting like the command line parser would, returns the parsed value
+    @staticmethod
+    def parse_setting(action, value):
+        if action.nargs == 0:
+            # a flag
+            if not isinstance(value, bool):
+                raise RuntimeError('Setting %s must be true or false.' % action.dest)
+            return value
+        if action.type is not None and not isinstance(value, bool):
+            try:
+                # as given on the command line, so 1.5 isn't taken for 1
+                value = action.type(value if isinstance(value, str) else str(value))
+            except (ValueError, TypeError, argparse.ArgumentTypeError):
+                raise RuntimeError('Invalid value %r for setting %s.' % (value, action.dest))
+        elif not isinstance(value, str):
+            raise RuntimeError('Setting %s must be a string.' % action.dest)
+        if action.choices is not None and value not in action.choices:
+            raise RuntimeError('Invalid value %r for setting %s, must be one of %s.' % (value, action.dest, ', '.join(action.choices)))
+        return value
+
+    # Generates the seed described by `request` and returns the response.
+    # Progress events go to `send` as response lines, if the request asks for them.
+    def handle(self, request, send=None):
+        settings = request.get('settings', {})
+        if not isinstance(settings, dict):
+            raise RuntimeError('Settings must be a JSON object.')
+        args = self.get_args(settings)
+        args.seed = request.get('seed')
+        if args.seed is not None and (isinstance(args.seed, bool) or not isinstance(args.seed, int)):
+            raise RuntimeError('Seed must be a number.')
+
+        progress = None
+        if request.get('progress') and send is not None:
+            progress = lambda event: send(json.dumps({'id': request.get('id'), 'progress': event}))
+
+        with self.lock:
+            base_rom = None if args.suppress_rom else self.get_base_rom(args.rom)
+            start = time.perf_counter()
+            world = main(seed=args.seed, args=args, base_rom=base_rom, progress=progress)
+            total = time.perf_counter() - start
+
+            # the world is reset by the next request, read it while holding the lock
+            response = {'ok': True,
+                        'seed': world.seed,
+                        'total': total,
+                        'timings': world.timings}
+            if world.reach_stats:
+                response['reach_stats'] = world.reach_stats
+        return response
+
+    # Takes one request line and returns the response line, never raises
+    def handle_line(self, line, send=None):
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RuntimeError('Requests must be JSON objects.')
+            request_id = request.get('id')
+            response = self.handle(request, send)
+        except Exception as e:
+            logging.getLogger('').exception('Request %s failed.', request_id)
+            response = {'ok': False, 'error': str(e)}
+        response['id'] = request_id
+        return json.dumps(response)
+
+    def serve_stdin(self):
+        def send(response):
+            sys.stdout.write(response + '\n')
+            sys.stdout.flush()
+        for line in sys.stdin:
+            if line.strip():
+                send(self.handle_line(line, send))
+
+    def serve_socket(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+        server = _DaemonServer(path, self)
+        try:
+            logging.getLogger('').info('Listening on %s', path)
+            server.serve_forever()
+        finally:
+            server.server_close()
+            os.remove(path)
+
+    def close(self):
+        for base_rom in self.base_roms.values():
+            base_rom.close()
+        self.base_roms = {}
+
+
+# one thread per client, see `GenerationDaemon.lock`
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+
+    daemon_threads = True
+
+    def __init__(self, path, daemon):
+        self.daemon = daemon
+        socketserver.UnixStreamServer.__init__(self, path, _RequestHandler)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def send(self, response):
+        self.wfile.write((response + '\n').encode('utf-8'))
+        self.wfile.flush()
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.send(self.server.daemon.handle_line(line.decode('utf-8'), self.send))
+
+
+def start():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--socket', help='Serve requests on this Unix socket instead of stdin/stdout.')
+    parser.add_argument('--rom', help='Default base rom, loaded on startup.')
+    parser.add_argument('--cache_dir', help='Default result cache directory, repeated requests are served from it.')
+    parser.add_argument('--timing_report', help='Append the timing record of every request to this file.')
+    parser.add_argument('--loglevel', default='info', const='info', nargs='?', choices=['error', 'info', 'warning', 'debug'], help='Select level of logging for output.')
+    args = parser.parse_args()
+
+    # logs go to stderr, stdout only carries responses
+    loglevel = {'error': logging.ERROR, 'info': logging.INFO, 'warning': logging.WARNING, 'debug': logging.DEBUG}[args.loglevel]
+    logging.basicConfig(format='%(message)s', level=loglevel, stream=sys.stderr)
+
+    defaults = get_parser().parse_args([])
+    if args.rom is not None:
+        defaults.rom = args.rom
+    defaults.cache_dir = args.cache_dir
+    defaults.timing_report = args.timing_report
+
+    daemon = GenerationDaemon(defaults)
+    try:
+        if os.path.isfile(defaults.rom):
+            daemon.get_base_rom(defaults.rom)
+        if args.socket is not None:
+            daemon.serve_socket(args.socket)
+        else:
+            daemon.serve_stdin()
+    finally:
+        daemon.close()
+
+if __name__ == '__main__':
+    start()
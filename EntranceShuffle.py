@@ -1,6 +1,7 @@
 import random
 
-def link_entrances(world):
+# sets up the connections that are the same for every seed
+def link_fixed_entrances(world):
 
     # setup mandatory connections
     for exitname, regionname in mandatory_connections:
@@ -12,6 +13,13 @@ def link_entrances(world):
             connect_simple(world, exitname, regionname)
         for exitname, regionname in default_dungeon_connections:
             connect_simple(world, exitname, regionname)
+    else:
+        raise NotImplementedError('Shuffling not supported yet')
+
+
+# sets up the connections picked by the seed, they are listed in `world.shuffled_entrances`
+def shuffle_entrances(world):
+    if world.shuffle == 'vanilla':
         targets = list(Fairy_List)
         destinations = list(Fairy_List)
         random.shuffle(targets)
@@ -87,6 +95,7 @@ def connect_fairy(world, entrancename, exitname):
     exit = world.get_region(exitname)
 
     entrance.connect(exit, Fairy_addresses[entrance.name], Fairy_IDs[exit.name])
+    world.shuffled_entrances.append(entrance)
     world.spoiler.set_entrance(entrance.name, exit.name, 'both')
 
 # these are connections that cannot be shuffled and always exist.
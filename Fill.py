@@ -12,6 +12,7 @@ def fill_restrictive(world, base_state, locations, itempool):
         new_state.sweep_for_events()
         return new_state
 
+    placed = 0
     while itempool and locations:
         item_to_place = itempool.pop()
         maximum_exploration_state = sweep_from_pool()
@@ -21,9 +22,15 @@ def fill_restrictive(world, base_state, locations, itempool):
             perform_access_check = not world.has_beaten_game(maximum_exploration_state)
 
 
+        # with `world.requirements` most locations are checked against the inventory alone
+        inventory = None
+        if perform_access_check and world.requirements is not None:
+            inventory = world.requirements.inventory(maximum_exploration_state)
+
         spot_to_fill = None
         for location in locations:
-            if location.can_fill(maximum_exploration_state, item_to_place, perform_access_check):
+            reachable = world.requirements.can_reach(location, inventory) if inventory is not None else None
+            if location.can_fill(maximum_exploration_state, item_to_place, perform_access_check, reachable):
                 spot_to_fill = location
                 break
 
@@ -38,6 +45,8 @@ def fill_restrictive(world, base_state, locations, itempool):
         world.push_item(spot_to_fill, item_to_place, False)
         locations.remove(spot_to_fill)
         spot_to_fill.event = True
+        placed += 1
+        world.progress.emit('fill', fill='restrictive', placed=placed, remaining=len(itempool))
 
 
 def distribute_items_restrictive(world, fill_locations=None):
@@ -69,10 +78,13 @@ def distribute_items_restrictive(world, fill_locations=None):
 
 
 def fast_fill(world, item_pool, fill_locations):
+    placed = 0
     while item_pool and fill_locations:
         spot_to_fill = fill_locations.pop()
         item_to_place = item_pool.pop()
         world.push_item(spot_to_fill, item_to_place, False)
+        placed += 1
+        world.progress.emit('fill', fill='fast', placed=placed, remaining=len(item_pool))
 
 def fill_restrictive_fast(world, base_state, locations, itempool):
     def sweep_from_pool():
@@ -82,6 +94,7 @@ def fill_restrictive_fast(world, base_state, locations, itempool):
         new_state.sweep_for_events()
         return new_state
 
+    placed = 0
     while itempool and locations:
         item_to_place = itempool.pop()
 
@@ -100,4 +113,6 @@ def fill_restrictive_fast(world, base_state, locations, itempool):
 
         world.push_item(spot_to_fill, item_to_place, False)
         locations.remove(spot_to_fill)
-        spot_to_fill.event = True
\ No newline at end of file
+        spot_to_fill.event = True
+        placed += 1
+        world.progress.emit('fill', fill='restrictive_fast', placed=placed, remaining=len(itempool))
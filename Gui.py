@@ -1,16 +1,19 @@
 #!/usr/bin/env python3
-from argparse import Namespace
 from glob import glob
 import json
-import random
+import multiprocessing
 import os
 import shutil
+import threading
 from tkinter import Checkbutton, OptionMenu, Toplevel, LabelFrame, PhotoImage, Tk, LEFT, RIGHT, BOTTOM, TOP, StringVar, IntVar, Frame, Label, W, E, X, Entry, Spinbox, Button, filedialog, messagebox, ttk
 from urllib.parse import urlparse
 from urllib.request import urlopen
 
-from GuiUtils import ToolTips, set_icon, BackgroundTaskProgress
-from Main import main, __version__ as ESVersion
+from Batch import derive_seeds, generate_batch
+from GuiUtils import ToolTips, set_icon, BatchProgress
+from Main import __version__ as ESVersion
+from MMRandomizer import get_parser
+from Progress import describe_event
 from Utils import is_bundled, local_path, output_path, open_file
 
 
@@ -120,7 +123,8 @@ def guiMain(args=None):
     countSpinbox = Spinbox(bottomFrame, from_=1, to=100, textvariable=countVar)
 
     def generateRom():
-        guiargs = Namespace
+        # the command line defaults, with the settings the window controls
+        guiargs = get_parser().parse_args([])
         guiargs.seed = int(seedVar.get()) if seedVar.get() else None
         guiargs.count = int(countVar.get()) if countVar.get() != '1' else None
         guiargs.bridge = bridgeVar.get()
@@ -133,18 +137,41 @@ def guiMain(args=None):
         guiargs.beatableonly = bool(beatableOnlyVar.get())
         guiargs.hints = bool(hintsVar.get())
         guiargs.rom = romVar.get()
-        try:
-            if guiargs.count is not None:
-                seed = guiargs.seed
-                for _ in range(guiargs.count):
-                    main(seed=seed, args=guiargs)
-                    seed = random.randint(0, 999999999)
+
+        # seeds are generated on worker processes, so the window stays responsive
+        # and several batches can run at the same time
+        seeds = derive_seeds(guiargs.seed, guiargs.count or 1)
+        guiargs.seed = seeds[0]
+        guiargs.count = len(seeds)
+        cancel = threading.Event()
+
+        def finished(task, result, error):
+            task.close_window()
+            if error is not None:
+                messagebox.showerror(title="Error while creating seed", message=error)
+            elif result.cancelled:
+                messagebox.showinfo(title="Cancelled", message="Generated %d of %d seeds before cancelling." % (len(result.succeeded), result.total))
+            elif result.failed:
+                messagebox.showerror(title="Error while creating seed", message="%d of %d seeds failed:\n%s" % (len(result.failed), result.total, '\n'.join('%s: %s' % failure for failure in result.failed)))
+            else:
+                messagebox.showinfo(title="Success", message="Rom patched successfully")
+
+        def report_result(task, seed, error):
+            task.update_seed_status(seed, 'Done' if error is None else 'Failed: %s' % error)
+
+        def run_batch(task):
+            try:
+                result = generate_batch(guiargs, workers=min(len(seeds), os.cpu_count() or 1),
+                                        on_result=lambda seed, error: report_result(task, seed, error),
+                                        on_progress=lambda event: task.update_seed_status(event['seed'], describe_event(event)),
+                                        cancel=cancel)
+            except Exception as e:
+                error = str(e)
+                task.queue_event(lambda: finished(task, None, error))
             else:
-                main(seed=guiargs.seed, args=guiargs)
-        except Exception as e:
-            messagebox.showerror(title="Error while creating seed", message=str(e))
-        else:
-            messagebox.showinfo(title="Success", message="Rom patched successfully")
+                task.queue_event(lambda: finished(task, result, None))
+
+        BatchProgress(mainWindow, run_batch, 'Generating %d seed%s' % (len(seeds), 's' if len(seeds) > 1 else ''), seeds, cancel.set)
 
     generateButton = Button(bottomFrame, text='Generate Patched Rom', command=generateRom)
 
@@ -182,4 +209,6 @@ def guiMain(args=None):
     mainWindow.mainloop()
 
 if __name__ == '__main__':
+    # the seeds are generated on worker processes, which frozen builds have to start this way
+    multiprocessing.freeze_support()
     guiMain()
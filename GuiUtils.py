@@ -45,7 +45,7 @@ class BackgroundTask(object):
             self.window.after(100, self.process_queue)
 
 class BackgroundTaskProgress(BackgroundTask):
-    def __init__(self, parent, code_to_run, title):
+    def __init__(self, parent, code_to_run, title, cancel=None):
         self.parent = parent
         self.window = tk.Toplevel(parent)
         self.window['padx'] = 5
@@ -61,12 +61,26 @@ class BackgroundTaskProgress(BackgroundTask):
         self.label_var.set("")
         self.label = tk.Label(self.window, textvariable=self.label_var, width=50)
         self.label.pack()
+        self.create_widgets()
+        if cancel is not None:
+            # `cancel` is called on the main thread, the task is expected to notice it and finish
+            def cancel_task():
+                self.cancel_button['state'] = tk.DISABLED
+                self.label_var.set("Cancelling...")
+                cancel()
+            self.cancel_button = tk.Button(self.window, text='Cancel', command=cancel_task)
+            self.cancel_button.pack(pady=(5, 0))
+            self.window.protocol("WM_DELETE_WINDOW", cancel_task)
         self.window.resizable(width=False, height=False)
 
         set_icon(self.window)
         self.window.focus()
         super().__init__(self.window, code_to_run)
 
+    # hook for subclasses to add widgets below the status label
+    def create_widgets(self):
+        pass
+
     #safe to call from worker thread
     def update_status(self, text):
         self.queue_event(lambda: self.label_var.set(text))
@@ -76,6 +90,26 @@ class BackgroundTaskProgress(BackgroundTask):
         self.stop()
         self.window.destroy()
 
+# BackgroundTaskProgress with one line of status per seed of a batch
+class BatchProgress(BackgroundTaskProgress):
+    def __init__(self, parent, code_to_run, title, seeds, cancel=None):
+        self.seeds = list(seeds)
+        super().__init__(parent, code_to_run, title, cancel)
+
+    def create_widgets(self):
+        self.seed_list = tk.Listbox(self.window, width=70, height=min(len(self.seeds), 10))
+        for seed in self.seeds:
+            self.seed_list.insert(tk.END, '%s: Waiting' % seed)
+        self.seed_list.pack(pady=(5, 0))
+
+    #safe to call from worker thread
+    def update_seed_status(self, seed, text):
+        def update():
+            index = self.seeds.index(seed)
+            self.seed_list.delete(index)
+            self.seed_list.insert(index, '%s: %s' % (seed, text))
+        self.queue_event(update)
+
 
 
 class ToolTips(object):
@@ -9,24 +9,15 @@ class Hint(object):
         self.type = type
 
 def getHint(string):
-    ret = Hint
-    for hint in hintTable:
-        if string == hint:
-            text, type = hintTable[hint]
-            ret = Hint(hint, text, type)
-            break
-        else:
-            text, type = hintTable['useless']
-            ret = Hint(hint, text, type)
-    return ret
+    try:
+        return hints[string]
+    except KeyError:
+        text, type = hintTable['useless']
+        return Hint(string, text, type)
 
 def getHintGroup(string):
-    ret = []
-    for hint in hintTable:
-        text, type = hintTable[hint]
-        if type == string:
-            ret.append(Hint(hint, text, type))
-    return ret
+    # callers shuffle and extend the group, so hand out a copy
+    return list(hintGroups.get(string, []))
 
 #table of hints, format is (name, hint text, type of hint) there are special characters that are read for certain in game commands:
 # ^ is a box break
@@ -215,3 +206,9 @@ hintTable = {'Hammer':                                                (" the dra
              'Spiritual Stone Text Start':                            ("Ye who owns 3 Spiritual Stones...^", 'boss'),
              'Spiritual Stone Text End':                              ("Stand with the Ocarina of Time&and play the Song of Time.", 'boss'),
              'Medallion Text End':                                    ("Together with the Hero of Time,&the awakened ones will bind the&evil and return the light of peace&to the world.", 'boss')}
+
+# `Hint` objects built once from `hintTable`, by name and grouped by type (in table order)
+hints = {name: Hint(name, text, type) for name, (text, type) in hintTable.items()}
+hintGroups = {}
+for hint in hints.values():
+    hintGroups.setdefault(hint.type, []).append(hint)
@@ -26,46 +26,53 @@ def buildGossipHints(world, rom):
     hintList.extend(alwaysLocations)
     hintList.extend(sometimesLocations)
 
-    locationData = []
-    for hint in  hintList:
-        for locationWorld in world.get_locations():
-            if hint.name == locationWorld.name:
-                locationData.extend([locationWorld])         
+    worldLocations = {location.name: location for location in world.get_locations()}
+    locationData = [worldLocations[hint.name] for hint in hintList if hint.name in worldLocations]
 
-    #hopefully fixes weird VC error where the last character from a previous text box would sometimes spill over into the next box.
-    for address in range(stoneAddresses[0], 0x9399D8):
-        rom.write_byte(address, 0x08)
+    textStart = stoneAddresses[0]
 
     #shuffles the stone addresses for randomization, always locations will be placed first and twice
     random.shuffle(stoneAddresses)
 
-    #loops through shuffled locations and addresses and builds hint.
+    #loops through shuffled locations and addresses and builds hint. Every text is built and checked before anything is written.
+    stoneTexts = []
     while locationData:
         currentLoc = locationData.pop(0)
-        Block_code = getBytes((getHint(currentLoc.name).text))
+        Block_code = getHintBytes(currentLoc.name)
         if currentLoc.item.type == 'Map' or currentLoc.item.type == 'Compass' or currentLoc.item.type == 'BossKey' or currentLoc.item.type == 'SmallKey':
-            Block_code.extend(getBytes((getHint(currentLoc.item.type).text)))
+            Block_code.extend(getHintBytes(currentLoc.item.type))
         else:
-            Block_code.extend(getBytes((getHint(currentLoc.item.name).text)))
+            Block_code.extend(getHintBytes(currentLoc.item.name))
         endText(Block_code)
 
-        if len(Block_code) > 92:
-            print('Too many characters in hint')
+        if not checkTextLength(Block_code, gossipStoneLimit):
+            logging.getLogger('').warning('Too many characters in hint for %s', currentLoc.name)
             Block_code = getBytes("I am Error.")
             Block_code.extend(getBytes(currentLoc.name))
             Block_code.extend(getBytes('&'))
             Block_code.extend(getBytes(currentLoc.item.name))
-     
-        rom.write_bytes(stoneAddresses.pop(0), Block_code)
+            Block_code = Block_code[:gossipStoneLimit - 1]
+            endText(Block_code)
+
+        stoneTexts.append((stoneAddresses.pop(0), Block_code))
 
     junkHints = getHintGroup('junkHint')
     random.shuffle(junkHints)
     while stoneAddresses:
         junkHint = junkHints.pop()
-        Block_code = getBytes(junkHint.text)
+        Block_code = getHintBytes(junkHint.name)
         endText(Block_code)
-        rom.write_bytes(stoneAddresses.pop(0), Block_code)
-        
+        if not checkTextLength(Block_code, gossipStoneLimit):
+            raise ValueError('Junk hint %s does not fit in a gossip stone text box.' % junkHint.name)
+        stoneTexts.append((stoneAddresses.pop(0), Block_code))
+
+    #hopefully fixes weird VC error where the last character from a previous text box would sometimes spill over into the next box.
+    for address in range(textStart, 0x9399D8):
+        rom.write_byte(address, 0x08)
+
+    for address, Block_code in stoneTexts:
+        rom.write_bytes(address, Block_code)
+
     return rom
 
 # builds boss reward text that is displayed at the temple of time altar for child and adult, pull based off of item in a fixed order.
@@ -75,12 +82,12 @@ def buildBossRewardHints(world, rom):
 
     # text that appears at altar as a child.
     Block_code = []
-    Block_code = getBytes(getHint('Spiritual Stone Text Start').text)
+    Block_code = getHintBytes('Spiritual Stone Text Start')
     for reward in bossRewardsSpiritualStones:
         buildBossString(Block_code, reward, world)
 
     Block_code = setRewardColor(Block_code)
-    Block_code.extend(getBytes(getHint('Spiritual Stone Text End').text))
+    Block_code.extend(getHintBytes('Spiritual Stone Text End'))
     Block_code.extend([0x0B])
     endText(Block_code)
     rom.write_bytes(0x95ED95, Block_code)
@@ -91,7 +98,7 @@ def buildBossRewardHints(world, rom):
         buildBossString(Block_code, reward, world)
 
     Block_code = setRewardColor(Block_code)
-    Block_code.extend(getBytes(getHint('Medallion Text End').text))
+    Block_code.extend(getHintBytes('Medallion Text End'))
     Block_code.extend([0x0B])
     endText(Block_code)
     rom.write_bytes(0x95DB94, Block_code)
@@ -100,10 +107,9 @@ def buildBossRewardHints(world, rom):
 
 # pulls text string from hintlist for reward after sending the location to hintlist.
 def buildBossString(Block_code, reward, world):
-    for location in world.get_locations():
-        if location.item.name == reward:
-            Block_code.extend([0x08])
-            Block_code.extend(getBytes(getHint(location.name).text))
+    for location in world.find_items(reward):
+        Block_code.extend([0x08])
+        Block_code.extend(getHintBytes(location.name))
 
     return Block_code
 
@@ -126,22 +132,37 @@ def setRewardColor(Block_code):
 def endText(byteArray):
     return byteArray.extend([0x02])
 
+# Encoded text of each hint by name, filled in by `getHintBytes`
+hintBytes = {}
+
+# returns the encoded text of a hint. Each hint is only encoded once, later calls copy the cached bytes.
+def getHintBytes(name):
+    try:
+        return list(hintBytes[name])
+    except KeyError:
+        byteCode = hintBytes[name] = encodeText(getHint(name).text)
+        return list(byteCode)
+
+# byte limit of a gossip stone text box, including the end of text byte
+gossipStoneLimit = 92
+
+# checks that encoded text fits in a text box of `limit` bytes.
+def checkTextLength(byteArray, limit):
+    return len(byteArray) <= limit
+
+# translation table for the hint text control characters, every other character maps to itself:
+# ^ -> box break, & -> new line, @ -> print player name
+textTable = bytes.maketrans(b'^&@', b'\x04\x01\x0F')
+
+# encodes a string into text box bytes. # expands into the two byte command that sets the color to white.
+def encodeText(string):
+    try:
+        byteCode = string.encode('ascii')
+    except UnicodeEncodeError:
+        raise ValueError('Text %r contains characters that can not be shown in a text box.' % string)
+    return byteCode.translate(textTable).replace(b'#', b'\x05\x40')
+
 # reads array of characters and converts them to an array of bytes.
 def getBytes(string):
-    byteCode = []
-    for char in string:
-        if char == '^':
-            byteCode.extend([0x04])#box break
-        elif char == '&':
-            byteCode.extend([0x01])#new line
-        elif char == '@':
-            byteCode.extend([0x0F])#print player name
-        elif char == '#':
-            byteCode.extend([0x05, 0x40]) #sets color to white
-        else:
-            char = char.encode('utf-8')
-            char = char.hex()
-            byte = int('0x' + char, 16)
-            byteCode.extend([byte])
-    return byteCode
+    return list(encodeText(string))
         
@@ -96,7 +96,7 @@ def fill_songs(world, attempts=15):
         except FillError:
             logging.getLogger('').info("Failed to place songs. Will retry %s more times", attempts)
             for location in empty_song_locations:
-                location.item = None
+                world.remove_item(location)
             continue
         break
     else:
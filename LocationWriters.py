@@ -0,0 +1,111 @@
+from collections import namedtuple
+
+from Items import item_data
+
+'''
+Location writers:
+Every Location gets a `writer` when its region is created. The writer
+is a function taking (location, rom) that patches whatever item ends up
+at that location, so `patch_rom` just calls it for each location instead
+of walking the special cases by type and name every seed.
+
+All of the per-location special case addresses live in the tables below.
+'''
+
+# Extra writes for song locations:
+# `index_fix`  -> address written with (0x65 - item index)
+# `text_fix`   -> addresses written with the 2 byte text id (0x8C34 - item index * 4)
+# `text_box`   -> address of the text box id, written with `item_data[item]`
+# `suns_song`  -> if the Suns Song lands here, the secondary id is also written to the primary address
+SongFix = namedtuple('SongFix', ['index_fix', 'text_fix', 'text_box', 'suns_song'])
+
+song_fixes = {'Impa at Castle': SongFix(0xD12ECB, [0xB063FE], 0x2E8E931, False),
+              'Song from Malon': SongFix(None, [0xD7E142, 0xD7E786], 0x29BECB9, True),
+              'Song from Composer Grave': SongFix(None, [0xE09F66], 0x332A87D, False),
+              'Song from Saria': SongFix(0xE2A02B, [0xE29382], 0x20B1DBD, False),
+              'Song from Ocarina of Time': SongFix(None, [], 0x252FC95, False),
+              'Song at Windmill': SongFix(0xE42ABF, [], 0x3041091, False),
+              'Sheik Forest Song': SongFix(0xC7BAA3, [], 0x20B0815, False),
+              'Sheik at Temple': SongFix(0xC805EF, [], 0x2531335, False),
+              'Sheik in Crater': SongFix(0xC7BC57, [], 0x224D7FD, False),
+              'Sheik in Ice Cavern': SongFix(0xC7BD77, [], 0x2BEC895, False),
+              'Sheik in Kakariko': SongFix(0xAC9A5B, [], 0x2000FED, False),
+              'Sheik at Colossus': SongFix(None, [], 0x218C589, False)}
+
+# Boss locations that also write the reward's scene check bytes (`item_data[item][3]`)
+boss_reward_checks = {'Bongo Bongo': (0xCA3F32, 0xCA3F36),
+                      'Twinrova': (0xCA3EA2, 0xCA3EA6)}
+
+
+def write_treasure_chest_game(location, rom):
+    rom.write_bytes(location.address, item_data[location.item.name])
+
+def write_special(location, rom):
+    rom.write_byte(location.address, item_data[location.item.name][0])
+    rom.write_byte(location.address2, item_data[location.item.name][3])
+
+def make_song_writer(fix):
+    def write_song(location, rom):
+        itemid = location.item.code
+        rom.write_byte(location.address, itemid)
+        itemid = itemid + 0x0D
+        rom.write_byte(location.address2, itemid)
+        if fix is None:
+            return
+        if fix.suns_song and location.item.name == 'Suns Song':
+            rom.write_byte(location.address, itemid)
+        if fix.index_fix is not None:
+            rom.write_byte(fix.index_fix, 0x65 - location.item.index)
+        text_id = 0x8C34 - (location.item.index * 4)
+        for address in fix.text_fix:
+            rom.write_bytes(address, [text_id >> 8, text_id & 0x00FF])
+        rom.write_byte(fix.text_box, item_data[location.item.name]) #Fix text box
+    return write_song
+
+def write_npc(location, rom):
+    rom.write_byte(location.address, location.item.index)
+    if location.address2 is not None:
+        rom.write_byte(location.address2, location.item.index)
+
+def write_links_pocket(location, rom):
+    rom.write_byte(location.address, item_data[location.item.name][0])
+    rom.write_byte(location.address2, item_data[location.item.name][1])
+
+def make_boss_writer(check_addresses):
+    def write_boss(location, rom):
+        rom.write_byte(location.address, location.item.code)
+        rom.write_byte(location.address2, item_data[location.item.name][2])
+        if check_addresses is not None:
+            check = item_data[location.item.name][3]
+            rom.write_bytes(check_addresses[0], [check[0], check[1]])
+            rom.write_bytes(check_addresses[1], [check[2], check[3]])
+    return write_boss
+
+def write_chest(location, rom):
+    itemid = location.item.code | (location.default & 0xF01F)
+    itemidhigh = itemid >> 8
+    itemidlow = itemid & 0x00FF
+
+    rom.write_bytes(location.address, [itemidhigh, itemidlow])
+    if location.address2 is not None:
+        rom.write_bytes(location.address2, [itemidhigh, itemidlow])
+
+
+# Resolves the writer for a location from its name and type.
+# Locations without an address are never patched and get None.
+def get_location_writer(location):
+    if location.address is None:
+        return None
+    if location.type == 'Special':
+        if location.name == 'Treasure Chest Game':
+            return write_treasure_chest_game
+        return write_special
+    if location.type == 'Song':
+        return make_song_writer(song_fixes.get(location.name))
+    if location.type == 'NPC':
+        return write_npc
+    if location.type == 'Boss':
+        if location.name == 'Links Pocket':
+            return write_links_pocket
+        return make_boss_writer(boss_reward_checks.get(location.name))
+    return write_chest
@@ -2,11 +2,9 @@
 import argparse
 import os
 import logging
-import random
 import textwrap
 import sys
 
-from Gui import guiMain
 from Main import main
 from Utils import is_bundled, close_console
 
@@ -17,7 +15,18 @@ class ArgumentDefaultsHelpFormatter(argparse.RawTextHelpFormatter):
         return textwrap.dedent(action.help)
 
 
-def start():
+def positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError('%s is not a positive number' % value)
+    return number
+
+
+# Returns the parser for the command line settings, also used by the daemon for its defaults
+def get_parser():
     parser = argparse.ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
     parser.add_argument('--create_spoiler', help='Output a Spoiler File', action='store_true')
     parser.add_argument('--bridge', default='medallions', const='medallions', nargs='?', choices=['medallions', 'vanilla', 'dungeons', 'open'],
@@ -36,8 +45,13 @@ def start():
                              If --seed is provided, it will be used for the first seed, then
                              used to derive the next seed (i.e. generating 10 seeds with
                              --seed given will produce the same 10 (different) roms each
-                             time).
-                             ''', type=int)
+                             time, whatever the number of --workers).
+                             ''', type=positive_int)
+    parser.add_argument('--workers', help='''\
+                             Number of processes generating the seeds of a --count
+                             batch in parallel. Without it, the seeds are generated
+                             one after the other in this process.
+                             ''', type=positive_int)
     parser.add_argument('--open_forest', help='''\
                              Mido no longer blocks the path to the Deku Tree and
                              the Kokiri boy no longer blocks the path out of the forest.
@@ -61,8 +75,64 @@ def start():
                              ''', action='store_true')
     parser.add_argument('--suppress_rom', help='Do not create an output rom file.', action='store_true')
     parser.add_argument('--compress_rom', help='Create a compressed version of the output rom file.', action='store_true')
+    parser.add_argument('--cache_dir', help='''\
+                             Keep the result of every seed in this directory and reuse it
+                             when the same seed is generated again with the same settings.
+                             The built world of every settings profile is kept there too,
+                             so later runs don't have to build it again.
+                             ''')
+    parser.add_argument('--cache_size', default=512, help='''\
+                             Maximum size of the results in the --cache_dir in MB.
+                             With --workers every process evicts on its own, so the
+                             directory can go over it until the next run.
+                             (default: %(default)s)
+                             ''', type=positive_int)
+    parser.add_argument('--fast_reachability', help='''\
+                             Work out the minimal items every location needs once and
+                             check most locations against the inventory while filling,
+                             instead of walking the region graph. The part that only
+                             depends on the settings is kept in the --cache_dir.
+                             ''', action='store_true')
+    parser.add_argument('--timing_report', help='''\
+                             Append the wall clock and CPU time of every stage of every
+                             seed to this file, one JSON record per line. Summarize it
+                             with TimingReport.py.
+                             ''')
+    parser.add_argument('--reach_stats', help='''\
+                             Count what the reachability checks do in every stage
+                             (calls, cache hits and misses, recursion depth, sweeps,
+                             state copies) and add it to the --timing_report.
+                             Slows generation down.
+                             ''', action='store_true')
+    parser.add_argument('--rule_profile', help='''\
+                             Time every access rule, item rule and always allow rule
+                             while the seed is generated and write the hottest ones
+                             to <output>_RuleProfile.txt. Slows generation down.
+                             ''', action='store_true')
+    parser.add_argument('--profile', help='''\
+                             Profile every stage of every seed with cProfile and write
+                             the results to <seed>_<stage>.pstats in this directory.
+                             A --count batch also gets batch_<stage>.pstats merging
+                             all its seeds.
+                             ''')
+    parser.add_argument('--profile_collapsed', help='''\
+                             With --profile, also write every profile as collapsed
+                             stacks (.collapsed), for flame graphs.
+                             ''', action='store_true')
+    parser.add_argument('--trace_memory', help='''\
+                             Trace the memory of every stage with tracemalloc (peak,
+                             retained and the top allocation sites) and add it to
+                             the --timing_report. Slows generation down a lot.
+                             ''', action='store_true')
     parser.add_argument('--gui', help='Launch the GUI', action='store_true')
+    return parser
+
+
+def start():
+    parser = get_parser()
     args = parser.parse_args()
+    if args.workers is not None and args.count is None:
+        parser.error('--workers only applies to a --count batch')
 
     if is_bundled() and len(sys.argv) == 1:
         # for the bundled builds, if we have no arguments, the user
@@ -70,6 +140,7 @@ def start():
         # interface shouuld specify at least one option, possibly setting a value to a
         # default if they like all the defaults
         close_console()
+        from Gui import guiMain
         guiMain()
         sys.exit(0)
 
@@ -83,14 +154,23 @@ def start():
     logging.basicConfig(format='%(message)s', level=loglevel)
 
     if args.gui:
+        # tkinter is only imported when the GUI is actually used
+        from Gui import guiMain
         guiMain(args)
     elif args.count is not None:
-        seed = args.seed
-        for _ in range(args.count):
-            main(seed=seed, args=args)
-            seed = random.randint(0, 999999999)
+        from Batch import generate_batch
+        result = generate_batch(args, workers=args.workers)
+        if args.profile is not None:
+            from Profiling import aggregate_profiles
+            aggregate_profiles(args.profile, args.profile_collapsed)
+        if not result.success:
+            sys.exit(1)
     else:
         main(seed=args.seed, args=args)
 
 if __name__ == '__main__':
+    # batches and the GUI generate on worker processes, which frozen builds have to start this way
+    # (imported here, a single seed doesn't need multiprocessing)
+    import multiprocessing
+    multiprocessing.freeze_support()
     start()
@@ -2,116 +2,268 @@ from collections import OrderedDict
 from itertools import zip_longest
 import json
 import logging
-import platform
 import random
-import subprocess
-import time
 
 from BaseClasses import World, CollectionState, Item
 from Regions import create_regions
-from EntranceShuffle import link_entrances
-from Rom import patch_rom, LocalRom
+from EntranceShuffle import link_fixed_entrances, shuffle_entrances
 from Rules import set_rules
 from Dungeons import create_dungeons, fill_dungeons_restrictive
 from Fill import distribute_items_restrictive
 from ItemList import generate_itempool
+from Items import ItemFactory
+from Progress import SeedProgress
 from Utils import output_path
 
 __version__ = '1.0.0'
 
-def main(args, seed=None):
-    start = time.clock()
-
-    # initialize the world
-    world = World(args.bridge, args.open_forest, args.open_door_of_time, not args.nodungeonitems, args.beatableonly, args.hints)
+# `progress` -> optional callback receiving progress events, see Progress.py
+def main(args, seed=None, base_rom=None, output=None, progress=None):
     logger = logging.getLogger('')
+
+    tracker = SeedProgress(progress)
+    # the caches and diagnostics are only imported when their option is set
+    if args.reach_stats:
+        from ReachStats import ReachCounters
+        tracker.counters = ReachCounters()
+    if args.profile is not None:
+        from Profiling import StageProfiler
+        tracker.profiler = StageProfiler(args.profile, args.profile_collapsed)
+    if args.trace_memory:
+        from MemoryTrace import StageMemory
+        tracker.memory = StageMemory()
     if seed is None:
         random.seed(None)
-        world.seed = random.randint(0, 999999999)
+        tracker.seed = random.randint(0, 999999999)
     else:
-        world.seed = int(seed)
+        tracker.seed = int(seed)
+
+    world_cache = None
+    if args.cache_dir is not None:
+        from WorldCache import get_world_cache
+        world_cache = get_world_cache(args)
+
+    # initialize the world
+    with tracker.stage('world'):
+        world = get_world((args.bridge, args.open_forest, args.open_door_of_time, not args.nodungeonitems, args.beatableonly, args.hints), tracker=tracker, world_cache=world_cache)
+    world.progress = tracker
+    world.seed = tracker.seed
     random.seed(world.seed)
 
     logger.info('OoT Randomizer Version %s  -  Seed: %s\n\n', __version__, world.seed)
 
-    create_regions(world)
+    cache = None
+    cached = None
+    if args.cache_dir is not None:
+        from ResultCache import base_rom_digest, get_result_cache, make_key
+        cache = get_result_cache(args)
+        cache_key = make_key(world.settings, world.seed, __version__, base_rom_digest(args.rom))
+        with tracker.stage('cache_lookup'):
+            cached = cache.get(cache_key)
+        if cached is not None and not cached.covers(args):
+            cached = None
+
+    profiler = None
+    if cached is not None:
+        logger.info('Found this seed in the result cache.')
+        with tracker.stage('cache_load'):
+            load_cached_result(world, cached)
+    else:
+        requirement_cache = None
+        if args.fast_reachability:
+            from Requirements import get_requirement_cache
+            requirement_cache = get_requirement_cache(args)
+        if args.rule_profile:
+            from RuleProfile import RuleProfiler
+            profiler = RuleProfiler(world)
+        try:
+            generate_world(world, requirement_cache)
+        finally:
+            if profiler is not None:
+                profiler.uninstall()
 
-    create_dungeons(world)
+    outfilebase = 'OoT_%s%s%s%s_%s' % (world.bridge, "-openforest" if world.open_forest else "", "-opendoor" if world.open_door_of_time else "", "-beatableonly" if world.check_beatable_only else "",  world.seed)
 
-    logger.info('Shuffling the World about.')
+    if profiler is not None:
+        write_output(output, write_text_file, output_path('%s_RuleProfile.txt' % outfilebase), profiler.report())
+
+    patches = None
+    if not args.suppress_rom:
+        logger.info('Patching ROM.')
+        # the ROM layer is only imported when we actually patch
+        from Rom import patch_rom, LocalRom
+        with tracker.stage('patch'):
+            if base_rom is not None:
+                rom = base_rom.create_view()
+            else:
+                rom = LocalRom(args.rom)
+            if cached is not None:
+                cached.apply_patches(rom)
+            else:
+                patch_rom(world, rom)
+                if cache is not None:
+                    patches = rom.get_patches()
+        with tracker.stage('write_rom'):
+            write_output(output, write_rom, rom, outfilebase, args.compress_rom, args.cache_dir)
+
+    spoiler = None
+    if args.create_spoiler:
+        with tracker.stage('spoiler'):
+            spoiler = cached.spoiler if cached is not None else world.spoiler.to_string()
+            write_output(output, write_text_file, output_path('%s_Spoiler.txt' % outfilebase), spoiler)
+
+    if cache is not None and cached is None:
+        with tracker.stage('cache_store'):
+            placements = [(location.name, location.item.name, location.event) for location in world.get_filled_locations()]
+            cache.put(cache_key, placements, spoiler, patches)
+
+    world.timings = tracker.timings
+    world.reach_stats = tracker.stage_counters
+    record = tracker.timing_record(version=__version__, settings=timing_settings(args), cached=cached is not None)
+    if args.timing_report is not None:
+        from TimingReport import write_timing_record
+        write_timing_record(args.timing_report, record)
 
-    link_entrances(world)
+    logger.info('Done. Enjoy.')
+    logger.debug('Total Time: %s', record['wall'])
 
-    logger.info('Calculating Access Rules.')
+    return world
+
+# `requirement_cache` -> optional RequirementCache, sets `world.requirements` (see Requirements.py)
+def generate_world(world, requirement_cache=None):
+    logger = logging.getLogger('')
+
+    logger.info('Shuffling the World about.')
 
-    set_rules(world)
+    with world.progress.stage('entrances'):
+        shuffle_entrances(world)
+
+    if requirement_cache is not None:
+        with world.progress.stage('requirements'):
+            world.requirements = requirement_cache.get(world)
 
     logger.info('Generating Item Pool.')
 
-    generate_itempool(world)
+    with world.progress.stage('itempool'):
+        generate_itempool(world)
 
     logger.info('Placing Dungeon Items.')
 
-    shuffled_locations = None
-    shuffled_locations = world.get_unfilled_locations()
-    random.shuffle(shuffled_locations)
-    fill_dungeons_restrictive(world, shuffled_locations)
+    with world.progress.stage('dungeon_items'):
+        shuffled_locations = None
+        shuffled_locations = world.get_unfilled_locations()
+        random.shuffle(shuffled_locations)
+        fill_dungeons_restrictive(world, shuffled_locations)
 
     logger.info('Fill the world.')
 
-    distribute_items_restrictive(world)
+    with world.progress.stage('fill'):
+        distribute_items_restrictive(world)
 
     logger.info('Calculating playthrough.')
 
-    create_playthrough(world)
+    with world.progress.stage('playthrough'):
+        create_playthrough(world)
 
-    logger.info('Patching ROM.')
+# The settings a timing record is labelled with
+def timing_settings(args):
+    return OrderedDict((name, getattr(args, name)) for name in ['bridge', 'open_forest', 'open_door_of_time', 'nodungeonitems', 'beatableonly', 'hints'])
 
-    outfilebase = 'OoT_%s%s%s%s_%s' % (world.bridge, "-openforest" if world.open_forest else "", "-opendoor" if world.open_door_of_time else "", "-beatableonly" if world.check_beatable_only else "",  world.seed)
+# Puts the items and events of a cached result back into the world
+def load_cached_result(world, cached):
+    for location, item, event in cached.placements:
+        world.set_item(location, ItemFactory(item))
+        world.get_location(location).event = event
 
-    if not args.suppress_rom:
-        rom = LocalRom(args.rom)
-        patch_rom(world, rom)
-        rom.write_to_file(output_path('%s.z64' % outfilebase))
-        if args.compress_rom:
-            logger.info('Compressing ROM.')
-            if platform.system() == 'Windows':
-                subprocess.call(["Compress\Compress.exe", (output_path('%s.z64' % outfilebase)), (output_path('%s-comp.z64' % outfilebase))])
-            elif platform.system() == 'Linux':
-                subprocess.call(["Compress/Compress", ('%s.z64' % outfilebase)])
-            elif platform.system() == 'Darwin':
-                subprocess.call(["Compress/Compress.out", ('%s.z64' % outfilebase)])
-            else:
-                logger.info('OS not supported for compression')
+# Runs an output job on the `OutputWriter` if one is given, or right away
+def write_output(output, job, *args):
+    if output is None:
+        job(*args)
+    else:
+        output.submit(job, *args)
 
-    if args.create_spoiler:
-        world.spoiler.to_file(output_path('%s_Spoiler.txt' % outfilebase))
+def write_rom(rom, outfilebase, compress_rom, cache_dir=None):
+    logger = logging.getLogger('')
+    rom.write_to_file(output_path('%s.z64' % outfilebase))
+    if compress_rom:
+        logger.info('Compressing ROM.')
+        from RomCompress import get_compressor
+        compressed = get_compressor(cache_dir=cache_dir).compress(rom.buffer, rom.written)
+        with open(output_path('%s-comp.z64' % outfilebase), 'wb') as outfile:
+            outfile.write(compressed)
+
+def write_text_file(filename, text):
+    with open(filename, 'w') as outfile:
+        outfile.write(text)
+
+# Worlds already built, by (settings, purpose). See `get_world`.
+_worlds = {}
+
+# Returns a world for `settings` (the World constructor arguments) with its
+# regions, dungeons, fixed connections and rules in place. Each world is only
+# built once per settings and `purpose`, later calls reset it for the next seed,
+# so a world returned by `main` is only valid until the next seed starts.
+# `tracker` -> optional SeedProgress timing the stages of a build
+# `world_cache` -> optional WorldCache the world is loaded from (or stored to)
+def get_world(settings, purpose='generate', tracker=None, world_cache=None):
+    key = (settings, purpose)
+    world = _worlds.get(key)
+    if world is None:
+        world = _worlds[key] = build_world(settings, tracker or SeedProgress(), world_cache)
+    else:
+        world.reset()
+    return world
 
-    logger.info('Done. Enjoy.')
-    logger.debug('Total Time: %s', time.clock() - start)
+def build_world(settings, tracker, world_cache=None):
+    logger = logging.getLogger('')
+
+    if world_cache is not None:
+        with tracker.stage('load_world'):
+            world = world_cache.load(settings)
+        if world is not None:
+            logger.info('Loaded the World from the cache.')
+            return world
+
+    logger.info('Building the World.')
+
+    world = World(*settings)
+
+    with tracker.stage('create_regions'):
+        create_regions(world)
+
+    with tracker.stage('create_dungeons'):
+        create_dungeons(world)
+
+    with tracker.stage('link_fixed_entrances'):
+        link_fixed_entrances(world)
+
+    logger.info('Calculating Access Rules.')
+
+    with tracker.stage('set_rules'):
+        set_rules(world)
+
+    if world_cache is not None:
+        with tracker.stage('store_world'):
+            world_cache.store(world)
 
     return world
 
 def copy_world(world):
-    # ToDo: Not good yet
-    ret = World(world.bridge, world.open_forest, world.open_door_of_time, world.place_dungeon_items, world.check_beatable_only, world.hints)
+    ret = get_world(world.settings, 'playthrough')
     ret.seed = world.seed
     ret.can_take_damage = world.can_take_damage
-    create_regions(ret)
-    create_dungeons(ret)
 
-    # connect copied world
-    for region in world.regions:
-        copied_region = ret.get_region(region.name)
-        for entrance in region.entrances:
-            ret.get_entrance(entrance.name).connect(copied_region)
+    # connect copied world, the fixed connections are already in place
+    for entrance in world.shuffled_entrances:
+        copied_entrance = ret.get_entrance(entrance.name)
+        copied_entrance.connect(ret.get_region(entrance.connected_region.name), entrance.addresses, entrance.target)
+        ret.shuffled_entrances.append(copied_entrance)
 
     # fill locations
     for location in world.get_locations():
         if location.item is not None:
             item = Item(location.item.name, location.item.advancement, location.item.priority, location.item.type)
-            ret.get_location(location.name).item = item
-            item.location = ret.get_location(location.name)
+            ret.set_item(location.name, item)
         if location.event:
             ret.get_location(location.name).event = True
 
@@ -122,8 +274,6 @@ def copy_world(world):
     # copy progress items in state
     ret.state.prog_items = list(world.state.prog_items)
 
-    set_rules(ret)
-
     return ret
 
 def create_playthrough(world):
@@ -156,6 +306,7 @@ def create_playthrough(world):
             state.collect(location.item, True, location)
 
         collection_spheres.append(sphere)
+        old_world.progress.emit('sphere', phase='collect', sphere=len(collection_spheres), size=len(sphere), remaining=len(sphere_candidates))
 
         state_cache.append(state.copy())
 
@@ -173,14 +324,13 @@ def create_playthrough(world):
         for location in sphere:
             # we remove the item at location and check if game is still beatable
             logging.getLogger('').debug('Checking if %s is required to beat the game.', location.item.name)
-            old_item = location.item
-            location.item = None
+            old_item = world.remove_item(location)
             state.remove(old_item)
             if world.can_beat_game(state_cache[num]):
                 to_delete.append(location)
             else:
                 # still required, got to keep it around
-                location.item = old_item
+                world.set_item(location, old_item)
 
         # cull entries in spheres for spoiler walkthrough at end
         for location in to_delete:
@@ -205,6 +355,7 @@ def create_playthrough(world):
             state.collect(location.item, True, location)
 
         collection_spheres.append(sphere)
+        old_world.progress.emit('sphere', phase='final', sphere=len(collection_spheres), size=len(sphere), remaining=len(required_locations))
 
         logging.getLogger('').debug('Calculated final sphere %i, containing %i of %i progress items.', len(collection_spheres), len(sphere), len(required_locations))
         if not sphere:
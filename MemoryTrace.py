@@ -0,0 +1,73 @@
+from collections import OrderedDict
+import tracemalloc
+
+'''
+Stage memory tracing:
+With `--trace_memory` every stage of `Main.main` is traced with tracemalloc
+and its timing record (see TimingReport.py) gets a `memory` entry:
+
+  peak        highest traced memory during the stage, above what was
+              allocated when it started, in bytes
+  retained    memory allocated during the stage and still alive at its end
+  top         the allocation sites holding most of `retained`
+
+Tracing slows generation down several times and only sees memory
+allocated through Python, so it is for sizing, not for timing. On Python
+versions without `tracemalloc.reset_peak` (before 3.9) the peak of a stage
+nested in another one can't be measured and is reported as None.
+'''
+
+TOP_SITES = 10
+
+_ignored_traces = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, '<frozen importlib._bootstrap>'), tracemalloc.Filter(False, __file__)]
+
+
+'''
+StageMemory object:
+Traces the stages of one seed. `begin` and `end` bracket a stage and may
+be nested; tracing is on while any stage is open.
+'''
+class StageMemory(object):
+
+    def __init__(self, frames=1):
+        self.frames = frames
+        self.started = False
+        self.open_stages = [] # per open stage: [traced memory at start, highest peak of its finished children, snapshot at start]
+
+    def begin(self):
+        if not self.open_stages:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self.started = True
+            # forget what earlier stages allocated, this also resets the peak
+            tracemalloc.clear_traces()
+        elif hasattr(tracemalloc, 'reset_peak'):
+            self.open_stages[-1][1] = max(self.open_stages[-1][1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        self.open_stages.append([current, current, tracemalloc.take_snapshot().filter_traces(_ignored_traces)])
+
+    def end(self):
+        start, children_peak, start_snapshot = self.open_stages.pop()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_ignored_traces)
+        nested = bool(self.open_stages)
+
+        if nested and not hasattr(tracemalloc, 'reset_peak'):
+            stage_peak = None
+        else:
+            stage_peak = max(peak, children_peak) - start
+        if nested:
+            # the enclosing stage reached at least the peak of this one
+            self.open_stages[-1][1] = max(self.open_stages[-1][1], peak, children_peak)
+
+        top = []
+        grown = [stat for stat in snapshot.compare_to(start_snapshot, 'traceback') if stat.size_diff > 0]
+        for stat in sorted(grown, key=lambda stat: stat.size_diff, reverse=True)[:TOP_SITES]:
+            frame = stat.traceback[0]
+            top.append(OrderedDict([('site', '%s:%d' % (frame.filename, frame.lineno)), ('size', stat.size_diff), ('count', stat.count_diff)]))
+
+        if not nested and self.started:
+            tracemalloc.stop()
+            self.started = False
+        return OrderedDict([('peak', stage_peak), ('retained', current - start), ('top', top)])
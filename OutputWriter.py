@@ -0,0 +1,102 @@
+import logging
+import queue
+import threading
+
+'''
+OutputWriter object:
+Writes finished seeds (ROM files, compressed ROMs, spoiler logs) on a
+background thread, so the generation of the next seed in a batch
+overlaps with the disk I/O of the previous one.
+
+- `submit` blocks while `max_pending` jobs are already queued, so a slow
+  disk holds back generation instead of piling up 64MB buffers.
+- Jobs are tagged with the key (the seed) given to `begin`, until `end`.
+  Once every job of a key has run, `finished` returns it with the error
+  of its first failed job (None if they all succeeded). A job that raises
+  skips the remaining jobs of its key, the other keys are still written.
+'''
+class OutputWriter(object):
+
+    def __init__(self, max_pending=2):
+        self.queue = queue.Queue(max_pending)
+        self.lock = threading.Lock()
+        self.key = None
+        self.open = set()   # keys between `begin` and `end`, they may still get jobs
+        self.pending = {}   # key -> number of its jobs not run yet
+        self.errors = {}    # key -> error of its first failed job
+        self.done = []      # (key, error) of the keys `finished` hasn't returned yet
+        self.thread = threading.Thread(target=self._run, name='OutputWriter')
+        self.thread.daemon = True
+        self.thread.start()
+
+    # Tags the jobs submitted from now on with `key`
+    def begin(self, key):
+        with self.lock:
+            self.key = key
+            self.open.add(key)
+            self.pending.setdefault(key, 0)
+
+    # No more jobs for the current key
+    def end(self):
+        with self.lock:
+            key, self.key = self.key, None
+            self.open.discard(key)
+            self._check_done(key)
+
+    # Queues `job(*args)` to run on the writer thread
+    def submit(self, job, *args):
+        key = self.key
+        with self.lock:
+            self.pending[key] = self.pending.get(key, 0) + 1
+        self.queue.put((key, job, args))
+
+    # Returns the (key, error) of every key whose jobs have all run since the last call
+    def finished(self):
+        with self.lock:
+            done, self.done = self.done, []
+        return done
+
+    # Waits until every queued job has run
+    def flush(self):
+        self.queue.join()
+
+    # Runs the remaining jobs and stops the writer thread
+    def close(self):
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+
+    # with `self.lock` held
+    def _check_done(self, key):
+        if key not in self.open and self.pending.get(key) == 0:
+            del self.pending[key]
+            self.done.append((key, self.errors.pop(key, None)))
+
+    def _run(self):
+        while True:
+            entry = self.queue.get()
+            try:
+                if entry is None:
+                    return
+                key, job, args = entry
+                with self.lock:
+                    failed = key in self.errors
+                # after a failure, skip the other jobs of the same key
+                if not failed:
+                    try:
+                        job(*args)
+                    except Exception as e:
+                        logging.getLogger('').exception('Writing the output of %s failed.', key)
+                        with self.lock:
+                            self.errors[key] = e
+                with self.lock:
+                    self.pending[key] -= 1
+                    self._check_done(key)
+            finally:
+                self.queue.task_done()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
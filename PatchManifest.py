@@ -0,0 +1,78 @@
+import struct
+import sys
+
+'''
+Patch manifest:
+The static patches `patch_rom` applies to every seed, stored as sorted
+(address, bytes) records in a small binary file, so they are loaded with
+a single read. The file is built from the writes in StaticPatches.py.
+
+File layout (big endian):
+  header:  b'MMRP', version (u16), record count (u32)
+  record:  address (u32), data length (u32), label length (u16),
+           data, utf-8 label describing what the patch does
+
+Run `python PatchManifest.py <manifest>` to list the records.
+'''
+
+MANIFEST_MAGIC = b'MMRP'
+MANIFEST_VERSION = 1
+
+_header = struct.Struct('>4sHI')
+_record = struct.Struct('>IIH')
+
+_manifest_cache = {}
+
+
+# Writes (address, data, label) records to `path`, sorted by address
+def write_patch_manifest(path, records):
+    records = sorted(records, key=lambda record: record[0])
+    with open(path, 'wb') as stream:
+        stream.write(_header.pack(MANIFEST_MAGIC, MANIFEST_VERSION, len(records)))
+        for address, data, label in records:
+            label = label.encode('utf-8')
+            stream.write(_record.pack(address, len(data), len(label)))
+            stream.write(bytes(data))
+            stream.write(label)
+
+
+# Reads the manifest at `path` with one read and returns its
+# (address, data, label) records. Results are cached per path unless `cache` is False.
+def load_patch_manifest(path, cache=True):
+    if cache and path in _manifest_cache:
+        return _manifest_cache[path]
+
+    with open(path, 'rb') as stream:
+        buffer = stream.read()
+
+    magic, version, count = _header.unpack_from(buffer, 0)
+    if magic != MANIFEST_MAGIC or version != MANIFEST_VERSION:
+        raise RuntimeError('%s is not a valid patch manifest.' % path)
+
+    records = []
+    offset = _header.size
+    for _ in range(count):
+        address, length, label_length = _record.unpack_from(buffer, offset)
+        offset += _record.size
+        data = buffer[offset:offset + length]
+        offset += length
+        label = buffer[offset:offset + label_length].decode('utf-8')
+        offset += label_length
+        records.append((address, data, label))
+
+    if cache:
+        _manifest_cache[path] = records
+    return records
+
+
+def apply_patch_manifest(rom, path, cache=True):
+    for address, data, _ in load_patch_manifest(path, cache):
+        rom.write_block(address, data)
+
+
+def main(path):
+    for address, data, label in load_patch_manifest(path):
+        print('0x%08X  %5d  %s' % (address, len(data), label))
+
+if __name__ == '__main__':
+    main(sys.argv[1])
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+import argparse
+import cProfile
+from collections import defaultdict
+import glob
+import os
+import pstats
+
+'''
+Stage profiling:
+With `--profile DIR` every stage of `Main.main` runs under its own
+cProfile profiler and is dumped to DIR/<seed>_<stage>.pstats. Only the
+outermost stages are profiled (cProfile can't nest), so the world build
+stages are part of `world`. `--profile_collapsed` also writes each dump
+as collapsed stacks (<seed>_<stage>.collapsed), the input format of
+flamegraph.pl and speedscope.
+
+After a `--count` batch the dumps of all seeds are merged per stage into
+DIR/batch_<stage>.pstats; `python Profiling.py DIR` does the same for an
+existing directory.
+
+cProfile only records caller/callee pairs, not whole stacks, so the
+collapsed stacks split the time of a function between the paths leading
+to it in proportion to how much each caller spent in it.
+'''
+
+
+'''
+StageProfiler object:
+Profiles the stages of one seed. `begin` and `end` bracket a stage and may
+be nested; only the outermost stage is profiled.
+'''
+class StageProfiler(object):
+
+    def __init__(self, directory, collapsed=False):
+        self.directory = directory
+        self.collapsed = collapsed
+        self.profile = None
+        self.depth = 0
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+    def begin(self, seed, name):
+        self.depth += 1
+        if self.depth == 1:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def end(self, seed, name):
+        self.depth -= 1
+        if self.depth == 0:
+            self.profile.disable()
+            path = os.path.join(self.directory, '%s_%s.pstats' % (seed, name))
+            self.profile.dump_stats(path)
+            if self.collapsed:
+                write_collapsed(pstats.Stats(self.profile), os.path.splitext(path)[0] + '.collapsed')
+            self.profile = None
+
+
+def function_name(function):
+    filename, line, name = function
+    if filename == '~':
+        return name
+    return '%s:%d:%s' % (os.path.basename(filename), line, name)
+
+# Returns collapsed stack lines ("a;b;c microseconds") estimated from `stats`
+def collapsed_stacks(stats, max_depth=64, min_seconds=1e-6):
+    callees = defaultdict(dict)
+    roots = []
+    for function, (_, _, _, cumulative, callers) in stats.stats.items():
+        if not callers:
+            roots.append(function)
+        for caller, edge in callers.items():
+            callees[caller][function] = edge[3]
+
+    totals = defaultdict(float)
+    def walk(stack, function, fraction):
+        _, _, own, cumulative, _ = stats.stats[function]
+        stack = stack + [function]
+        key = ';'.join(function_name(frame) for frame in stack)
+        totals[key] += own * fraction
+        if len(stack) >= max_depth:
+            return
+        for callee, edge_time in callees[function].items():
+            if callee in stack:
+                continue # recursion, already counted in the frame above
+            callee_cumulative = stats.stats[callee][3]
+            time = edge_time * fraction
+            if time < min_seconds or not callee_cumulative:
+                continue
+            walk(stack, callee, time / callee_cumulative)
+
+    for root in roots:
+        walk([], root, 1.0)
+    return ['%s %d' % (stack, round(seconds * 1e6)) for stack, seconds in totals.items() if round(seconds * 1e6) > 0]
+
+def write_collapsed(stats, path):
+    with open(path, 'w') as outfile:
+        outfile.write('\n'.join(collapsed_stacks(stats)) + '\n')
+
+
+# Merges the per seed dumps in `directory` into one batch_<stage>.pstats per stage
+def aggregate_profiles(directory, collapsed=False):
+    by_stage = defaultdict(list)
+    for path in glob.glob(os.path.join(directory, '*_*.pstats')):
+        seed, stage = os.path.splitext(os.path.basename(path))[0].split('_', 1)
+        if seed != 'batch':
+            by_stage[stage].append(path)
+
+    written = []
+    for stage, paths in sorted(by_stage.items()):
+        stats = pstats.Stats(*sorted(paths))
+        path = os.path.join(directory, 'batch_%s.pstats' % stage)
+        stats.dump_stats(path)
+        if collapsed:
+            write_collapsed(stats, os.path.splitext(path)[0] + '.collapsed')
+        written.append(path)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge the --profile dumps of several seeds per stage.')
+    parser.add_argument('directory', help='The --profile directory.')
+    parser.add_argument('--collapsed', action='store_true', help='Also write the merged profiles as collapsed stacks.')
+    parser.add_argument('--top', default=0, type=int, help='Print the functions with the highest cumulative time of every stage.')
+    args = parser.parse_args()
+
+    for path in aggregate_profiles(args.directory, args.collapsed):
+        print(path)
+        if args.top:
+            pstats.Stats(path).sort_stats('cumulative').print_stats(args.top)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+import time
+
+'''
+Progress events:
+`Main.main` takes an optional `progress` callback that is called with one
+dict per event while a seed is generated. Every event has `event` (its
+type) and `seed`, the rest depends on the type:
+
+  stage_start  `stage`                    a stage of `main` starts
+  stage_end    `stage`, `seconds`, `cpu_seconds`
+                                          a stage finished (also sent if it failed)
+  fill         `fill`, `placed`, `remaining`
+                                          an item was placed; `fill` names the fill
+                                          algorithm, the counts are for its item pool
+  sphere       `phase`, `sphere`, `size`, `remaining`
+                                          the playthrough computed a sphere; `phase`
+                                          is 'collect', then 'final'
+
+The callback runs on the generating thread and should return quickly.
+'''
+
+
+'''
+SeedProgress object:
+Tracks the stages of one seed: records how long each takes in `timings`
+(wall clock) and `cpu_timings` (CPU time of this process) and passes the
+events to `callback`, if there is one. Stages can be nested, the time of
+a stage includes the time of the stages inside it.
+'''
+class SeedProgress(object):
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.seed = None
+        self.timings = OrderedDict()     # wall clock seconds spent in each stage
+        self.cpu_timings = OrderedDict() # CPU seconds spent in each stage
+        self.counters = None             # optional ReachStats.ReachCounters counting each stage
+        self.profiler = None             # optional Profiling.StageProfiler profiling each stage
+        self.memory = None               # optional MemoryTrace.StageMemory tracing each stage
+        self.stage_counters = OrderedDict()
+        self.stage_memory = OrderedDict()
+        self.start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    def emit(self, event, **data):
+        if self.callback is not None:
+            data['event'] = event
+            data['seed'] = self.seed
+            self.callback(data)
+
+    # Runs the body as the stage `name`
+    @contextmanager
+    def stage(self, name):
+        self.emit('stage_start', stage=name)
+        # keep the stages in the order they started, outer stages first
+        self.timings.setdefault(name, 0.0)
+        self.cpu_timings.setdefault(name, 0.0)
+        if self.counters is not None:
+            counting = self.counters.begin()
+        if self.profiler is not None:
+            self.profiler.begin(self.seed, name)
+        if self.memory is not None:
+            self.memory.begin()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - start
+            self.cpu_timings[name] = time.process_time() - cpu_start
+            if self.memory is not None:
+                self.stage_memory[name] = self.memory.end()
+            if self.profiler is not None:
+                self.profiler.end(self.seed, name)
+            if self.counters is not None:
+                self.stage_counters[name] = self.counters.end(counting)
+            self.emit('stage_end', stage=name, seconds=self.timings[name], cpu_seconds=self.cpu_timings[name])
+
+    # Returns the timing record of the seed as plain data, see TimingReport.py
+    def timing_record(self, **data):
+        record = OrderedDict([('seed', self.seed)])
+        record.update(data)
+        record['wall'] = time.perf_counter() - self.start
+        record['cpu'] = time.process_time() - self.cpu_start
+        record['stages'] = OrderedDict((name, OrderedDict([('wall', wall), ('cpu', self.cpu_timings[name])])) for name, wall in self.timings.items())
+        for name, counts in self.stage_counters.items():
+            record['stages'][name]['counters'] = counts
+        for name, memory in self.stage_memory.items():
+            record['stages'][name]['memory'] = memory
+        return record
+
+
+# Returns a short human readable description of an event
+def describe_event(event):
+    if event['event'] == 'stage_start':
+        return 'Running %s' % event['stage']
+    if event['event'] == 'stage_end':
+        return 'Finished %s in %.2fs' % (event['stage'], event['seconds'])
+    if event['event'] == 'fill':
+        return 'Placing items (%s): %d placed, %d remaining' % (event['fill'], event['placed'], event['remaining'])
+    if event['event'] == 'sphere':
+        return 'Playthrough (%s): sphere %d with %d items' % (event['phase'], event['sphere'], event['size'])
+    return event['event']
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+import sys
+
+from BaseClasses import CollectionState
+
+'''
+Reachability counters:
+Counts what the reachability engine of CollectionState does, to find out
+why some seeds take much longer than others. Enabled with `--reach_stats`,
+the counts of every stage end up in the timing record (see TimingReport.py).
+
+The counters replace methods of CollectionState with counting wrappers
+while a stage runs and put the originals back afterwards, so there is no
+overhead at all when they are disabled.
+
+  can_reach            calls by spot type (Region, Entrance, Location)
+  cache_hits           calls answered from the region/entrance/location cache
+  cache_misses         calls that had to evaluate the spot
+  recursion_denied     calls refused because the spot was already being evaluated
+  cache_dropped        entries dropped by `clear_cached_unreachable`, per cache
+  max_depth            deepest nesting of `can_reach` calls
+  sweeps               `sweep_for_events` calls
+  sweep_iterations     passes over the event locations made by those sweeps
+  copies               `copy` calls
+  copy_bytes           size of the containers those copies allocated
+'''
+
+SPOT_TYPES = ['Region', 'Entrance', 'Location']
+
+_originals = OrderedDict((name, getattr(CollectionState, name)) for name in ['can_reach', 'clear_cached_unreachable', 'sweep_for_events', 'copy'])
+
+
+'''
+ReachCounters object:
+Holds the counters of one seed. `begin` and `end` bracket a stage and
+may be nested; the counters are installed while any stage is open.
+'''
+class ReachCounters(object):
+
+    def __init__(self):
+        self.can_reach = dict.fromkeys(SPOT_TYPES, 0)
+        self.cache_hits = dict.fromkeys(SPOT_TYPES, 0)
+        self.cache_misses = dict.fromkeys(SPOT_TYPES, 0)
+        self.recursion_denied = 0
+        self.cache_dropped = dict.fromkeys(SPOT_TYPES, 0)
+        self.max_depth = 0
+        self.sweeps = 0
+        self.sweep_iterations = 0
+        self.copies = 0
+        self.copy_bytes = 0
+        self.depth = 0
+        self.open_stages = 0
+
+    # Returns the current counts as plain data
+    def snapshot(self):
+        return OrderedDict([
+            ('can_reach', dict(self.can_reach)),
+            ('cache_hits', dict(self.cache_hits)),
+            ('cache_misses', dict(self.cache_misses)),
+            ('recursion_denied', self.recursion_denied),
+            ('cache_dropped', dict(self.cache_dropped)),
+            ('max_depth', self.max_depth),
+            ('sweeps', self.sweeps),
+            ('sweep_iterations', self.sweep_iterations),
+            ('copies', self.copies),
+            ('copy_bytes', self.copy_bytes),
+        ])
+
+    # Starts counting a stage, returns what `end` needs to finish it
+    def begin(self):
+        if self.open_stages == 0:
+            install(self)
+        self.open_stages += 1
+        outer_max_depth = self.max_depth
+        self.max_depth = 0
+        return self.snapshot(), outer_max_depth
+
+    # Finishes the stage started by `begin` and returns its counts
+    def end(self, token):
+        before, outer_max_depth = token
+        counts = self.snapshot()
+        for name, value in before.items():
+            if isinstance(value, dict):
+                counts[name] = {spot_type: counts[name][spot_type] - count for spot_type, count in value.items()}
+            elif name != 'max_depth':
+                counts[name] -= value
+        # the enclosing stage saw at least as deep a recursion as this one
+        self.max_depth = max(outer_max_depth, self.max_depth)
+        self.open_stages -= 1
+        if self.open_stages == 0:
+            uninstall()
+        return counts
+
+
+def _cache_type(spot, resolution_hint):
+    spot_type = getattr(spot, 'spot_type', None)
+    if spot_type in SPOT_TYPES:
+        return spot_type
+    return resolution_hint if resolution_hint in ['Location', 'Entrance'] else 'Region'
+
+def _caches(state):
+    return {'Region': state.region_cache, 'Entrance': state.entrance_cache, 'Location': state.location_cache}
+
+
+# Replaces the CollectionState methods with wrappers counting into `counters`
+def install(counters):
+    can_reach = _originals['can_reach']
+    clear_cached_unreachable = _originals['clear_cached_unreachable']
+    sweep_for_events = _originals['sweep_for_events']
+    copy = _originals['copy']
+
+    def counting_can_reach(self, spot, resolution_hint=None):
+        spot_type = _cache_type(spot, resolution_hint)
+        counters.can_reach[spot_type] += 1
+        if isinstance(spot, str):
+            spot = {'Location': self.world.get_location, 'Entrance': self.world.get_entrance}.get(spot_type, self.world.get_region)(spot)
+        if spot.recursion_count > 0:
+            counters.recursion_denied += 1
+        elif spot in _caches(self)[spot_type]:
+            counters.cache_hits[spot_type] += 1
+        else:
+            counters.cache_misses[spot_type] += 1
+        counters.depth += 1
+        counters.max_depth = max(counters.max_depth, counters.depth)
+        try:
+            return can_reach(self, spot, resolution_hint)
+        finally:
+            counters.depth -= 1
+
+    def counting_clear_cached_unreachable(self):
+        before = {spot_type: len(cache) for spot_type, cache in _caches(self).items()}
+        clear_cached_unreachable(self)
+        for spot_type, cache in _caches(self).items():
+            counters.cache_dropped[spot_type] += before[spot_type] - len(cache)
+
+    def counting_sweep_for_events(self, key_only=False):
+        counters.sweeps += 1
+        iterations = sweep_for_events(self, key_only)
+        counters.sweep_iterations += iterations
+        return iterations
+
+    def counting_copy(self):
+        ret = copy(self)
+        counters.copies += 1
+        counters.copy_bytes += sum(sys.getsizeof(container) for container in [ret.prog_items, ret.region_cache, ret.location_cache, ret.entrance_cache, ret.events, ret.path, ret.locations_checked])
+        return ret
+
+    CollectionState.can_reach = counting_can_reach
+    CollectionState.clear_cached_unreachable = counting_clear_cached_unreachable
+    CollectionState.sweep_for_events = counting_sweep_for_events
+    CollectionState.copy = counting_copy
+
+# Puts the original CollectionState methods back
+def uninstall():
+    for name, method in _originals.items():
+        setattr(CollectionState, name, method)
@@ -1,5 +1,6 @@
 import collections
 from BaseClasses import Region, Location, Entrance, RegionType
+from LocationWriters import get_location_writer
 
 
 def create_regions(world):
@@ -214,7 +215,9 @@ def _create_region(name, type, locations=None, exits=None):
         ret.exits.append(Entrance(exit, ret))
     for location in locations:
         address, address2, default, type = location_table[location]
-        ret.locations.append(Location(location, address, address2, default, type, ret))
+        new_location = Location(location, address, address2, default, type, ret)
+        new_location.writer = get_location_writer(new_location)
+        ret.locations.append(new_location)
     return ret
 
 # TODO: addresses, SO many addresses, and more
@@ -0,0 +1,314 @@
+from collections import Counter, deque
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from RuleNodes import FORM_ITEMS, HELPERS, HUMAN_ITEMS, Const, Has, Count, Form, CanUse, Hearts, Call, Can, And, Or
+from Utils import source_digest
+
+'''
+Minimal item requirements:
+Most access rules only ask for items, so whether a spot can be reached
+only depends on the inventory. This pass turns the rules (the RuleNodes
+trees `Rules.set_rule` leaves on every spot) into requirements in
+disjunctive normal form: a set of terms, each term a set of
+(item, count) pairs that is enough on its own. Only the minimal terms are
+kept, so
+
+    Form('Human') & (Has('Bow') | Has('Hookshot'))
+
+becomes {{Fierce Deity Mask, Bow}, {Fierce Deity Mask, Hookshot}}, and a
+location can be reached with an inventory if one of its terms is a subset
+of it.
+
+The requirement of a region is found by a fixpoint over the region graph
+(a region can be reached through any entrance whose rule holds and whose
+parent region can be reached), the requirement of a location is its
+rule and the requirement of its region. The seed connects the fairy
+entrances, so the graph part is solved again for every seed; the rule
+part only depends on the settings and is kept per settings profile, in
+memory and in the --cache_dir.
+
+The helpers rules use through `Call` are read from their definition,
+`RuleNodes.HELPERS`. Some rules can't be expressed in items (tricks,
+`Reach`, options, events through other `Call`s and plain functions). The requirement of every spot that
+depends on one is unknown (None) and the caller falls back to evaluating
+the rules. So do requirements with more than MAX_TERMS terms.
+
+With `--fast_reachability`, `World.requirements` is set for every seed
+and Fill and `World.can_beat_game` use it to check locations.
+'''
+
+MAX_TERMS = 64
+
+ALWAYS = frozenset([frozenset()])  # the empty term, needs nothing
+NEVER = frozenset()                # no term at all
+
+# the files the requirements are derived from, a change to any of them invalidates the cache
+SOURCES = ['BaseClasses.py', 'RuleNodes.py', 'Rules.py', 'Requirements.py']
+
+
+def _term(*pairs):
+    counts = {}
+    for item, count in pairs:
+        counts[item] = max(counts.get(item, 0), count)
+    return frozenset(counts.items())
+
+# Checks if every inventory meeting `term` also meets `other`
+def _implies(term, other):
+    counts = dict(term)
+    return all(counts.get(item, 0) >= count for item, count in other)
+
+# Drops the terms implied by another one, None if too many are left
+def _minimize(terms):
+    kept = []
+    for term in sorted(terms, key=lambda term: (len(term), sum(count for _, count in term))):
+        if not any(_implies(term, other) for other in kept):
+            kept.append(term)
+    if len(kept) > MAX_TERMS:
+        return None
+    return frozenset(kept)
+
+def and_terms(terms, other):
+    if terms == NEVER or other == NEVER:
+        return NEVER
+    if terms is None or other is None:
+        return None
+    if terms == ALWAYS:
+        return other
+    if other == ALWAYS:
+        return terms
+    return _minimize(set(_term(*(term | second)) for term in terms for second in other))
+
+def or_terms(terms, other):
+    if (terms is not None and frozenset() in terms) or (other is not None and frozenset() in other):
+        return ALWAYS
+    if terms is None or other is None:
+        return None
+    return _minimize(terms | other)
+
+# Sets the requirement of `name` in `table`. Names aren't unique for every
+# spot, a name whose spots have different requirements is unknown.
+def _set_terms(table, name, terms):
+    if name in table and table[name] != terms:
+        terms = None
+    table[name] = terms
+
+
+_rule_terms = {}
+
+# Returns the requirement of a RuleNodes tree, None if it is unknown
+def rule_terms(rule):
+    try:
+        return _rule_terms[rule]
+    except KeyError:
+        pass
+    except TypeError:
+        return None # unhashable arguments, never a rule made of items
+
+    if isinstance(rule, Const):
+        terms = ALWAYS if rule.value else NEVER
+    elif isinstance(rule, Has):
+        terms = frozenset([_term((rule.item, 1))])
+    elif isinstance(rule, Count):
+        terms = frozenset([_term((rule.item, rule.count))]) if rule.count > 0 else ALWAYS
+    elif isinstance(rule, Form):
+        terms = frozenset([_term((FORM_ITEMS[rule.form], 1))]) if rule.form in FORM_ITEMS else NEVER
+    elif isinstance(rule, CanUse):
+        if rule.item in HUMAN_ITEMS:
+            terms = frozenset([_term((FORM_ITEMS['Human'], 1), (rule.item, 1))])
+        else:
+            terms = frozenset([_term((rule.item, 1))])
+    elif isinstance(rule, And):
+        terms = ALWAYS
+        for child in rule.rules:
+            terms = and_terms(terms, rule_terms(child))
+    elif isinstance(rule, Or):
+        terms = NEVER
+        for child in rule.rules:
+            terms = or_terms(terms, rule_terms(child))
+    elif isinstance(rule, Hearts):
+        terms = rule_terms(rule.expand())
+    elif isinstance(rule, Call) and not isinstance(rule, Can) and rule.method in HELPERS:
+        terms = rule_terms(HELPERS[rule.method](*rule.arguments))
+    else:
+        terms = None
+
+    _rule_terms[rule] = terms
+    return terms
+
+
+'''
+RuleRequirements object:
+The requirements of the rules alone, without the region graph, by name.
+They only depend on the settings, see `RequirementCache`.
+'''
+class RuleRequirements(object):
+
+    def __init__(self, entrances, locations):
+        self.entrances = entrances
+        self.locations = locations
+
+    @classmethod
+    def from_world(cls, world):
+        entrances = {}
+        locations = {}
+        for region in world.regions:
+            for entrance in region.exits:
+                _set_terms(entrances, entrance.name, rule_terms(entrance.rule))
+            for location in region.locations:
+                _set_terms(locations, location.name, rule_terms(location.rule))
+        return cls(entrances, locations)
+
+    def to_json(self):
+        def dump(terms):
+            return None if terms is None else [sorted(term) for term in terms]
+        return {'entrances': dict((name, dump(terms)) for name, terms in self.entrances.items()),
+                'locations': dict((name, dump(terms)) for name, terms in self.locations.items())}
+
+    @classmethod
+    def from_json(cls, data):
+        def load(terms):
+            return None if terms is None else frozenset(_term(*[tuple(pair) for pair in term]) for term in terms)
+        return cls(dict((name, load(terms)) for name, terms in data['entrances'].items()),
+                   dict((name, load(terms)) for name, terms in data['locations'].items()))
+
+
+'''
+Requirements object:
+The requirements of the regions and locations of one seed's world, by name.
+'''
+class Requirements(object):
+
+    def __init__(self, regions, locations):
+        self.regions = regions
+        self.locations = locations
+        # the terms as tuples, for `can_reach`
+        self._checks = dict((name, None if terms is None else [tuple(term) for term in terms]) for name, terms in locations.items())
+
+    # Solves the region graph of `world` for the `rules` of its settings.
+    # `start` -> names of the regions reached without any item
+    @classmethod
+    def solve(cls, world, rules, start=()):
+        regions = dict((region.name, ALWAYS if region.name in start else NEVER) for region in world.regions)
+        pending = deque(region for region in world.regions if region.name not in start)
+        queued = set(region.name for region in pending)
+        while pending:
+            region = pending.popleft()
+            queued.discard(region.name)
+            if region.name in start:
+                continue
+            terms = NEVER
+            for entrance in region.entrances:
+                terms = or_terms(terms, and_terms(rules.entrances.get(entrance.name), regions[entrance.parent_region.name]))
+            if terms == regions[region.name]:
+                continue
+            regions[region.name] = terms
+            for entrance in region.exits:
+                if entrance.connected_region is not None and entrance.connected_region.name not in queued:
+                    queued.add(entrance.connected_region.name)
+                    pending.append(entrance.connected_region)
+
+        locations = {}
+        for location in world.get_locations():
+            _set_terms(locations, location.name, and_terms(rules.locations.get(location.name), regions[location.parent_region.name]))
+        return cls(regions, locations)
+
+    # The inventory `can_reach` checks against
+    @staticmethod
+    def inventory(state):
+        return Counter(state.prog_items)
+
+    # Checks if `location` can be reached with `inventory`, None if its requirement is unknown
+    def can_reach(self, location, inventory):
+        terms = self._checks.get(location.name)
+        if terms is None:
+            return None
+        for term in terms:
+            for item, count in term:
+                if inventory[item] < count:
+                    break
+            else:
+                return True
+        return False
+
+    def known(self):
+        return len([terms for terms in self.locations.values() if terms is not None])
+
+
+'''
+RequirementCache object:
+Keeps the RuleRequirements of every settings profile, in memory and, with
+a `path`, on disk (requirements_<key>.json, next to the result cache
+entries). The key covers the settings, the release (`Main.__version__`,
+bundled builds don't ship their sources) and the sources in SOURCES.
+'''
+class RequirementCache(object):
+
+    def __init__(self, path=None):
+        self.path = path
+        self.profiles = {}
+        self.digest = source_digest(SOURCES)
+        if path is not None and not os.path.exists(path):
+            os.makedirs(path)
+
+    def profile_key(self, world):
+        from Main import __version__
+        data = json.dumps({'settings': list(world.settings), 'version': __version__, 'sources': self.digest}, sort_keys=True)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, 'requirements_%s.json' % key)
+
+    def rules(self, world):
+        key = self.profile_key(world)
+        rules = self.profiles.get(key)
+        if rules is None:
+            rules = self.load(key)
+            if rules is None:
+                rules = RuleRequirements.from_world(world)
+                self.store(key, rules)
+            self.profiles[key] = rules
+        return rules
+
+    # Returns the Requirements of `world` as connected for its current seed
+    def get(self, world):
+        requirements = Requirements.solve(world, self.rules(world))
+        logging.getLogger('').debug('Requirements known for %d of %d locations.', requirements.known(), len(requirements.locations))
+        return requirements
+
+    def load(self, key):
+        if self.path is None:
+            return None
+        try:
+            with open(self._file(key), 'r') as stream:
+                return RuleRequirements.from_json(json.load(stream))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def store(self, key, rules):
+        if self.path is None:
+            return
+        handle, temp_path = tempfile.mkstemp(prefix='.tmp-', dir=self.path)
+        try:
+            with os.fdopen(handle, 'w') as stream:
+                json.dump(rules.to_json(), stream)
+            os.replace(temp_path, self._file(key))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+_caches = {}
+
+# Returns the requirement cache configured by `args`, None without --fast_reachability
+def get_requirement_cache(args):
+    if not args.fast_reachability:
+        return None
+    path = args.cache_dir
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = RequirementCache(path)
+    return cache
@@ -0,0 +1,182 @@
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+from PatchManifest import apply_patch_manifest, write_patch_manifest
+
+'''
+Result cache:
+Generation is deterministic for given settings, seed and version, so the
+result of a seed is kept on disk and a repeated request (every runner of
+a race asking for the same seed, say) is served by a lookup.
+
+Each entry is a directory named by the sha256 of (settings, seed, version,
+base ROM), the base ROM being the sha256 of the --rom file:
+  result.json  -> item placements, events and the spoiler log text (if made)
+  patches.bin  -> the ROM patch delta against the base ROM, in the
+                  PatchManifest format (only when a ROM was made)
+
+The total size of the cache is kept under `max_size` bytes by removing the
+least recently used entries. The directory is only listed when the cache
+is opened, after that the sizes of the entries are tracked as they are
+stored, so entries another process adds are only counted by the next
+process opening the cache: with --workers every process evicts on its own
+and the directory can go over `max_size` until then. Entries are written to a temporary directory
+and renamed into place, so several processes can share one cache.
+'''
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+RESULT_FILE = 'result.json'
+PATCH_FILE = 'patches.bin'
+
+
+def make_key(settings, seed, version, base=None):
+    data = json.dumps({'settings': list(settings), 'seed': seed, 'version': version, 'base': base}, sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+_base_digests = {}
+
+# Returns the sha256 of the base ROM file at `path`, None if there is none.
+# Only hashed again when the file changes.
+def base_rom_digest(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.realpath(path), stat.st_size, stat.st_mtime)
+    digest = _base_digests.get(key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as stream:
+            for block in iter(lambda: stream.read(0x100000), b''):
+                hasher.update(block)
+        digest = _base_digests[key] = hasher.hexdigest()
+    return digest
+
+
+'''
+CachedResult object:
+One entry read back from the cache.
+
+`placements` -> (location name, item name, event) for every filled location
+`spoiler` -> spoiler log text, None if the entry was made without one
+`has_patches` -> True if the entry has a ROM patch delta
+'''
+class CachedResult(object):
+
+    def __init__(self, path, placements, spoiler, has_patches):
+        self.path = path
+        self.placements = placements
+        self.spoiler = spoiler
+        self.has_patches = has_patches
+
+    # Checks that the entry has everything this request has to output
+    def covers(self, args):
+        return (args.suppress_rom or self.has_patches) and (not args.create_spoiler or self.spoiler is not None)
+
+    def apply_patches(self, rom):
+        apply_patch_manifest(rom, os.path.join(self.path, PATCH_FILE), cache=False)
+
+
+class ResultCache(object):
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        if not os.path.exists(path):
+            os.makedirs(path)
+        # entry name -> size, least recently used first
+        self.sizes = OrderedDict()
+        self.total = 0
+        self.scan()
+        self.evict()
+
+    # Reads the size of every entry in the directory
+    def scan(self):
+        entries = []
+        for name in os.listdir(self.path):
+            path = os.path.join(self.path, name)
+            if name.startswith('.') or not os.path.isdir(path):
+                continue
+            try:
+                entries.append((os.path.getmtime(path), name, self._entry_size(path)))
+            except OSError:
+                continue
+        self.sizes = OrderedDict((name, size) for _, name, size in sorted(entries))
+        self.total = sum(self.sizes.values())
+
+    @staticmethod
+    def _entry_size(path):
+        return sum(os.path.getsize(os.path.join(path, file)) for file in os.listdir(path))
+
+    # Records that the entry `key` has `size` bytes and was just used
+    def _track(self, key, size):
+        self.total += size - self.sizes.pop(key, 0)
+        self.sizes[key] = size
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key)
+
+    # Returns the CachedResult for `key`, or None
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(os.path.join(path, RESULT_FILE), 'r') as stream:
+                result = json.load(stream)
+            # mark as recently used
+            os.utime(path, None)
+            size = self.sizes.get(key)
+            self._track(key, size if size is not None else self._entry_size(path))
+        except (OSError, ValueError):
+            return None
+        placements = [tuple(placement) for placement in result['placements']]
+        return CachedResult(path, placements, result['spoiler'], os.path.exists(os.path.join(path, PATCH_FILE)))
+
+    # Stores the result of a seed, replacing any entry already there.
+    # `patches` -> (address, bytes) runs as returned by `LocalRom.get_patches`
+    def put(self, key, placements, spoiler=None, patches=None):
+        temp_path = tempfile.mkdtemp(prefix='.tmp-', dir=self.path)
+        try:
+            with open(os.path.join(temp_path, RESULT_FILE), 'w') as stream:
+                json.dump({'placements': placements, 'spoiler': spoiler}, stream)
+            if patches is not None:
+                write_patch_manifest(os.path.join(temp_path, PATCH_FILE), [(address, data, '') for address, data in patches])
+            size = self._entry_size(temp_path)
+            path = self._entry_path(key)
+            if os.path.exists(path):
+                shutil.rmtree(path, ignore_errors=True)
+            os.rename(temp_path, path)
+        except OSError:
+            # another process stored the same entry first
+            shutil.rmtree(temp_path, ignore_errors=True)
+        else:
+            self._track(key, size)
+        self.evict()
+
+    # Removes the least recently used entries until the cache fits in `max_size`
+    def evict(self):
+        while self.total > self.max_size and self.sizes:
+            name, size = self.sizes.popitem(last=False)
+            path = self._entry_path(name)
+            logging.getLogger('').debug('Evicting %s from the result cache.', path)
+            shutil.rmtree(path, ignore_errors=True)
+            self.total -= size
+
+
+_caches = {}
+
+# Returns the result cache configured by `args`, None if caching is off
+def get_result_cache(args):
+    path = args.cache_dir
+    if path is None:
+        return None
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = ResultCache(path, args.cache_size * 1024 * 1024)
+    return cache
@@ -0,0 +1,371 @@
+import bisect
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import logging
+import os
+import struct
+
+from Utils import local_path
+
+'''
+In-process ROM compression:
+Builds the compressed ROM straight from the patched buffer instead of
+writing the 64MB image and shelling out to `Compress/Compress`.
+
+- The files listed in the `dmadata` table are Yaz0 compressed in
+  parallel on a process pool.
+- Which files are compressed comes from table.txt, the table the
+  Compress tool reads, so the layout is the one the tool produces.
+- Compressed blobs are cached by the hash of the uncompressed file, so a
+  file the patch did not touch is only ever compressed once per process
+  (or once per cache directory, if one is given). Most of the ROM is
+  identical between seeds. Only the files of the base ROM are stored in
+  the cache directory, the ones a seed patched are kept in memory only,
+  and the memory cache keeps the MEMORY_CACHE_SIZE most recently used bytes.
+'''
+
+COMPRESSED_ROM_SIZE = 0x2000000
+
+# bytes of compressed blobs kept in memory, more than the files of a whole ROM
+MEMORY_CACHE_SIZE = 64 * 1024 * 1024
+
+# The table `Compress/Compress` reads: one character per dmadata entry,
+# '1' if the file is compressed, anything else if it is stored raw.
+COMPRESSION_TABLE = 'table.txt'
+
+# matches longer than this don't add their positions to the search chains
+MAX_INSERT_LENGTH = 32
+
+_dma_entry = struct.Struct('>IIII')
+
+
+def yaz0_compress(data, max_chain=16):
+    size = len(data)
+    out = bytearray(b'Yaz0')
+    out += struct.pack('>I', size)
+    out += bytes(8)
+    # 3 byte prefix -> positions it was seen at, most recent last
+    heads = {}
+
+    def insert(position):
+        key = data[position:position + 3]
+        chain = heads.get(key)
+        if chain is None:
+            heads[key] = [position]
+        else:
+            chain.append(position)
+            if len(chain) > max_chain * 4:
+                del chain[:-max_chain]
+
+    pos = 0
+    while pos < size:
+        code_index = len(out)
+        out.append(0)
+        code = 0
+        for bit in range(8):
+            if pos >= size:
+                break
+            best_length = 0
+            best_position = 0
+            chain = heads.get(data[pos:pos + 3]) if pos + 3 <= size else None
+            if chain:
+                max_length = min(0x111, size - pos)
+                for candidate in reversed(chain[-max_chain:]):
+                    if pos - candidate > 0x1000:
+                        break
+                    length = 3
+                    # compare blocks first, long runs of equal bytes are common
+                    while length + 16 <= max_length and data[candidate + length:candidate + length + 16] == data[pos + length:pos + length + 16]:
+                        length += 16
+                    while length < max_length and data[candidate + length] == data[pos + length]:
+                        length += 1
+                    if length > best_length:
+                        best_length = length
+                        best_position = candidate
+                        if length == max_length:
+                            break
+            if best_length >= 3:
+                distance = pos - best_position - 1
+                if best_length >= 0x12:
+                    out += bytes([distance >> 8, distance & 0xFF, best_length - 0x12])
+                else:
+                    out += bytes([((best_length - 2) << 4) | (distance >> 8), distance & 0xFF])
+                # like zlib, only the positions inside short matches are worth remembering
+                for position in range(pos, pos + best_length) if best_length <= MAX_INSERT_LENGTH else range(pos + best_length - 2, pos + best_length):
+                    insert(position)
+                pos += best_length
+            else:
+                code |= 0x80 >> bit
+                out.append(data[pos])
+                insert(pos)
+                pos += 1
+        out[code_index] = code
+    return bytes(out)
+
+
+def yaz0_decompress(data):
+    if data[:4] != b'Yaz0':
+        raise RuntimeError('Data is not Yaz0 compressed.')
+    size = struct.unpack_from('>I', data, 4)[0]
+    out = bytearray()
+    pos = 16
+    while len(out) < size:
+        code = data[pos]
+        pos += 1
+        for bit in range(8):
+            if len(out) >= size:
+                break
+            if code & (0x80 >> bit):
+                out.append(data[pos])
+                pos += 1
+            else:
+                high, low = data[pos], data[pos + 1]
+                pos += 2
+                distance = ((high & 0x0F) << 8 | low) + 1
+                length = high >> 4
+                if length == 0:
+                    length = data[pos] + 0x12
+                    pos += 1
+                else:
+                    length += 2
+                start = len(out) - distance
+                if distance >= length:
+                    out += out[start:start + length]
+                else:
+                    # the copy overlaps itself, repeating the last `distance` bytes
+                    out += (out[start:] * (length // distance + 1))[:length]
+    return bytes(out)
+
+
+# Finds the dmadata file table. It always starts with the makerom entry
+# (0x0 - 0x1060) immediately followed by boot starting at 0x1060.
+def find_dmadata(buffer):
+    pattern = _dma_entry.pack(0, 0x1060, 0, 0) + struct.pack('>I', 0x1060)
+    offset = buffer.find(pattern)
+    while offset != -1 and offset % 16:
+        offset = buffer.find(pattern, offset + 1)
+    if offset == -1:
+        raise RuntimeError('Could not find the dmadata table in the ROM.')
+    return offset
+
+
+# Returns the (vrom_start, vrom_end, prom_start, prom_end) dmadata entries
+def read_dmadata(buffer, offset=None):
+    if offset is None:
+        offset = find_dmadata(buffer)
+    entries = []
+    while True:
+        entry = _dma_entry.unpack_from(buffer, offset + len(entries) * 16)
+        if entry[1] == 0:
+            break
+        entries.append(entry)
+    return entries
+
+
+# Returns the indexes into dmadata of the files the retail ROM compresses.
+# Every other file (makerom, boot, dmadata, the audio tables, the icon and
+# item statics, ...) and every file past the end of the table is stored raw.
+def read_compression_table(path=None):
+    with open(path or local_path(COMPRESSION_TABLE), 'r') as stream:
+        table = stream.read().strip()
+    return frozenset(index for index, flag in enumerate(table) if flag == '1')
+
+
+def _compress_file(data):
+    return yaz0_compress(data)
+
+
+'''
+RomCompressor object:
+Compresses patched ROM buffers. Keep one around for a whole batch so its
+blob cache and process pool are reused between seeds.
+
+`workers` -> size of the process pool; 1 compresses in the calling process
+             (required inside daemonic batch workers, which can't have children)
+`cache_dir` -> optional directory persisting the compressed blobs of the
+               base ROM's files between runs
+`compressed` -> indexes into dmadata of the files to compress, the others are
+                stored raw; read from the compression table by default
+'''
+class RomCompressor(object):
+
+    def __init__(self, workers=None, cache_dir=None, compressed=None):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.cache_dir = cache_dir
+        self.compressed = compressed if compressed is not None else read_compression_table()
+        self.cache = OrderedDict() # key -> blob, least recently used first
+        self.cache_bytes = 0
+        self.executor = None
+        if cache_dir is not None and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _cache_path(self, key):
+        return os.path.join(self.cache_dir, key + '.yaz0')
+
+    # Keeps `blob` in memory, dropping the least recently used blobs over MEMORY_CACHE_SIZE
+    def _remember(self, key, blob):
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return
+        self.cache[key] = blob
+        self.cache_bytes += len(blob)
+        while self.cache_bytes > MEMORY_CACHE_SIZE:
+            _, dropped = self.cache.popitem(last=False)
+            self.cache_bytes -= len(dropped)
+
+    def _get_cached(self, key):
+        blob = self.cache.get(key)
+        if blob is None and self.cache_dir is not None and os.path.exists(self._cache_path(key)):
+            with open(self._cache_path(key), 'rb') as stream:
+                blob = stream.read()
+        if blob is not None:
+            self._remember(key, blob)
+        return blob
+
+    def _store_cached(self, key, blob, persist):
+        self._remember(key, blob)
+        if persist and self.cache_dir is not None:
+            with open(self._cache_path(key), 'wb') as stream:
+                stream.write(blob)
+
+    # Compresses every file not already in the cache, returns {key: blob}
+    # `base` -> keys of the files of the base ROM, the ones stored in `cache_dir`
+    def _compress_files(self, files, base):
+        blobs = {}
+        pending = {}
+        for key, data in files.items():
+            blob = self._get_cached(key)
+            if blob is not None:
+                blobs[key] = blob
+            else:
+                pending[key] = data
+
+        logging.getLogger('').debug('Compressing %d files, %d reused from cache.', len(pending), len(blobs))
+        if self.workers <= 1 or len(pending) <= 1:
+            results = {key: _compress_file(data) for key, data in pending.items()}
+        else:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.workers)
+            keys = list(pending)
+            results = dict(zip(keys, self.executor.map(_compress_file, [pending[key] for key in keys], chunksize=4)))
+
+        for key, blob in results.items():
+            self._store_cached(key, blob, key in base)
+            blobs[key] = blob
+        return blobs
+
+    # Takes a decompressed ROM buffer and returns the compressed ROM as a bytearray.
+    # `written` -> the addresses the seed patched (`LocalRom.written`), the
+    #              other files are the base ROM's; None if they all are
+    def compress(self, buffer, written=None):
+        dmadata_offset = find_dmadata(buffer)
+        entries = read_dmadata(buffer, dmadata_offset)
+        written = sorted(written) if written is not None else []
+
+        files = {}
+        base = set()
+        keys = []
+        for index, (vrom_start, vrom_end, prom_start, _) in enumerate(entries):
+            if index not in self.compressed or vrom_start == vrom_end or prom_start == 0xFFFFFFFF:
+                keys.append(None)
+                continue
+            data = bytes(buffer[vrom_start:vrom_end])
+            key = hashlib.sha1(data).hexdigest()
+            files[key] = data
+            keys.append(key)
+            first = bisect.bisect_left(written, vrom_start)
+            if first == len(written) or written[first] >= vrom_end:
+                base.add(key)
+        blobs = self._compress_files(files, base)
+
+        out = bytearray(COMPRESSED_ROM_SIZE)
+        table = []
+        cursor = 0
+        for (vrom_start, vrom_end, prom_start, prom_end), key in zip(entries, keys):
+            if prom_start == 0xFFFFFFFF:
+                # file removed from the ROM, keep its entry as is
+                table.append((vrom_start, vrom_end, prom_start, prom_end))
+                continue
+            if key is None:
+                data = buffer[vrom_start:vrom_end]
+                prom_end = 0
+            else:
+                data = blobs[key]
+                # padded to 16 bytes, like the Compress tool does
+                prom_end = cursor + ((len(data) + 0xF) & ~0xF)
+            if cursor + len(data) > COMPRESSED_ROM_SIZE:
+                raise RuntimeError('Compressed ROM does not fit in %d bytes.' % COMPRESSED_ROM_SIZE)
+            out[cursor:cursor + len(data)] = data
+            table.append((vrom_start, vrom_end, cursor, prom_end))
+            cursor += (len(data) + 0xF) & ~0xF
+
+        # dmadata is stored raw, so rewrite it with the new physical addresses
+        dmadata_prom = table[2][2] if len(table) > 2 else dmadata_offset
+        for index, entry in enumerate(table):
+            _dma_entry.pack_into(out, dmadata_prom + index * 16, *entry)
+        update_crc(out)
+        return out
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+# Takes a ROM compressed by `RomCompressor.compress` and returns the
+# decompressed image of `size` bytes, every file back at its vrom address
+def decompress_rom(buffer, size):
+    entries = read_dmadata(buffer)
+    out = bytearray(size)
+    table = []
+    for vrom_start, vrom_end, prom_start, prom_end in entries:
+        if prom_start == 0xFFFFFFFF:
+            table.append((vrom_start, vrom_end, prom_start, prom_end))
+            continue
+        if prom_end == 0:
+            data = buffer[prom_start:prom_start + vrom_end - vrom_start]
+        else:
+            data = yaz0_decompress(bytes(buffer[prom_start:prom_end]))
+        out[vrom_start:vrom_end] = data
+        table.append((vrom_start, vrom_end, vrom_start, 0))
+
+    dmadata_offset = table[2][0]
+    for index, entry in enumerate(table):
+        _dma_entry.pack_into(out, dmadata_offset + index * 16, *entry)
+    return out
+
+
+# Recomputes the CIC-6105 header checksum at 0x10 (used by both OoT and MM)
+def update_crc(buffer):
+    seed = 0xDF26F436
+    t1 = t2 = t3 = t4 = t5 = t6 = seed
+    words = struct.unpack_from('>262144I', buffer, 0x1000)
+    boot = struct.unpack_from('>64I', buffer, 0x0750)
+    for i, d in enumerate(words):
+        if (t6 + d) & 0xFFFFFFFF < t6:
+            t4 = (t4 + 1) & 0xFFFFFFFF
+        t6 = (t6 + d) & 0xFFFFFFFF
+        t3 ^= d
+        shift = d & 0x1F
+        r = ((d << shift) | (d >> (32 - shift))) & 0xFFFFFFFF
+        t5 = (t5 + r) & 0xFFFFFFFF
+        if t2 > d:
+            t2 ^= r
+        else:
+            t2 ^= t6 ^ d
+        t1 = (t1 + (boot[i & 0x3F] ^ d)) & 0xFFFFFFFF
+    struct.pack_into('>II', buffer, 0x10, t6 ^ t4 ^ t3, t5 ^ t2 ^ t1)
+    return buffer
+
+
+_compressor = None
+
+# Returns the compressor shared by every seed generated in this process.
+# `cache_dir` -> the --cache_dir, the blobs go to a hidden directory in it,
+#                which the result cache doesn't count as one of its entries
+def get_compressor(workers=None, cache_dir=None):
+    global _compressor
+    if _compressor is None:
+        _compressor = RomCompressor(workers, os.path.join(cache_dir, '.yaz0') if cache_dir is not None else None)
+    return _compressor
@@ -0,0 +1,435 @@
+'''
+Declarative rules:
+The access rules of Rules.py are built from these nodes instead of nested
+lambdas, e.g.
+
+    Form('Human') | (Form('Deku') & (Has('Moons Tear') | Can('Gainer')))
+
+`&` and `|` build And and Or nodes, which flatten into each other, and
+`compile` turns a whole tree into one flat Python function (one boolean
+expression over `state.prog_items` where possible). The tree stays on
+the spot for introspection, see `Rules.set_rule`.
+
+  Has(item)            the item has been collected
+  Count(item, count)   at least `count` of the item have been collected
+  Form(form)           Link can take the form ('Human', 'Deku', 'Goron', 'Zora')
+  CanUse(item)         the item can be used (some items need the Human form)
+  Can(trick)           the trick is allowed
+  Reach(name, kind)    the Region/Entrance/Location can be reached
+  Hearts(count)        Link has at least `count` hearts
+  Call(method, *args)  any other CollectionState method, e.g. Call('can_pop_balloon')
+  Lambda(function)     a plain function of the state, evaluated as is
+  And/Or/Not, TRUE/FALSE
+
+Item rules (`Location.item_rule`) use the same machinery on the item:
+ItemIsNot(name), And, Or and Lambda.
+
+The CollectionState helpers made of items (`can_blast`, `has_hearts`, ...)
+are defined once, as rules, in HELPERS: CollectionState evaluates them
+through `helper_function` and Requirements.py reads the items they need
+from them.
+'''
+
+# The mask giving each form, see `CollectionState.form`
+FORM_ITEMS = {'Deku': 'Deku Mask', 'Goron': 'Goron Mask', 'Zora': 'Zora Mask', 'Human': 'Fierce Deity Mask'}
+# Items only the Human form can use, see `CollectionState.can_use`
+HUMAN_ITEMS = frozenset(['Hookshot', 'Bow'])
+# see `CollectionState.has_paper`
+PAPER_ITEMS = ['Town Title Deed', 'Swamp Title Deed', 'Mountain Title Deed', 'Ocean Title Deed', 'Letter to Mama', 'Letter to Anju']  # TODO: needs more?
+
+
+'''
+RuleCompiler object:
+Collects the values a generated function refers to by name.
+`argument` is the name of the function's argument: 'state' or 'item'.
+'''
+class RuleCompiler(object):
+
+    def __init__(self, argument):
+        self.argument = argument
+        self.names = {}
+
+    def bind(self, value, prefix='_value'):
+        name = '%s%d' % (prefix, len(self.names))
+        self.names[name] = value
+        return name
+
+
+class Rule(object):
+
+    def __and__(self, other):
+        return And(self, as_rule(other))
+
+    def __rand__(self, other):
+        return And(as_rule(other), self)
+
+    def __or__(self, other):
+        return Or(self, as_rule(other))
+
+    def __ror__(self, other):
+        return Or(as_rule(other), self)
+
+    def __invert__(self):
+        return Not(self)
+
+    def children(self):
+        return []
+
+    # Yields this node and every node below it
+    def walk(self):
+        yield self
+        for child in self.children():
+            yield from child.walk()
+
+    # Returns the Python expression evaluating this node
+    def source(self, compiler):
+        raise NotImplementedError()
+
+    def compile(self, argument='state'):
+        return compile_rule(self, argument)
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join(repr(arg) for arg in self.args()))
+
+    def args(self):
+        return []
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.args() == other.args()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((type(self), tuple(self.args())))
+
+
+class Const(Rule):
+
+    def __init__(self, value):
+        self.value = bool(value)
+
+    def source(self, compiler):
+        return repr(self.value)
+
+    def args(self):
+        return [self.value]
+
+    def __repr__(self):
+        return 'TRUE' if self.value else 'FALSE'
+
+    # pickled as the module level TRUE and FALSE, so they stay single objects
+    def __reduce__(self):
+        return 'TRUE' if self.value else 'FALSE'
+
+TRUE = Const(True)
+FALSE = Const(False)
+
+
+class Has(Rule):
+
+    def __init__(self, item):
+        self.item = item
+
+    def source(self, compiler):
+        return '%r in items' % self.item
+
+    def args(self):
+        return [self.item]
+
+
+class Count(Rule):
+
+    def __init__(self, item, count):
+        self.item = item
+        self.count = count
+
+    def source(self, compiler):
+        if self.count <= 0:
+            return 'True'
+        if self.count == 1:
+            return '%r in items' % self.item
+        return 'items.count(%r) >= %d' % (self.item, self.count)
+
+    def args(self):
+        return [self.item, self.count]
+
+
+class Form(Rule):
+
+    def __init__(self, form):
+        self.form = form
+
+    def source(self, compiler):
+        if self.form not in FORM_ITEMS:
+            return 'False'
+        return '%r in items' % FORM_ITEMS[self.form]
+
+    def args(self):
+        return [self.form]
+
+
+class CanUse(Rule):
+
+    def __init__(self, item):
+        self.item = item
+
+    def source(self, compiler):
+        if self.item in HUMAN_ITEMS:
+            return '(%s and %r in items)' % (Form('Human').source(compiler), self.item)
+        return '%r in items' % self.item
+
+    def args(self):
+        return [self.item]
+
+
+class Hearts(Rule):
+
+    def __init__(self, count):
+        self.count = count
+
+    # `CollectionState.heart_count`: Heart Containers, every 4 Pieces of Heart and 3 to start with
+    def source(self, compiler):
+        if self.count <= 3:
+            return 'True'
+        return "(items.count('Heart Container') + items.count('Piece of Heart') // 4 + 3 >= %d)" % self.count
+
+    # The same in items: every number of Heart Containers with the Pieces of Heart making up the rest
+    def expand(self):
+        needed = self.count - 3
+        if needed <= 0:
+            return TRUE
+        return Or(*[And(Count('Heart Container', containers), Count('Piece of Heart', 4 * (needed - containers)))
+                    for containers in range(needed + 1)])
+
+    def args(self):
+        return [self.count]
+
+
+class Call(Rule):
+
+    def __init__(self, method, *arguments):
+        self.method = method
+        self.arguments = list(arguments)
+
+    def source(self, compiler):
+        return 'state.%s(%s)' % (self.method, ', '.join(repr(argument) for argument in self.arguments))
+
+    def args(self):
+        return [self.method] + self.arguments
+
+
+class Can(Call):
+
+    def __init__(self, trick):
+        super().__init__('can', trick)
+
+    def args(self):
+        return self.arguments
+
+
+class Reach(Rule):
+
+    def __init__(self, name, kind='Region'):
+        self.name = name
+        self.kind = kind
+
+    def source(self, compiler):
+        return 'state.can_reach(%r, %r)' % (self.name, self.kind)
+
+    def args(self):
+        return [self.name] if self.kind == 'Region' else [self.name, self.kind]
+
+
+class Lambda(Rule):
+
+    def __init__(self, function):
+        self.function = function
+
+    def source(self, compiler):
+        return '%s(%s)' % (compiler.bind(self.function, '_rule'), compiler.argument)
+
+    def args(self):
+        return [self.function]
+
+
+class ItemIsNot(Rule):
+
+    def __init__(self, item):
+        self.item = item
+
+    def source(self, compiler):
+        return 'item.name != %r' % self.item
+
+    def args(self):
+        return [self.item]
+
+
+class Not(Rule):
+
+    def __init__(self, rule):
+        self.rule = as_rule(rule)
+
+    def children(self):
+        return [self.rule]
+
+    def source(self, compiler):
+        return '(not %s)' % self.rule.source(compiler)
+
+    def args(self):
+        return [self.rule]
+
+
+class And(Rule):
+
+    def __init__(self, *rules):
+        self.rules = []
+        for rule in rules:
+            rule = as_rule(rule)
+            for child in (rule.rules if isinstance(rule, And) else [rule]):
+                if child != TRUE and child not in self.rules:
+                    self.rules.append(child)
+
+    def children(self):
+        return self.rules
+
+    def source(self, compiler):
+        if FALSE in self.rules:
+            return 'False'
+        forbidden = [rule.item for rule in self.rules if isinstance(rule, ItemIsNot)]
+        parts = [rule.source(compiler) for rule in self.rules if len(forbidden) < 2 or not isinstance(rule, ItemIsNot)]
+        if len(forbidden) > 1:
+            parts.insert(0, 'item.name not in %s' % compiler.bind(frozenset(forbidden), '_items'))
+        if not parts:
+            return 'True'
+        return '(%s)' % ' and '.join(parts) if len(parts) > 1 else parts[0]
+
+    def args(self):
+        return self.rules
+
+    def __repr__(self):
+        if not self.rules:
+            return 'TRUE'
+        return ' & '.join(('(%r)' % rule) if isinstance(rule, Or) else repr(rule) for rule in self.rules)
+
+
+class Or(Rule):
+
+    def __init__(self, *rules):
+        self.rules = []
+        for rule in rules:
+            rule = as_rule(rule)
+            for child in (rule.rules if isinstance(rule, Or) else [rule]):
+                if child != FALSE and child not in self.rules:
+                    self.rules.append(child)
+
+    def children(self):
+        return self.rules
+
+    def source(self, compiler):
+        if TRUE in self.rules:
+            return 'True'
+        parts = [rule.source(compiler) for rule in self.rules]
+        if not parts:
+            return 'False'
+        return '(%s)' % ' or '.join(parts) if len(parts) > 1 else parts[0]
+
+    def args(self):
+        return self.rules
+
+    def __repr__(self):
+        if not self.rules:
+            return 'FALSE'
+        return ' | '.join(('(%r)' % rule) if isinstance(rule, And) and len(rule.rules) > 1 else repr(rule) for rule in self.rules)
+
+
+# Turns a bool or a plain function into a rule, rules are returned as they are
+def as_rule(rule):
+    if isinstance(rule, Rule):
+        return rule
+    if isinstance(rule, bool):
+        return TRUE if rule else FALSE
+    if callable(rule):
+        return Lambda(rule)
+    raise TypeError('Not a rule: %r' % (rule,))
+
+
+# The CollectionState helpers made of items, as rules, by method name
+HELPERS = {
+    'can_blast': lambda: (Form('Human') & (Has('Bomb Bag') | Has('Blast Mask'))) | CanUse('Powder Keg'),
+    'can_kill_lizalfos': lambda: Form('Human') | Form('Zora') | Form('Goron'),
+    'can_kill_gekkos': lambda: (Form('Deku') | Call('can_blast') | Form('Goron')) & CanUse('Bow'),
+    'can_pop_balloon': lambda: Form('Zora') | (Form('Deku') & Has('Magic Meter')) | (Form('Human') & (Has('Bow') | Has('Hookshot'))),
+    'any_form_but': lambda form: Or(*[Form(other) for other in ['Deku', 'Human', 'Goron', 'Zora'] if other != form]),
+    'has_paper': lambda: Or(*[Has(paper) for paper in PAPER_ITEMS]),
+    'has_fire_source': lambda: Has('Bow') & Has('Fire Arrows') & Has('Magic Meter'),
+    'has_hearts': Hearts,
+}
+
+_helpers = {}
+
+# Returns the compiled function of the helper `method` called with `arguments`
+def helper_function(method, *arguments):
+    key = (method,) + arguments
+    function = _helpers.get(key)
+    if function is None:
+        function = _helpers[key] = HELPERS[method](*arguments).compile()
+    return function
+
+
+# compiled functions by their source, identical rules share one function
+_compiled = {}
+
+# Returns the source of the function `compile_rule` makes and the compiler
+# holding the values it refers to
+def rule_source(rule, argument='state'):
+    compiler = RuleCompiler(argument)
+    expression = rule.source(compiler)
+    lines = ['def rule(%s):' % argument]
+    if argument == 'state' and 'items' in expression:
+        lines.append('    items = state.prog_items')
+    lines.append('    return %s' % expression)
+    return '\n'.join(lines), compiler
+
+# Returns one flat function of `argument` ('state' or 'item') evaluating `rule`
+def compile_rule(rule, argument='state'):
+    source, compiler = rule_source(rule, argument)
+
+    if not compiler.names:
+        function = _compiled.get((argument, source))
+        if function is not None:
+            return function
+
+    namespace = dict(compiler.names)
+    exec(compile(source, '<rule %s>' % repr(rule)[:200], 'exec'), namespace)
+    function = namespace['rule']
+    function.rule = rule
+    function.source = source
+    if not compiler.names:
+        _compiled[(argument, source)] = function
+    return function
+
+# Compiles the functions of many (rule, argument) pairs as one module.
+# Returns the (rule, argument, source) entries it holds and its code object,
+# `load_rules` puts them into the cache of `compile_rule`. Rules referring
+# to values (Lambda, sets of items) are left out.
+def compile_rules(rules):
+    entries = []
+    seen = set()
+    for rule, argument in rules:
+        source, compiler = rule_source(rule, argument)
+        if compiler.names or (argument, source) in seen:
+            continue
+        seen.add((argument, source))
+        entries.append((rule, argument, source))
+    module = '\n'.join(source.replace('def rule(', 'def _rule%d(' % index, 1) for index, (_, _, source) in enumerate(entries))
+    return entries, compile(module, '<rules>', 'exec')
+
+def load_rules(entries, code):
+    namespace = {}
+    exec(code, namespace)
+    for index, (rule, argument, source) in enumerate(entries):
+        function = namespace['_rule%d' % index]
+        function.rule = rule
+        function.source = source
+        _compiled.setdefault((argument, source), function)
@@ -0,0 +1,98 @@
+import time
+
+'''
+Rule profiler:
+The access rules of Rules.py are anonymous lambdas, so a profiler shows
+them all as `<lambda>`. With `--rule_profile` every `access_rule`,
+`item_rule` and `always_allow` of the world's Entrances and Locations is
+wrapped with a timer named after its spot while the seed is generated,
+and a report of the hottest rules is written next to the spoiler log.
+
+`cumulative` includes the time of the rules a rule reaches through
+`state.can_reach`, `own` does not, so sorting by `own` shows the logic
+that is actually expensive. Only the generating world is profiled, the
+copy the playthrough runs on is not.
+'''
+
+RULE_KINDS = ['access_rule', 'item_rule', 'always_allow']
+
+
+'''
+RuleStats object:
+Call count and time of one rule of one spot.
+'''
+class RuleStats(object):
+
+    def __init__(self, kind, spot):
+        self.kind = kind
+        self.spot = spot
+        self.calls = 0
+        self.cumulative = 0.0 # seconds, including the rules evaluated inside this one
+        self.own = 0.0        # seconds, excluding them
+
+
+'''
+RuleProfiler object:
+Wraps the rules of `world` on creation, `uninstall` puts the originals back.
+'''
+class RuleProfiler(object):
+
+    def __init__(self, world):
+        self.world = world
+        self.stats = {}
+        self.running = [] # time spent in nested rules, one entry per rule being evaluated
+        self.wrapped = []
+        self.install()
+
+    def install(self):
+        spots = [entrance for region in self.world.regions for entrance in region.exits] + self.world.get_locations()
+        for spot in spots:
+            for kind in RULE_KINDS:
+                rule = getattr(spot, kind, None)
+                if rule is None:
+                    continue
+                # a seed that failed may have left its wrappers in a warm world
+                rule = getattr(rule, 'profiled_rule', rule)
+                setattr(spot, kind, self.wrap(kind, spot.name, rule))
+                self.wrapped.append((spot, kind, rule))
+
+    def uninstall(self):
+        for spot, kind, rule in self.wrapped:
+            setattr(spot, kind, rule)
+        self.wrapped = []
+
+    def wrap(self, kind, spot_name, rule):
+        stats = self.stats.get((kind, spot_name))
+        if stats is None:
+            stats = self.stats[(kind, spot_name)] = RuleStats(kind, spot_name)
+        running = self.running
+
+        def profiled(*args):
+            running.append(0.0)
+            start = time.perf_counter()
+            try:
+                return rule(*args)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = running.pop()
+                stats.calls += 1
+                stats.cumulative += elapsed
+                stats.own += elapsed - nested
+                if running:
+                    running[-1] += elapsed
+        profiled.profiled_rule = rule
+        return profiled
+
+    # Returns the stats of every rule that was called, the most expensive first
+    def hot_rules(self, key='own'):
+        return sorted((stats for stats in self.stats.values() if stats.calls), key=lambda stats: getattr(stats, key), reverse=True)
+
+    def report(self, limit=None):
+        rules = self.hot_rules()
+        total = sum(stats.own for stats in rules)
+        lines = ['Rule profile of seed %s: %d rules called, %.3fs spent in rules' % (self.world.seed, len(rules), total),
+                 '',
+                 '%10s %10s %10s %10s %6s  %-12s %s' % ('calls', 'own', 'cumulative', 'per call', 'own %', 'rule', 'spot')]
+        for stats in rules[:limit]:
+            lines.append('%10d %10.4f %10.4f %10.2e %6.1f  %-12s %s' % (stats.calls, stats.own, stats.cumulative, stats.cumulative / stats.calls, 100 * stats.own / total if total else 0, stats.kind, stats.spot))
+        return '\n'.join(lines) + '\n'
@@ -1,6 +1,8 @@
 import collections
 import logging
 
+from RuleNodes import TRUE, And, Or, Has, Count, Form, CanUse, Can, Reach, Call, ItemIsNot, as_rule
+
 
 def set_rules(world):
     global_rules(world)
@@ -16,29 +18,35 @@ def set_rules(world):
         set_rule(world.get_entrance('Rainbow Bridge'), lambda state: state.has('Forest Medallion') and state.has('Fire Medallion') and state.has('Water Medallion') and state.has('Shadow Medallion') and state.has('Spirit Medallion') and state.has('Light Medallion') and state.has('Kokiri Emerald') and state.has('Goron Ruby') and state.has('Zora Sapphire'))
     '''
 
+# `rule` -> a RuleNodes rule, a function of the state or a bool
 def set_rule(spot, rule):
-    spot.access_rule = rule
+    spot.rule = as_rule(rule)
+    spot.access_rule = spot.rule.compile()
 
 def set_always_allow(spot, rule):
     spot.always_allow = rule
 
 
 def add_rule(spot, rule, combine='and'):
-    old_rule = spot.access_rule
     if combine == 'or':
-        spot.access_rule = lambda state: rule(state) or old_rule(state)
+        set_rule(spot, Or(rule, spot.rule))
     else:
-        spot.access_rule = lambda state: rule(state) and old_rule(state)
+        set_rule(spot, And(rule, spot.rule))
+
+
+# `rule` -> a RuleNodes rule on the item, or a function of the item
+def set_item_rule(location, rule):
+    location.item_rule_node = as_rule(rule)
+    location.item_rule = location.item_rule_node.compile('item')
 
 
 def forbid_item(location, item):
-    old_rule = location.item_rule
-    location.item_rule = lambda i: i.name != item and old_rule(i)
+    set_item_rule(location, And(ItemIsNot(item), location.item_rule_node))
 
 
 def item_in_locations(state, item, locations):
-    for location in locations:
-        if item_name(state, location) == item:
+    for location in state.world.find_items(item):
+        if location.name in locations:
             return True
     return False
 
@@ -51,24 +59,24 @@ def item_name(state, location):
 
 def global_rules(world):
     set_rule(world.get_entrance('Clock Tower Twisted Hallway'), False)
-    set_rule(world.get_location('First Nut'), lambda state: state.form('Deku'))
+    set_rule(world.get_location('First Nut'), Form('Deku'))
     # set_rule(world.get_location('Clock Town GF Reward'), lambda state: state.has('CT SF', 1))
-    set_rule(world.get_location('Woodfall GF Reward'), lambda state: state.has('WF SF', 15))
-    set_rule(world.get_location('Snowhead GF Reward'), lambda state: state.has('SH SF', 15))
-    set_rule(world.get_location('Great Bay GF Reward'), lambda state: state.has('GB SF', 15))
-    set_rule(world.get_location('Stone Tower GF Reward'), lambda state: state.has('ST SF', 15))
+    set_rule(world.get_location('Woodfall GF Reward'), Count('WF SF', 15))
+    set_rule(world.get_location('Snowhead GF Reward'), Count('SH SF', 15))
+    set_rule(world.get_location('Great Bay GF Reward'), Count('GB SF', 15))
+    set_rule(world.get_location('Stone Tower GF Reward'), Count('ST SF', 15))
 
-    set_rule(world.get_location('Clock Town Mailbox HP'), lambda state: state.can_use('Postman Hat'))
-    set_rule(world.get_location('Swamp Business Scrub'), lambda state: state.has('Town Title Deed') and state.form('Human'))
+    set_rule(world.get_location('Clock Town Mailbox HP'), CanUse('Postman Hat'))
+    set_rule(world.get_location('Swamp Business Scrub'), Has('Town Title Deed') & Form('Human'))
 
-    set_rule(world.get_location('Mountain Business Scrub'), lambda state: state.has('Swamp Title Deed') and state.form('Deku'))
-    set_rule(world.get_location('Ocean Business Scrub'), lambda state: state.has('Mountain Title Deed') and state.form('Goron'))
-    set_rule(world.get_location('Canyon Business Scrub'), lambda state: state.has('Ocean Title Deed') and state.form('Zora'))
+    set_rule(world.get_location('Mountain Business Scrub'), Has('Swamp Title Deed') & Form('Deku'))
+    set_rule(world.get_location('Ocean Business Scrub'), Has('Mountain Title Deed') & Form('Goron'))
+    set_rule(world.get_location('Canyon Business Scrub'), Has('Ocean Title Deed') & Form('Zora'))
 
-    set_rule(world.get_location('Song From HMS'), lambda state: state.has('Ocarina of Time'))
-    set_rule(world.get_location('Remove the Cursed Mask'), lambda state: state.has('Ocarina of Time'))
+    set_rule(world.get_location('Song From HMS'), Has('Ocarina of Time'))
+    set_rule(world.get_location('Remove the Cursed Mask'), Has('Ocarina of Time'))
 
-    set_rule(world.get_location('Tunnel Balloon From ECT'), lambda state: state.can_pop_balloon())
+    set_rule(world.get_location('Tunnel Balloon From ECT'), Call('can_pop_balloon'))
     # @Vlix
     # that's right, zora link should be able to slice it, good call
     # other human items, hmm... hookshot probly? maybe bombs? lol that'd be a pain; yeah we'll have to do some testing
@@ -82,29 +90,28 @@ def global_rules(world):
     # Ledge Rupee Chest' if we want lol
 
     ### SOUTH CLOCK TOWN
-    set_rule(world.get_location('Clock Town Business Scrub'), lambda state: state.has('Moons Tear'))
-    set_rule(world.get_location('Clock Tower Platform HP'), lambda state: state.form('Human') or state.form('Zora') or (state.form('Deku') and (state.has('Moons Tear') or state.can('Gainer'))))
+    set_rule(world.get_location('Clock Town Business Scrub'), Has('Moons Tear'))
+    set_rule(world.get_location('Clock Tower Platform HP'), Form('Human') | Form('Zora') | (Form('Deku') & (Has('Moons Tear') | Can('Gainer'))))
 
-    set_rule(world.get_location('Festival Tower Rupee Chest'), lambda state: state.can_use('Hookshot') or (state.form('Deku') and state.has('Moons Tear')))
-    set_rule(world.get_location('SCT 20 Rupee Chest'), lambda state: state.can_use('Hookshot')
-                or (state.form('Deku') and state.has('Moons Tear') and (state.form('Human') or state.form('Zora'))))
+    set_rule(world.get_location('Festival Tower Rupee Chest'), CanUse('Hookshot') | (Form('Deku') & Has('Moons Tear')))
+    set_rule(world.get_location('SCT 20 Rupee Chest'), CanUse('Hookshot') | (Form('Deku') & Has('Moons Tear') & (Form('Human') | Form('Zora'))))
 
-    set_rule(world.get_location('Ocarina of Time'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Song from Skull Kid'), lambda state: state.can_pop_balloon())
+    set_rule(world.get_location('Ocarina of Time'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Song from Skull Kid'), Call('can_pop_balloon'))
     # is this right? it looks like the check is just to hit skull kid in the air, functionally the same as popping a balloon lol
-    set_rule(world.get_entrance('End of First Cycle'), lambda state: state.has('Song of Time'))
+    set_rule(world.get_entrance('End of First Cycle'), Has('Song of Time'))
     set_rule(world.get_entrance('Moon Portal'),
-             lambda state: [state.has(x) for x in ['Oath to Order', 'Odolwas Remains', 'Ghots Remains', 'Gyorgs Remains', 'Twinmolds Remains']].count(True) == 5)
-    set_rule(world.get_entrance('To Clock Tower Rooftop'), lambda state: state.form('Human') or state.form('Zora') or (state.form('Deku') and (state.has('Moons Tear') or state.can('Gainer'))))
+             Has('Oath to Order') & Has('Odolwas Remains') & Has('Ghots Remains') & Has('Gyorgs Remains') & Has('Twinmolds Remains'))
+    set_rule(world.get_entrance('To Clock Tower Rooftop'), Form('Human') | Form('Zora') | (Form('Deku') & (Has('Moons Tear') | Can('Gainer'))))
 
-    set_rule(world.get_location('Clock Town Owl Statue'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Clock Town Owl Statue'), Form('Human'))
 
-    set_rule(world.get_entrance('Clock Town North Gate'), lambda state: state.form('Human') or state.form('Goron') or state.form('Zora') or state.can('Clock Town Guard Skip'))
+    set_rule(world.get_entrance('Clock Town North Gate'), Form('Human') | Form('Goron') | Form('Zora') | Can('Clock Town Guard Skip'))
 
 
     ### LAUNDRY POOL
-    set_rule(world.get_location('Listen To Guru Guru'), lambda state: state.form('Human') or state.form('Zora') or state.form('Goron'))
-    set_rule(world.get_location('Don Gero Town Frog'), lambda state: state.can_use('Don Gero Mask'))
+    set_rule(world.get_location('Listen To Guru Guru'), Form('Human') | Form('Zora') | Form('Goron'))
+    set_rule(world.get_location('Don Gero Town Frog'), CanUse('Don Gero Mask'))
 
     # set_rule(world.get_entrance('Curiosity Backroom Entrance'), lambda state: state.event('Something about the a+k quest'))
     # set_rule(world.get_location('Keaton Mask From Kafei'), lambda state: state.event('Something about the a+k quest'))
@@ -115,7 +122,7 @@ def global_rules(world):
 
 
     ### WEST CLOCK TOWN
-    set_rule(world.get_location('Rosa Sisters HP'), lambda state: state.can_use('Kamaro Mask'))
+    set_rule(world.get_location('Rosa Sisters HP'), CanUse('Kamaro Mask'))
 
     # you might not need to be human to get this, but I'd bet the shop owner won't sell to other forms, at least deku
     # set_rule(world.get_location('Buy Bomb Bag'), lambda state: True)
@@ -128,32 +135,32 @@ def global_rules(world):
     # set_rule(world.get_location('Hidden Owl Statue'), lambda state: state.can_do_some_glitch_or_something())
     # I actually have no idea what the check is here lol
 
-    set_rule(world.get_location('Buy Bigger Bomb Bag'), lambda state: state.form('Human') or state.form('Zora') or state.has('Adult Wallet'))
+    set_rule(world.get_location('Buy Bigger Bomb Bag'), Form('Human') | Form('Zora') | Has('Adult Wallet'))
     # adult wallet is a req because if you don't rescue the old lady from sakon, the big bomb bag shows up in the
     # curiosity shop on the final day (still might be form restrictions?)
 
-    set_rule(world.get_location('Sword School HP'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Sword School HP'), Form('Human'))
 
     # i swear this should be an optional trick, it's so hard without the bunny hood lol
     # set_rule(world.get_location('Counting Is Hard'), lambda state: True)
     # sigh alright we'll make this open lol
 
-    set_rule(world.get_location('Buy All Night Mask'), lambda state: state.form('Human') and state.has('Giants Wallet'))
+    set_rule(world.get_location('Buy All Night Mask'), Form('Human') & Has('Giants Wallet'))
     # you need to save the bomb lady from sakon and this will be in the curio shop on the final day for 500 rupees
     # being human might be a hard req, but you can probly buy it as zora (todo: test that)
 
-    set_rule(world.get_location('Deliver Letter to Mama To Postman'), lambda state: state.has('Letter to Mama'))
+    set_rule(world.get_location('Deliver Letter to Mama To Postman'), Has('Letter to Mama'))
 
-    set_rule(world.get_entrance('Clock Town West Gate'), lambda state: state.form('Human') or state.form('Goron') or state.form('Zora') or state.can('Clock Town Guard Skip'))
+    set_rule(world.get_entrance('Clock Town West Gate'), Form('Human') | Form('Goron') | Form('Zora') | Can('Clock Town Guard Skip'))
 
 
     ### NORTH CLOCK TOWN
     # I don't know that this item matters at all or if we should even have a spot for it
     # but we can if we want, you get it the same way you get the code in the first cycle, you just have to be human to
     # get the actual notebook from them I think
-    set_rule(world.get_location('Bomber Notebook'), lambda state: state.can_pop_balloon() and state.form('Human'))
+    set_rule(world.get_location('Bomber Notebook'), Call('can_pop_balloon') & Form('Human'))
 
-    set_rule(world.get_location('Bomber Code'), lambda state: state.can_pop_balloon() and (state.form('Human') or state.form('Deku')))
+    set_rule(world.get_location('Bomber Code'), Call('can_pop_balloon') & (Form('Human') | Form('Deku')))
     # set_rule(world.get_location('Bomber Code'), lambda state: state.has('Magic Meter') and state.form('Deku'))
     # for the bomber code, it's essentially only can_reach('pop NCT balloon'), you don't need to be human
     # you know, for the popping the balloon test, that might just be a general state.can('pop balloon')
@@ -162,25 +169,25 @@ def global_rules(world):
     # since getting the blast mask just involves slashing sakon, it might be possible to get it with other forms? like
     # maybe zora? probly not goron though
     # also you might need to be link to talk to the lady after, so maybe it is only human
-    set_rule(world.get_location('Foil Sakon'), lambda state: state.form('Human') or state.form('Zora'))
+    set_rule(world.get_location('Foil Sakon'), Form('Human') | Form('Zora'))
 
-    set_rule(world.get_location('NCT Tree HP'), lambda state: state.form('Human') or state.form('Zora'))
+    set_rule(world.get_location('NCT Tree HP'), Form('Human') | Form('Zora'))
     # I thought deku could get this for some reason
     # also lol of course goron can't, shoulda known
 
-    set_rule(world.get_location('Clock Town Tingle Clock Town Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Clock Town Tingle Woodfall Map'), lambda state: state.can_pop_balloon())
+    set_rule(world.get_location('Clock Town Tingle Clock Town Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Clock Town Tingle Woodfall Map'), Call('can_pop_balloon'))
     # it's not the same balloon as for bombers, but the same checks apply
 
-    set_rule(world.get_location('NCT Keaton HP'), lambda state: state.can_use('Keaton Mask'))
+    set_rule(world.get_location('NCT Keaton HP'), CanUse('Keaton Mask'))
 
-    set_rule(world.get_entrance('To Deku Playground'), lambda state: state.form('Deku') or state.can('Gainer'))
+    set_rule(world.get_entrance('To Deku Playground'), Form('Deku') | Can('Gainer'))
     # I'm sure there are various ways to get over this fence aside from deku
     # todo: find ways of bypassing this fence
-    set_rule(world.get_location('Deku Scrub Playground HP'), lambda state: state.form('Deku'))
+    set_rule(world.get_location('Deku Scrub Playground HP'), Form('Deku'))
 
-    set_rule(world.get_location('Clock Town GF Magic Bar'), lambda state: state.any_form_but('Goron'))
-    set_rule(world.get_location('Clock Town GF Mask'), lambda state: state.has('Deku Mask'))
+    set_rule(world.get_location('Clock Town GF Magic Bar'), Call('any_form_but', 'Goron'))
+    set_rule(world.get_location('Clock Town GF Mask'), Has('Deku Mask'))
     # the thing the great fairy gives you depends on the cycle... I think? so I'm not sure how to
     # handle this/these checks
     # also, is goron the only form that can't get a stray fairy? it might be able to anyway, by getting the laundry pool
@@ -192,37 +199,37 @@ def global_rules(world):
     # right?
     # so what if you start as goron or zora? not sure how that all works
 
-    set_rule(world.get_entrance('Clock Town North Gate'), lambda state: state.form('Human') or state.form('Goron') or state.form('Zora') or state.can('Clock Town Guard Skip'))
+    set_rule(world.get_entrance('Clock Town North Gate'), Form('Human') | Form('Goron') | Form('Zora') | Can('Clock Town Guard Skip'))
 
     ### EAST CLOCK TOWN
-    set_rule(world.get_location('ECT 100 Rupee Chest'), lambda state: state.form('Human') or state.can('Goron Boost') or state.can('Gainer') or state.form('Zora'))
+    set_rule(world.get_location('ECT 100 Rupee Chest'), Form('Human') | Can('Goron Boost') | Can('Gainer') | Form('Zora'))
     # I need to figure out all the actual requirements for this, including tricks, so this one is tentative
     # also the trick names are guesses for sure
 
-    set_rule(world.get_location('Treasure Chest Game Goron Prize'), lambda state: state.form('Goron'))
+    set_rule(world.get_location('Treasure Chest Game Goron Prize'), Form('Goron'))
     # oooh I didn't think about it before, do we want to include all the prizes for this?
-    set_rule(world.get_location('Treasure Chest Game Human Prize'), lambda state: state.form('Human'))
-    set_rule(world.get_location('Treasure Chest Game Zora Prize'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Treasure Chest Game Deku Prize'), lambda state: state.form('Deku'))
-
-    set_rule(world.get_entrance('Bomber Bouncer'), lambda state: state.has('Bomber Code'))
-    set_rule(world.get_location('Bomber Tunnel Chest'), lambda state: state.can_blast() and (state.form('Human') or state.form('Zora')))
-    set_rule(world.get_entrance('Tunnel Balloon From ECT'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Tunnel Balloon From Observatory'), lambda state: state.can_pop_balloon() or state.form('Human'))
+    set_rule(world.get_location('Treasure Chest Game Human Prize'), Form('Human'))
+    set_rule(world.get_location('Treasure Chest Game Zora Prize'), Form('Zora'))
+    set_rule(world.get_location('Treasure Chest Game Deku Prize'), Form('Deku'))
+
+    set_rule(world.get_entrance('Bomber Bouncer'), Has('Bomber Code'))
+    set_rule(world.get_location('Bomber Tunnel Chest'), Call('can_blast') & (Form('Human') | Form('Zora')))
+    set_rule(world.get_entrance('Tunnel Balloon From ECT'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Tunnel Balloon From Observatory'), Call('can_pop_balloon') | Form('Human'))
     # set_rule(world.get_location('Moon Cry'), lambda state: True)
-    set_rule(world.get_location('Watch Business Scrub Fly'), lambda state: state.has('Town Title Deed'))
+    set_rule(world.get_location('Watch Business Scrub Fly'), Has('Town Title Deed'))
 
-    set_rule(world.get_location('Honey and Darling Grand Champion'), lambda state: state.has('Bomb Bag') and state.has('Bow') and state.form('Human'))
-    set_rule(world.get_location('Town Shooting Gallery Quiver Prize'), lambda state: state.can_use('Bow'))
-    set_rule(world.get_location('Town Shooting Gallery HP Prize'), lambda state: state.can_use('Bow') or state.options('NoHardestArchery'))
+    set_rule(world.get_location('Honey and Darling Grand Champion'), Has('Bomb Bag') & Has('Bow') & Form('Human'))
+    set_rule(world.get_location('Town Shooting Gallery Quiver Prize'), CanUse('Bow'))
+    set_rule(world.get_location('Town Shooting Gallery HP Prize'), CanUse('Bow') | Call('options', 'NoHardestArchery'))
 
-    set_rule(world.get_location('Expert Person Solver Takes the Case'), lambda state: state.form('Human') or state.form('Goron') or state.form('Zora'))
+    set_rule(world.get_location('Expert Person Solver Takes the Case'), Form('Human') | Form('Goron') | Form('Zora'))
 
-    set_rule(world.get_entrance('To Stock Pot Inn Secret Entrance'), lambda state: state.form('Deku'))
-    set_rule(world.get_location('Stock Pot Inn Key'), lambda state: state.any_form_but('Deku'))
-    set_rule(world.get_location('Have you seen this man?'), lambda state: state.can_use('Kafei Mask'))
-    set_rule(world.get_location('Your Room Rupee Chest'), lambda state: state.has('Inn Key'))
-    set_rule(world.get_location('Anjus Room Rupee Chest'), lambda state: state.has('Inn Key') or state.form('Deku'))
+    set_rule(world.get_entrance('To Stock Pot Inn Secret Entrance'), Form('Deku'))
+    set_rule(world.get_location('Stock Pot Inn Key'), Call('any_form_but', 'Deku'))
+    set_rule(world.get_location('Have you seen this man?'), CanUse('Kafei Mask'))
+    set_rule(world.get_location('Your Room Rupee Chest'), Has('Inn Key'))
+    set_rule(world.get_location('Anjus Room Rupee Chest'), Has('Inn Key') | Form('Deku'))
     # ok, so these chests
     # the one for your room requires the room key regardless, right?
     # the anju room one is accessible only after midnight on the 3rd day, so you just need to get into the inn somehow
@@ -231,10 +238,10 @@ def global_rules(world):
     # the other option would be to create another logical area ex: 'Stock Pot Inn After Hours'
     # and the item checks there would be open
     # which we can do, either way works
-    set_rule(world.get_location('Grandma Stories HP 1'), lambda state: state.can_use('All Night Mask'))
-    set_rule(world.get_location('Grandma Stories HP 2'), lambda state: state.can_use('All Night Mask'))
+    set_rule(world.get_location('Grandma Stories HP 1'), CanUse('All Night Mask'))
+    set_rule(world.get_location('Grandma Stories HP 2'), CanUse('All Night Mask'))
 
-    set_rule(world.get_location('Toilet Hand HP'), lambda state: state.has_paper())
+    set_rule(world.get_location('Toilet Hand HP'), Call('has_paper'))
     # you need some kind of paper, so any title deed, or a letter from the various subquests that involve letters
     # that's a lot of different ways to be able to do that, so we may need to have inventory record any subquest item
     # that can be obtained as obtained, so we can just do state.has('any paper') or something
@@ -243,65 +250,57 @@ def global_rules(world):
     # man, this one is involved lol
     # actually you know what, I'm just gonna add state.has_paper()
 
-    set_rule(world.get_entrance('To Milk Bar'), lambda state: state.can_use('Romani Mask'))
-    set_rule(world.get_location('Milk Bar Performance'), lambda state: False not in [state.form(f) for f in ['Human', 'Deku', 'Goron', 'Zora']] and state.has('Ocarina'))
-    set_rule(world.get_location('Delivery to Mama Kafei'), lambda state: state.has('Letter to Mama'))
+    set_rule(world.get_entrance('To Milk Bar'), CanUse('Romani Mask'))
+    set_rule(world.get_location('Milk Bar Performance'), Form('Human') & Form('Deku') & Form('Goron') & Form('Zora') & Has('Ocarina'))
+    set_rule(world.get_location('Delivery to Mama Kafei'), Has('Letter to Mama'))
     # so a note about doing checks for stuff like 'Letter to Mama' and stuff that resets when you save
     # it makes it a hell of a lot easier to be able to do checks for temp items like this
     # but it also probably means setting rules for these items and having locations for them
     # which means we'd have to have some kind of marker for them so they don't get mixed in to the pool
     # possibly issue in the future, just something to note for now
 
-    set_rule(world.get_location('Mayor HP'), lambda state: state.can_use('Couples Mask'))
+    set_rule(world.get_location('Mayor HP'), CanUse('Couples Mask'))
 
-    set_rule(world.get_entrance('Clock Town East Gate'), lambda state: state.form('Human') or state.form('Goron') or state.form('Zora') or state.can('Clock Town Guard Skip'))
+    set_rule(world.get_entrance('Clock Town East Gate'), Form('Human') | Form('Goron') | Form('Zora') | Can('Clock Town Guard Skip'))
 
     ### TERMINA FIELD
-    set_rule(world.get_entrance('Astral Observatory Fence'), lambda state: (state.has('Magic Beans') and state.has('Bottle')) or state.can('Goron Boost'))
+    set_rule(world.get_entrance('Astral Observatory Fence'), (Has('Magic Beans') & Has('Bottle')) | Can('Goron Boost'))
 
-    set_rule(world.get_entrance('TF to Obs Over Fence'), lambda state: state.can('Goron Boost'))
+    set_rule(world.get_entrance('TF to Obs Over Fence'), Can('Goron Boost'))
     # I don't know if there's actually a way to get over this fence from TF, might only be the other way, so I might
     # have remove this later
 
-    set_rule(world.get_location('Learn Kamaro Dance'), lambda state: state.form('Human') or state.form('Goron'))
+    set_rule(world.get_location('Learn Kamaro Dance'), Form('Human') | Form('Goron'))
     # so you have to be able to jump to their platform, which rules out goron and probably deku?
     # (actually maybe not if the goron can do some weird trick or something)
     # dunno if there's a form requirement when you actually talk to them, but I'm gonna assume human for now
     # todo: test form requirements
 
-    set_rule(world.get_entrance('TF Mountain Icicles'), lambda state: state.can_use('Bow') or state.form('Goron'))
-    set_rule(world.get_entrance('TF Great Bay Gate'), lambda state: (state.form('Human') and state.has('Eponas Song'))
-                                                                    or state.can('Some Goron Trick probly'))
-
-    set_rule(world.get_location('Moons Tear'), lambda state: state.event('Moon Cry'))
-
-    set_rule(world.get_entrance('To Mountain Gossips'), lambda state: state.can_blast() or state.form('Goron'))
-    set_rule(world.get_location('Swamp Gossip Check'), lambda state: (state.form('Deku') and state.has('Sonata of Awakening'))
-            or (state.form('Goron') and state.has('Goron Lullaby')) or (state.form('Zora') and state.has('New Wave Bossa Nova')))
-    set_rule(world.get_location('Mountain Gossip Check'), lambda state: (state.form('Deku') and state.has('Sonata of Awakening'))
-            or (state.form('Goron') and state.has('Goron Lullaby')) or (state.form('Zora') and state.has('New Wave Bossa Nova')))
-    set_rule(world.get_location('Ocean Gossip Check'), lambda state: (state.form('Deku') and state.has('Sonata of Awakening'))
-            or (state.form('Goron') and state.has('Goron Lullaby')) or (state.form('Zora') and state.has('New Wave Bossa Nova')))
-    set_rule(world.get_location('Canyon Gossip Check'), lambda state: (state.form('Deku') and state.has('Sonata of Awakening'))
-            or (state.form('Goron') and state.has('Goron Lullaby')) or (state.form('Zora') and state.has('New Wave Bossa Nova')))
-    set_rule(world.get_location('4 Gossip Stone HP'),
-             lambda state: state.event('Swamp Gossip Check') and state.event('Mountain Gossip Check')
-                           and state.event('Ocean Gossip Check') and state.event('Canyon Gossip Check'))
-
-    set_rule(world.get_location('TF Peahat Grotto HP'), lambda state: state.form('Human') or state.form('Goron') or state.form('Zora'))
+    set_rule(world.get_entrance('TF Mountain Icicles'), CanUse('Bow') | Form('Goron'))
+    set_rule(world.get_entrance('TF Great Bay Gate'), (Form('Human') & Has('Eponas Song')) | Can('Some Goron Trick probly'))
+
+    set_rule(world.get_location('Moons Tear'), Call('event', 'Moon Cry'))
+
+    set_rule(world.get_entrance('To Mountain Gossips'), Call('can_blast') | Form('Goron'))
+    set_rule(world.get_location('Swamp Gossip Check'), (Form('Deku') & Has('Sonata of Awakening')) | (Form('Goron') & Has('Goron Lullaby')) | (Form('Zora') & Has('New Wave Bossa Nova')))
+    set_rule(world.get_location('Mountain Gossip Check'), (Form('Deku') & Has('Sonata of Awakening')) | (Form('Goron') & Has('Goron Lullaby')) | (Form('Zora') & Has('New Wave Bossa Nova')))
+    set_rule(world.get_location('Ocean Gossip Check'), (Form('Deku') & Has('Sonata of Awakening')) | (Form('Goron') & Has('Goron Lullaby')) | (Form('Zora') & Has('New Wave Bossa Nova')))
+    set_rule(world.get_location('Canyon Gossip Check'), (Form('Deku') & Has('Sonata of Awakening')) | (Form('Goron') & Has('Goron Lullaby')) | (Form('Zora') & Has('New Wave Bossa Nova')))
+    set_rule(world.get_location('4 Gossip Stone HP'), Call('event', 'Swamp Gossip Check') & Call('event', 'Mountain Gossip Check') & Call('event', 'Ocean Gossip Check') & Call('event', 'Canyon Gossip Check'))
+
+    set_rule(world.get_location('TF Peahat Grotto HP'), Form('Human') | Form('Goron') | Form('Zora'))
     # how many ways to kill a peahat? lol
     # for now I'm gonna assume deku can't, but everyone else can
 
     # set_rule(world.get_location('TF Dodongo Grotto HP'), lambda state: True)
     # ways to kill a dodongo? might be anyone actually
 
-    set_rule(world.get_entrance('To TF Business Scrub Grotto'), lambda state: state.event('Saw Scrub Fly In'))
-    set_rule(world.get_location('TF Business Scrub Grotto HP'), lambda state: state.has('Adult Wallet'))
+    set_rule(world.get_entrance('To TF Business Scrub Grotto'), Call('event', 'Saw Scrub Fly In'))
+    set_rule(world.get_location('TF Business Scrub Grotto HP'), Has('Adult Wallet'))
     # giving the moon's tear to the scrub is part of the connection requirement to get to the grotto, but once there
     # you just need the adult's wallet
 
-    set_rule(world.get_location('TF Beehive Grotto HP'), lambda state: (state.can_blast() or state.form('Goron'))
-                                                                                  and state.can_use('Bow') and state.form('Zora'))
+    set_rule(world.get_location('TF Beehive Grotto HP'), (Call('can_blast') | Form('Goron')) & CanUse('Bow') & Form('Zora'))
     # boulder to get through, then shoot the bees, then drop to the bottom of the pool as zora
     # actually shooting the bees might be possible as zora
     # bees might just be more balloons lol
@@ -309,7 +308,7 @@ def global_rules(world):
 
     # set_rule(world.get_location('TF Chest In The Grass'), lambda state: True)
     # set_rule(world.get_location('TF Deku Baba Pit Chest'), lambda state: True)
-    set_rule(world.get_location('TF Chest On A Stump'), lambda state: state.can_use('Hookshot'))
+    set_rule(world.get_location('TF Chest On A Stump'), CanUse('Hookshot'))
 
     # set_rule(world.get_location(''), lambda state: state)
     # apparently if you look at some guys standing in the field through the telescope, there will be pits where they
@@ -317,36 +316,36 @@ def global_rules(world):
     # todo: test this
 
     set_rule(world.get_entrance('To East Pillar Grotto'),
-             lambda state: state.can_use('Bottle') and state.has('Magic Beans') and (state.form('Human') or state.form('Zora')))
+             CanUse('Bottle') & Has('Magic Beans') & (Form('Human') | Form('Zora')))
     # it's an open check once you're there, you just need a bottle, bean, water, and be able to jump to it from the bean
 
 
     ### SOUTHERN SWAMP
 
     ## Path to Swamp
-    set_rule(world.get_location('Swamp Path Bat Tree HP'), lambda state: state.can_pop_balloon() or state.form('Human'))
+    set_rule(world.get_location('Swamp Path Bat Tree HP'), Call('can_pop_balloon') | Form('Human'))
     # the req for this is just to make it up the tree without getting knocked off by the birds, so unless there's some
     # way of cheesing the birds I don't know about, you just have to be able to kill them
     # ...you know, birds are just balloons that try to kill you tbh
 
-    set_rule(world.get_location('Swamp Tingle Woodfall Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Swamp Tingle Snowhead Map'), lambda state: state.can_pop_balloon())
+    set_rule(world.get_location('Swamp Tingle Woodfall Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Swamp Tingle Snowhead Map'), Call('can_pop_balloon'))
     # I can't actually remember the two maps tingle sells, I'll have to just go check that
 
     # set_rule(world.get_location('Swamp Path Rupee Pit Chest'), lambda state: True)
     # there's apparently 20 rupees in a pit, it's probly just open, but I need to play again to check the details
 
-    set_rule(world.get_location('Swamp Shooting Gallery Quiver Prize'), lambda state: state.can_use('Bow'))
-    set_rule(world.get_location('Swamp Shooting Gallery HP Prize'), lambda state: state.can_use('Bow') or state.options('NoHardestArchery'))
+    set_rule(world.get_location('Swamp Shooting Gallery Quiver Prize'), CanUse('Bow'))
+    set_rule(world.get_location('Swamp Shooting Gallery HP Prize'), CanUse('Bow') | Call('options', 'NoHardestArchery'))
 
     ## Southern Swamp
-    set_rule(world.get_location('Swamp Tourist Roof HP'), lambda state: state.can_reach(world.get_location('Swamp Business Scrub')) or state.can('SomeWeirdGoronTrickIDunno'))
+    set_rule(world.get_location('Swamp Tourist Roof HP'), Reach('Swamp Business Scrub', 'Location') | Can('SomeWeirdGoronTrickIDunno'))
     # set_rule(world.get_location('Bottle From Kotate'), lambda state: True)
     # set_rule(world.get_location('Save Koume'), lambda state: True)
-    set_rule(world.get_location('Swamp Owl Statue'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Swamp Owl Statue'), Form('Human'))
 
     # swamp tourist center
-    set_rule(world.get_location('Pictograph Box'), lambda state: state.event('Saved Koume'))
+    set_rule(world.get_location('Pictograph Box'), Call('event', 'Saved Koume'))
 
     # swamp tourist center clean water
     # set_rule(world.get_location('Swamp Boat Archery HP'), lambda state: True)
@@ -368,129 +367,120 @@ def global_rules(world):
     ## Deku Palace
     # set_rule(world.get_location('Deku Palace Garden HP'), lambda state: True)
 
-    set_rule(world.get_location('Learn Sonata of Awakening'), lambda state: state.form('Human') and state.form('Deku'))
+    set_rule(world.get_location('Learn Sonata of Awakening'), Form('Human') & Form('Deku'))
     # probly need to test the reqs for this, but apparently you need to talk to the monkey as link and then show him an
     # instrument that isn't the ocarina to learn it? I dunno
     # todo: test requirements for this
 
     # post woodfall, butler race
-    set_rule(world.get_location('Mask of Scents'), lambda state: state.form('Human') and state.form('Deku') and state.has('Deku Princess') and state.event('Beat Odolwa'))
+    set_rule(world.get_location('Mask of Scents'), Form('Human') & Form('Deku') & Has('Deku Princess') & Call('event', 'Beat Odolwa'))
     # you know, I have no idea what the actual requirements are to do this lol
     # once you can get here, you can attempt the race, but I figure goron can't do it, zora probly not
     # so it's human and/or deku? todo: figure this out lol
 
-    set_rule(world.get_location('Magic Beans'), lambda state: state.form('Human') and state.has('Bottle'))
+    set_rule(world.get_location('Magic Beans'), Form('Human') & Has('Bottle'))
 
     ## Swamp Spider House
     # oh god, so many spots
     # lots of them are probly just open though
     # I'mma get to this later, I'll do both the spider houses together
     set_rule(world.get_location('Swamp Spider House Mask of Truth'),
-             lambda state: state.can_use('Bottle') and state.form('Deku') and state.has('Sonata of Awakening') and state.can_pop_balloon() and state.can_use('Bomb Bag'))
+             CanUse('Bottle') & Form('Deku') & Has('Sonata of Awakening') & Call('can_pop_balloon') & CanUse('Bomb Bag'))
     # there might be some other requirements to get all the skulls here, but I'm pretty sure you at least need a
     # bottle and to use deku flowers
 
     ## Outside Woodfall Area
     set_rule(world.get_location('Outside Woodfall 20 Rupee Chest'),
-             lambda state: state.form('Deku') or (state.has_hearts(5) and (state.form('Human') or state.form('Zora'))) or state.can_use('Hookshot'))
+             Form('Deku') | (Call('has_hearts', 5) & (Form('Human') | Form('Zora'))) | CanUse('Hookshot'))
     # I think you can get to this one by toughing out the poison water as well as just being deku
     # or also with the hookshot? also do ice arrows freeze poison water?
     # todo: test ways to get to this chest
     # p sure goron just can't get it lol
 
-    set_rule(world.get_location('Outside Woodfall 5 rupees'), lambda state: state.form('Deku'))
-    set_rule(world.get_location('Outside Woodfall HP'), lambda state: state.form('Deku') or state.can_use('Hookshot'))
+    set_rule(world.get_location('Outside Woodfall 5 rupees'), Form('Deku'))
+    set_rule(world.get_location('Outside Woodfall HP'), Form('Deku') | CanUse('Hookshot'))
     # todo: test if hookshot can get these
 
-    set_rule(world.get_location('Woodfall Owl Statue'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Woodfall Owl Statue'), Form('Human'))
 
 
     ### WOODFALL TEMPLE
 
     ## Lobby
-    set_rule(world.get_location('WF Stray Fairy Entrance'), lambda state: state.stray_fairy_req())
+    set_rule(world.get_location('WF Stray Fairy Entrance'), Call('stray_fairy_req'))
     # not sure what forms can get this aside from human, but basically if you require the GFMask to get fairies, checks
     # are done, otherwise you have to get to this fairy however you like, which... I think it's right by the entrance,
     # so it should be possible with anyone? unless it's like just below the entrance, in which case we have to see
     # which forms can get to it and require those regardless
 
-    set_rule(world.get_location('WF Stray Fairy Lobby Chest'), lambda state: state.form('Deku') and state.stray_fairy_req())
+    set_rule(world.get_location('WF Stray Fairy Lobby Chest'), Form('Deku') & Call('stray_fairy_req'))
     # I /think/ the one you get from the chest can be picked up without the mask? we may want to have an option to
     # require the mask to pick up any of the fairies, because damn it makes it a lot easier, heh
 
     ## First Floor
-    set_rule(world.get_location('WF Stray Fairy Central Room Deku Baba'), lambda state: state.stray_fairy_req())
-    set_rule(world.get_location('WF Stray Fairy Central Room SW Corner'),
-             lambda state: (state.form('Deku') or (state.has_hearts(4) and (state.form('Human') or state.form('Zora'))))
-                           and state.stray_fairy_req())
+    set_rule(world.get_location('WF Stray Fairy Central Room Deku Baba'), Call('stray_fairy_req'))
+    set_rule(world.get_location('WF Stray Fairy Central Room SW Corner'), (Form('Deku') | (Call('has_hearts', 4) & (Form('Human') | Form('Zora')))) & Call('stray_fairy_req'))
     # this actually might have to be changed later on depending on if we split this room into logical regions
     # since I'm pretty sure it's easier to get to this fairy from the top section, heh
 
     set_rule(world.get_location('WF Stray Fairy Elevator Flower Room'),
-             lambda state: state.can_pop_balloon() and (state.form('Deku') or state.can_use('Great Fairy Mask')) and state.stray_fairy_req())
+             Call('can_pop_balloon') & (Form('Deku') | CanUse('Great Fairy Mask')) & Call('stray_fairy_req'))
     # ugh, there's kind of a lot to this one, if you can pop a balloon, then you still need a way to retrieve the fairy
     # that can be either with the deku flowers or with the GFMask, even when the mask isn't required for any particular stray fairy
     # seems kind of weird to add it on to this check, but if you don't, then it's just 3 things ANDed, one of which is
     # the deku form, and there are certainly ways to get this SF without requiring the deku form..... probly
 
-    set_rule(world.get_location('WF Elevator Flower Room Key Chest'), lambda state: state.form('Deku'))
+    set_rule(world.get_location('WF Elevator Flower Room Key Chest'), Form('Deku'))
     # zora might be tall enough to run through the poison water and climb up? not sure, should test
     # todo: test ways to get to this key chest
 
     set_rule(world.get_location('WF Map Chest'),
-             lambda state: state.form('Deku') or state.can_use('Bomb Bag') or state.form('Goron'))
+             Form('Deku') | CanUse('Bomb Bag') | Form('Goron'))
     # possibly the blast mask can be used as well? in which case just change this to can_blast()
 
     ## Push Block Bridge Room
     set_rule(world.get_location('WF Stray Fairy Push Block Room Hive'),
-             lambda state: state.can_pop_balloon() and state.stray_fairy_req())
-    set_rule(world.get_location('WF Stray Fairy Push Block Room Skulltula'), lambda state: state.stray_fairy_req())
+             Call('can_pop_balloon') & Call('stray_fairy_req'))
+    set_rule(world.get_location('WF Stray Fairy Push Block Room Skulltula'), Call('stray_fairy_req'))
     # I /think/ any form can kill a skulltula? maybe test this
 
-    set_rule(world.get_location('WF Stray Fairy Push Block Room Underwater'),
-             lambda state: state.stray_fairy_req()
-                and ((state.form('Human') or state.form('Zora')) and (state.swamp_cleaned() or state.has_hearts(6))))
-    set_rule(world.get_location('WF Compass Chest'),
-             lambda state: state.form('Zora')
-                           or (state.form('Deku') and state.has('Magic Meter'))
-                           or (state.form('Human') and state.can_pop_balloon()))
+    set_rule(world.get_location('WF Stray Fairy Push Block Room Underwater'), Call('stray_fairy_req') & (Form('Human') | Form('Zora')) & (Call('swamp_cleaned') | Call('has_hearts', 6)))
+    set_rule(world.get_location('WF Compass Chest'), Form('Zora') | (Form('Deku') & Has('Magic Meter')) | (Form('Human') & Call('can_pop_balloon')))
 
     ## Dark Puff Gauntlet
-    set_rule(world.get_location('WF Stray Fairy Dark Puffs'), lambda state: state.stray_fairy_req())
+    set_rule(world.get_location('WF Stray Fairy Dark Puffs'), Call('stray_fairy_req'))
     # I'm pretty sure any form can kill the puffs, the only one that would be hard is goron lol
 
     ## Second Floor
     set_rule(world.get_location('WF Stray Fairy Central Room Upper Bubble'),
-             lambda state: state.can_pop_balloon() and state.stray_fairy_req())
+             Call('can_pop_balloon') & Call('stray_fairy_req'))
     set_rule(world.get_location('WF Stray Fairy Central Room Upper Switch Chest'),
-             lambda state: state.stray_fairy_req() and state.form('Deku'))
-    set_rule(world.get_location('WF Bow Chest'), lambda state: state.can_kill_lizalfos())
-    set_rule(world.get_location('WF Boss Key Chest'), lambda state: state.can_kill_gekkos())
+             Call('stray_fairy_req') & Form('Deku'))
+    set_rule(world.get_location('WF Bow Chest'), Call('can_kill_lizalfos'))
+    set_rule(world.get_location('WF Boss Key Chest'), Call('can_kill_gekkos'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Pre-Boss Room
-    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Alcoves 1'), lambda state: state.stray_fairy_req() and state.form('Deku'))
-    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Alcoves 2'), lambda state: state.stray_fairy_req() and state.form('Deku'))
-    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Alcoves 3'), lambda state: state.stray_fairy_req() and state.form('Deku'))
-    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Bubble'),
-             lambda state: state.stray_fairy_req() and state.can_pop_balloon()
-                           and state.form('Deku') and state.can_use('Great Fairy Mask'))
+    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Alcoves 1'), Call('stray_fairy_req') & Form('Deku'))
+    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Alcoves 2'), Call('stray_fairy_req') & Form('Deku'))
+    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Alcoves 3'), Call('stray_fairy_req') & Form('Deku'))
+    set_rule(world.get_location('WF Stray Fairy Pre Boss Room Bubble'), Call('stray_fairy_req') & Call('can_pop_balloon') & Form('Deku') & CanUse('Great Fairy Mask'))
     # this one might just hard require the GFMask, not sure how to get to it at all
 
     ## Boss: Odolwa
-    set_rule(world.get_location('Odolwas Remains'), lambda state: state.can_use('Bow'))
+    set_rule(world.get_location('Odolwas Remains'), CanUse('Bow'))
     # todo: figure out all the ways to kill odolwa
     # you probly hard need to use the bow, which means most other checks aren't needed
     # but yeah, gotta figure out all the ways to beat this
 
     ## Post Odolwa Princess Room
-    set_rule(world.get_location('Woodfall Princess'), lambda state: state.can_use('Bottle'))
+    set_rule(world.get_location('Woodfall Princess'), CanUse('Bottle'))
 
 
     ### MOUNTAIN VILLAGE
 
     ## Mountain Village
-    set_rule(world.get_location('Goron Mask'), lambda state: state.has('Song of Healing') and state.can_use('Lens of Truth'))
+    set_rule(world.get_location('Goron Mask'), Has('Song of Healing') & CanUse('Lens of Truth'))
     # this probly needs to be investigated (do you actually need the lens once you've gotten the ghost there?) and we
     # should determine how we want to track this check, since you have to follow the ghost through various areas
     # I kiiiind of want to add a ton of extra stuff for myself to do, like world state checks that just don't get
@@ -498,7 +488,7 @@ def global_rules(world):
     # stuff that would strictly be used by the crawler to determine placement
     # we'll see
 
-    set_rule(world.get_location('Goron Grave Hot Spring Water'), lambda state: state.can_use('Bottle'))
+    set_rule(world.get_location('Goron Grave Hot Spring Water'), CanUse('Bottle'))
     # something is definitely gonna have to be tweaked in order to keep this (and the goron elder) check in, especially
     # accounting for entrance shuffle
     # I think only goron is fast enough to make it from here to the elder, but if entrances are shuffled, there needs
@@ -512,186 +502,186 @@ def global_rules(world):
     # him at the grave
     # anyway
 
-    set_rule(world.get_location('Don Gero Mask'), lambda state: state.has('Rock Sirloin'))
+    set_rule(world.get_location('Don Gero Mask'), Has('Rock Sirloin'))
     # gonna need some way to check that you can actually get the sirloin to this guy after entrance shuffle, lol
 
-    set_rule(world.get_location('Mountain Village 20 Rupee Chest Behind Waterfall'), lambda state: state.event('Beat Ghot') and state.lens_req())
+    set_rule(world.get_location('Mountain Village 20 Rupee Chest Behind Waterfall'), Call('event', 'Beat Ghot') & Call('lens_req'))
 
-    set_rule(world.get_location('Mountain Village 20 Rupee Pit'), lambda state: state.event('Beat Ghot') and (state.form('Goron') or state.lens_req()))
+    set_rule(world.get_location('Mountain Village 20 Rupee Pit'), Call('event', 'Beat Ghot') & (Form('Goron') | Call('lens_req')))
     # this one may not be a chest, I should check it
 
-    set_rule(world.get_location('Gilded Sword'), lambda state: state.event('Beat Ghot') and state.has('Gold Dust'))
+    set_rule(world.get_location('Gilded Sword'), Call('event', 'Beat Ghot') & Has('Gold Dust'))
     # it's probly best to just assume you can always get the razor sword
 
-    set_rule(world.get_location('Mountain Village Keaton HP'), lambda state: state.can_use('Keaton Mask') and state.event('Beat Ghot'))
+    set_rule(world.get_location('Mountain Village Keaton HP'), CanUse('Keaton Mask') & Call('event', 'Beat Ghot'))
 
-    set_rule(world.get_location('Don Gero HP'), lambda state: state.event('Beat Ghot') and state.can_kill_gekkos() and state.has('Ice Arrows'))
+    set_rule(world.get_location('Don Gero HP'), Call('event', 'Beat Ghot') & Call('can_kill_gekkos') & Has('Ice Arrows'))
     # maybe need to check the reqs on this, but I think we can assume if you can beat ghot and both gekkos,
     # you can get to all the frogs and get this HP
 
     ## Frozen Lake
-    set_rule(world.get_location('Mountain Tingle Snowhead Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Mountain Tingle Romani Ranch Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('First Half Goron Lullaby'), lambda state: (state.can_blast() or state.form('Goron')) and state.can_use('Hot Spring Water'))
+    set_rule(world.get_location('Mountain Tingle Snowhead Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Mountain Tingle Romani Ranch Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('First Half Goron Lullaby'), (Call('can_blast') | Form('Goron')) & CanUse('Hot Spring Water'))
     # not sure if he'll actually teach you the half song if you're not a goron todo: test form requirements
 
-    set_rule(world.get_location('Frozen Lake HP'), lambda state: state.event('Beat Ghot') and state.form('Zora'))
+    set_rule(world.get_location('Frozen Lake HP'), Call('event', 'Beat Ghot') & Form('Zora'))
 
-    set_rule(world.get_location('Frozen Lake Bombchu Pit'), lambda state: state.event('Beat Ghot') and state.form('Goron'))
+    set_rule(world.get_location('Frozen Lake Bombchu Pit'), Call('event', 'Beat Ghot') & Form('Goron'))
     # I should check this one too, dunno if it's a chest or what; also is goron the only one who can get to this pit?
 
-    set_rule(world.get_location('Goron Race Gold Dust Bottle'), lambda state: state.event('Beat Ghot') and state.form('Goron'))
+    set_rule(world.get_location('Goron Race Gold Dust Bottle'), Call('event', 'Beat Ghot') & Form('Goron'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Goron Village
-    set_rule(world.get_location('Biggest Bomb Bag'), lambda state: state.form('Goron') and state.has('Adult Wallet'))
+    set_rule(world.get_location('Biggest Bomb Bag'), Form('Goron') & Has('Adult Wallet'))
     # set_rule(world.get_location('Lens of Truth'), lambda state: True)
-    set_rule(world.get_location('Lens of Truth Cave Invisible Chest'), lambda state: state.lens_req())
-    set_rule(world.get_location('Lens of Truth Cave Boulder Chest'), lambda state: state.can_blast())
+    set_rule(world.get_location('Lens of Truth Cave Invisible Chest'), Call('lens_req'))
+    set_rule(world.get_location('Lens of Truth Cave Boulder Chest'), Call('can_blast'))
 
-    set_rule(world.get_location('Learn Goron Lullaby'), lambda state: state.form('Goron') and state.has('First Half Goron Lullaby'))
-    set_rule(world.get_location('Rock Sirloin'), lambda state: state.can_use('Deku Stick') and state.form('Goron'))
+    set_rule(world.get_location('Learn Goron Lullaby'), Form('Goron') & Has('First Half Goron Lullaby'))
+    set_rule(world.get_location('Rock Sirloin'), CanUse('Deku Stick') & Form('Goron'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Snowhead and Path To
-    set_rule(world.get_location('Path To Snowhead HP'), lambda state: state.form('Goron') and state.can_use('Hookshot') and state.lens_req())
-    set_rule(world.get_location('Snowhead Owl Statue'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Path To Snowhead HP'), Form('Goron') & CanUse('Hookshot') & Call('lens_req'))
+    set_rule(world.get_location('Snowhead Owl Statue'), Form('Human'))
 
 
     ### SNOWHEAD TEMPLE
 
     ## 1st Floor and Basement
-    set_rule(world.get_location('SH Stray Fairy 1 Bridge And Freezard Room'), lambda state: state.can_pop_balloon() and state.stray_fairy_req())
-    set_rule(world.get_location('SH Stray Fairy 2 Bridge And Freezard Room'), lambda state: state.can_pop_balloon() and state.stray_fairy_req())
-    set_rule(world.get_location('SH Stray Fairy Basement Switch'), lambda state: state.form('Goron'))
+    set_rule(world.get_location('SH Stray Fairy 1 Bridge And Freezard Room'), Call('can_pop_balloon') & Call('stray_fairy_req'))
+    set_rule(world.get_location('SH Stray Fairy 2 Bridge And Freezard Room'), Call('can_pop_balloon') & Call('stray_fairy_req'))
+    set_rule(world.get_location('SH Stray Fairy Basement Switch'), Form('Goron'))
     # set_rule(world.get_location('SH Push Block Key Chest'), lambda state: True)
     # set_rule(world.get_location('SH Compass Chest'), lambda state: True)
     # do you have to actually do anything in this room, or is the chest just there already? I forget
 
-    set_rule(world.get_location('SH Bridge and Freezard Room Key Chest'), lambda state: state.can_use('Fire Arrows'))
-    set_rule(world.get_location('SH Stray Fairy Chest In Compass Room'), lambda state: state.can_use('Fire Arrows') or state.can_use('Hookshot'))
+    set_rule(world.get_location('SH Bridge and Freezard Room Key Chest'), CanUse('Fire Arrows'))
+    set_rule(world.get_location('SH Stray Fairy Chest In Compass Room'), CanUse('Fire Arrows') | CanUse('Hookshot'))
 
     set_rule(world.get_location('SH Stray Fairy Compass Room Bombable'),
-             lambda state: (state.can_use('Fire Arrows') or state.can_use('Hookshot')) and state.can_use('Bomb Bag') and state.stray_fairy_req())
+             (CanUse('Fire Arrows') | CanUse('Hookshot')) & CanUse('Bomb Bag') & Call('stray_fairy_req'))
     # I bet there's a way to cheese this one
 
-    set_rule(world.get_location('SH Stray Fairy Push Block Room'), lambda state: state.can_use('Fire Arrows'))
+    set_rule(world.get_location('SH Stray Fairy Push Block Room'), CanUse('Fire Arrows'))
     # this check will need to be changed depending on the logical regions defined- probly have a path of regions from
     # the compass room leading here, plus an exit from the lower part of the room to the chest/torches part gated by
     # the hookshot
 
-    set_rule(world.get_location('SH Stray Fairy Behind Central Pillar Room'), lambda state: state.can_use('Fire Arrows'))
+    set_rule(world.get_location('SH Stray Fairy Behind Central Pillar Room'), CanUse('Fire Arrows'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## 2nd Floor
     # set_rule(world.get_location('SH Map Chest'), lambda state: True)
     # set_rule(world.get_location('SH Stray Fairy Map Chest Room'), lambda state: True)
-    set_rule(world.get_location('SH Icicle Drop Room Key Chest'), lambda state: state.can_use('Bow') and (state.can_blast() or state.form('Goron')))
-    set_rule(world.get_location('SH Stray Fairy Icicle Drop Room'), lambda state: state.can_use('Bow') and state.lens_req())
-    set_rule(world.get_location('SH Stray Fairy Goron Switch Room Ceiling'), lambda state: state.can_pop_balloon() and state.lens_req())
+    set_rule(world.get_location('SH Icicle Drop Room Key Chest'), CanUse('Bow') & (Call('can_blast') | Form('Goron')))
+    set_rule(world.get_location('SH Stray Fairy Icicle Drop Room'), CanUse('Bow') & Call('lens_req'))
+    set_rule(world.get_location('SH Stray Fairy Goron Switch Room Ceiling'), Call('can_pop_balloon') & Call('lens_req'))
 
-    set_rule(world.get_location('SH Fire Arrows Chest'), lambda state: state.can_use('Bow'))
+    set_rule(world.get_location('SH Fire Arrows Chest'), CanUse('Bow'))
     # I bet there are other ways of beating the wizrobe, just not sure how
 
-    set_rule(world.get_location('SH Stray Fairy Elevator Room Lens Platforms'), lambda state: state.can_use('Lens of Truth') and (state.form('Human') or state.form('Zora')))
+    set_rule(world.get_location('SH Stray Fairy Elevator Room Lens Platforms'), CanUse('Lens of Truth') & (Form('Human') | Form('Zora')))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## 3rd Floor
-    set_rule(world.get_location('SH Stray Fairy 3F Snowman Room'), lambda state: state.can_pop_balloon() and state.lens_req())
+    set_rule(world.get_location('SH Stray Fairy 3F Snowman Room'), Call('can_pop_balloon') & Call('lens_req'))
     # can you just jump to this one? I forget
 
     ## 4th Floor
-    set_rule(world.get_location('SH Stray Fairy 1 Lizalfos Room'), lambda state: state.can_kill_lizalfos())
-    set_rule(world.get_location('SH Stray Fairy 2 Lizalfos Room'), lambda state: state.can_kill_lizalfos())
+    set_rule(world.get_location('SH Stray Fairy 1 Lizalfos Room'), Call('can_kill_lizalfos'))
+    set_rule(world.get_location('SH Stray Fairy 2 Lizalfos Room'), Call('can_kill_lizalfos'))
 
-    set_rule(world.get_location('SH Stray Fairy Hidden Alcove'), lambda state: state.can_use('Lens of Truth') and (state.form('Deku') or state.form('Human')))
+    set_rule(world.get_location('SH Stray Fairy Hidden Alcove'), CanUse('Lens of Truth') & (Form('Deku') | Form('Human')))
     # there might be other ways to do this, not sure
 
-    set_rule(world.get_location('SH Boss Key Chest'), lambda state: state.can_use('Bow'))
+    set_rule(world.get_location('SH Boss Key Chest'), CanUse('Bow'))
 
     ## Boss: Ghot
-    set_rule(world.get_location('Ghots Remains'), lambda state: state.can_use('Bow') and state.has('Fire Arrows') and state.form('Goron'))
+    set_rule(world.get_location('Ghots Remains'), CanUse('Bow') & Has('Fire Arrows') & Form('Goron'))
     # I know there are various ways to do this boss, but I'm not sure exactly what, so for now let's just require goron form
 
 
     ### ROMANI RANCH AREA
 
     ## Milk Road
-    set_rule(world.get_location('Milk Road Keaton HP'), lambda state: state.can_use('Keaton Mask'))
-    set_rule(world.get_location('Milk Road Tingle Romani Ranch Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Milk Road Tingle Romani Ranch Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Milk Road Owl Statue'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Milk Road Keaton HP'), CanUse('Keaton Mask'))
+    set_rule(world.get_location('Milk Road Tingle Romani Ranch Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Milk Road Tingle Romani Ranch Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Milk Road Owl Statue'), Form('Human'))
 
     ## Romani Ranch
-    set_rule(world.get_location('Bunny Hood'), lambda state: state.can_use('Bremen Mask'))
-    set_rule(world.get_location('Learn Eponas Song'), lambda state: state.can_use('Bow') and state.form('Human'))
+    set_rule(world.get_location('Bunny Hood'), CanUse('Bremen Mask'))
+    set_rule(world.get_location('Learn Eponas Song'), CanUse('Bow') & Form('Human'))
     # form reqs?
 
     # set_rule(world.get_location('Dog Track 50 Rupee Chest'), lambda state: True)
-    set_rule(world.get_location('Romani Ranch Bottle'), lambda state: state.can_use('Bow'))
-    set_rule(world.get_location('Dog Track HP'), lambda state: state.dog_track_MoT_req())
-    set_rule(world.get_location('Romani Mask'), lambda state: state.can_use('Bow'))
+    set_rule(world.get_location('Romani Ranch Bottle'), CanUse('Bow'))
+    set_rule(world.get_location('Dog Track HP'), Call('dog_track_MoT_req'))
+    set_rule(world.get_location('Romani Mask'), CanUse('Bow'))
 
     ## Gorman Bros.
-    set_rule(world.get_location('Garo Mask'), lambda state: state.has('Eponas Song'))
+    set_rule(world.get_location('Garo Mask'), Has('Eponas Song'))
 
 
     ### GREAT BAY
 
     ## Great Bay North
-    set_rule(world.get_location('Zora Mask'), lambda state: state.form('Human'))
-    set_rule(world.get_location('Great Bay Owl Statue'), lambda state: state.form('Human'))
-    set_rule(world.get_location('Great Bay Tingle Great Bay Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Great Bay Tingle Ikana Map'), lambda state: state.can_pop_balloon())
+    set_rule(world.get_location('Zora Mask'), Form('Human'))
+    set_rule(world.get_location('Great Bay Owl Statue'), Form('Human'))
+    set_rule(world.get_location('Great Bay Tingle Great Bay Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Great Bay Tingle Ikana Map'), Call('can_pop_balloon'))
     # set_rule(world.get_location('Rupee Pit'), lambda state: True)
 
-    set_rule(world.get_location('Ocean Spider House HP'), lambda state: state.can_use('Bow') and state.has('Hookshot') and state.has('Captains Hat'))
+    set_rule(world.get_location('Ocean Spider House HP'), CanUse('Bow') & Has('Hookshot') & Has('Captains Hat'))
     # the captain's hat can be used to get the code or whatever from the stalchildren, or you can trial and
     # error it with arrows
     # so we can maybe make it an option to need the captain's hat, but for now I'm just going to require it
 
-    set_rule(world.get_location('Ocean Spider House Giant Wallet'), lambda state: state.can_use('Fire Arrows') and state.has('Hookshot') and state.has('Bomb Bag'))
+    set_rule(world.get_location('Ocean Spider House Giant Wallet'), CanUse('Fire Arrows') & Has('Hookshot') & Has('Bomb Bag'))
     # todo these later
 
-    set_rule(world.get_location('Great Bay Lab Fish Feeding HP'), lambda state: state.can_use('Bottle'))
-    set_rule(world.get_location('Great Bay Seahorse From Fisherman'), lambda state: state.has('Picto Box') and state.has('Bottle'))
-    set_rule(world.get_location('Learn New Wave Bossa Nova'), lambda state: state.form('Zora') and state.has('Zora Egg', 7))
-    set_rule(world.get_location('Great Bay High Cliff HP'), lambda state: state.can_use('Hookshot') and state.has('Spring Water') and state.has('Magic Beans'))
-    set_rule(world.get_location('Great Bay Jumping Game HP'), lambda state: state.event('Beat Gyorg') and state.can_use('Hookshot') and (state.form('Human') or state.form('Zora')))
+    set_rule(world.get_location('Great Bay Lab Fish Feeding HP'), CanUse('Bottle'))
+    set_rule(world.get_location('Great Bay Seahorse From Fisherman'), Has('Picto Box') & Has('Bottle'))
+    set_rule(world.get_location('Learn New Wave Bossa Nova'), Form('Zora') & Count('Zora Egg', 7))
+    set_rule(world.get_location('Great Bay High Cliff HP'), CanUse('Hookshot') & Has('Spring Water') & Has('Magic Beans'))
+    set_rule(world.get_location('Great Bay Jumping Game HP'), Call('event', 'Beat Gyorg') & CanUse('Hookshot') & (Form('Human') | Form('Zora')))
 
     ## Great Bay South
-    set_rule(world.get_location('Great Bay Like Like HP'), lambda state: state.form('Zora'))
+    set_rule(world.get_location('Great Bay Like Like HP'), Form('Zora'))
     # set_rule(world.get_location('Great Bay Bombchu Pit'), lambda state: True)
-    set_rule(world.get_location('Great Bay Temple Owl Statue'), lambda state: state.form('Human'))
-    set_rule(world.get_location('Zora Hall 5 Rupees From Stagehand'), lambda state: True)
-    set_rule(world.get_location('Zora Hall 20 Rupees From Lulu Stalker'), lambda state: state.can_use('Bottle'))
-    set_rule(world.get_location('Beaver Race Bottle'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Beaver Race HP'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Zora Hall Song HP'), lambda state: state.form('Human'))
+    set_rule(world.get_location('Great Bay Temple Owl Statue'), Form('Human'))
+    set_rule(world.get_location('Zora Hall 5 Rupees From Stagehand'), TRUE)
+    set_rule(world.get_location('Zora Hall 20 Rupees From Lulu Stalker'), CanUse('Bottle'))
+    set_rule(world.get_location('Beaver Race Bottle'), Form('Zora'))
+    set_rule(world.get_location('Beaver Race HP'), Form('Zora'))
+    set_rule(world.get_location('Zora Hall Song HP'), Form('Human'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Gerudo Fortress
-    set_rule(world.get_location('Gerudo Fortress Entrance Harbor 20 Rupee Chest 1'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Gerudo Fortress Entrance Harbor 20 Rupee Chest 2'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Gerudo Fortress Entrance Harbor 20 Rupee Chest 3'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Gerudo Fortress Cage Maze 20 Rupee Chest'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Gerudo Fortress Cage Maze HP'), lambda state: state.form('Goron') or state.can_use('Bunny Hood'))
+    set_rule(world.get_location('Gerudo Fortress Entrance Harbor 20 Rupee Chest 1'), Form('Zora'))
+    set_rule(world.get_location('Gerudo Fortress Entrance Harbor 20 Rupee Chest 2'), Form('Zora'))
+    set_rule(world.get_location('Gerudo Fortress Entrance Harbor 20 Rupee Chest 3'), Form('Zora'))
+    set_rule(world.get_location('Gerudo Fortress Cage Maze 20 Rupee Chest'), Form('Zora'))
+    set_rule(world.get_location('Gerudo Fortress Cage Maze HP'), Form('Goron') | CanUse('Bunny Hood'))
     # I /think/ you need the goron form to be fast enough to make this? maybe there are ways to cheese this
 
-    set_rule(world.get_location('Gerudo Fortress Tower Hub 20 Rupee Chest'), lambda state: state.can_use('Hookshot'))
-    set_rule(world.get_location('Hookshot'), lambda state: state.can_use('Bow'))
-    set_rule(world.get_location('Zora Egg 1'), lambda state: state.can_use('Bottle') and state.form('Zora') and state.can_use('Hookshot'))
-    set_rule(world.get_location('Zora Egg 2'), lambda state: state.can_use('Bottle') and state.form('Zora') and state.can_use('Hookshot'))
-    set_rule(world.get_location('Zora Egg 3'), lambda state: state.can_use('Bottle') and state.form('Zora') and state.can_use('Hookshot'))
-    set_rule(world.get_location('Zora Egg 4'), lambda state: state.can_use('Bottle') and state.form('Zora') and state.can_use('Hookshot'))
-    set_rule(world.get_location('Gerudo Fortress 100 Rupee Chest'), lambda state: state.can_use('Hookshot') or state.can_use('Bow') or state.can_use('Stone Mask'))
+    set_rule(world.get_location('Gerudo Fortress Tower Hub 20 Rupee Chest'), CanUse('Hookshot'))
+    set_rule(world.get_location('Hookshot'), CanUse('Bow'))
+    set_rule(world.get_location('Zora Egg 1'), CanUse('Bottle') & Form('Zora') & CanUse('Hookshot'))
+    set_rule(world.get_location('Zora Egg 2'), CanUse('Bottle') & Form('Zora') & CanUse('Hookshot'))
+    set_rule(world.get_location('Zora Egg 3'), CanUse('Bottle') & Form('Zora') & CanUse('Hookshot'))
+    set_rule(world.get_location('Zora Egg 4'), CanUse('Bottle') & Form('Zora') & CanUse('Hookshot'))
+    set_rule(world.get_location('Gerudo Fortress 100 Rupee Chest'), CanUse('Hookshot') | CanUse('Bow') | CanUse('Stone Mask'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Pinnacle Rock
-    set_rule(world.get_location('Zora Egg 5'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Zora Egg 6'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Zora Egg 7'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Pinnacle Rock Eel HP'), lambda state: state.form('Zora'))
+    set_rule(world.get_location('Zora Egg 5'), Form('Zora'))
+    set_rule(world.get_location('Zora Egg 6'), Form('Zora'))
+    set_rule(world.get_location('Zora Egg 7'), Form('Zora'))
+    set_rule(world.get_location('Pinnacle Rock Eel HP'), Form('Zora'))
 
 
     ### GREAT BAY TEMPLE
@@ -699,155 +689,153 @@ def global_rules(world):
     # to a chest
     # this will probly need extensive testing
 
-    set_rule(world.get_location('GB Stray Fairy Entrance Room'), lambda state: state.can_use('Deku Stick'))
+    set_rule(world.get_location('GB Stray Fairy Entrance Room'), CanUse('Deku Stick'))
     set_rule(world.get_location('GB Stray Fairy Flywheel Room Underwater'),
-             lambda state: (state.form('Zora') or (state.can_pop_balloon() and state.can_use('Great Fairy Mask'))) and state.stray_fairy_req())
+             (Form('Zora') | (Call('can_pop_balloon') & CanUse('Great Fairy Mask'))) & Call('stray_fairy_req'))
 
-    set_rule(world.get_location('GB Stray Fairy Flywheel Room Big Skulltula'), lambda state: state.form('Zora'))
+    set_rule(world.get_location('GB Stray Fairy Flywheel Room Big Skulltula'), Form('Zora'))
     # zoras can deal with big skulls by themselves, right? no need to add any other checks
 
-    set_rule(world.get_location('GB Stray Fairy Big Whirlpool Hub Barrel'), lambda state: state)
+    set_rule(world.get_location('GB Stray Fairy Big Whirlpool Hub Barrel'), TRUE)
     set_rule(world.get_location('GB Stray Fairy Big Whirlpool Hub Bottom'),
-             lambda state: state.stray_fairy_req() and (state.form('Zora') or (state.can_pop_balloon() and state.can_use('Great Fairy Mask'))))
-    set_rule(world.get_location('GB Map Chest'), lambda state: state.can_use('Hookshot'))
-    set_rule(world.get_location('GB Stray Fairy Map Room'), lambda state: (state.can_pop_balloon() or state.form('Zora')) and state.stray_fairy_req())
-    set_rule(world.get_location('GB Stray Fairy Tunnel To Compass Room'), lambda state: state.form('Zora') and state.stray_fairy_req())
-    set_rule(world.get_location('GB Compass Chest'), lambda state: state.can_use('Hookshot'))
-    set_rule(world.get_location('GB Compass Room Key Chest'), lambda state: state.form('Zora'))
-
-    set_rule(world.get_location('GB Stray Fairy Compass Room'), lambda state: state.can_pop_balloon() and state.stray_fairy_req())
+             Call('stray_fairy_req') & (Form('Zora') | (Call('can_pop_balloon') & CanUse('Great Fairy Mask'))))
+    set_rule(world.get_location('GB Map Chest'), CanUse('Hookshot'))
+    set_rule(world.get_location('GB Stray Fairy Map Room'), (Call('can_pop_balloon') | Form('Zora')) & Call('stray_fairy_req'))
+    set_rule(world.get_location('GB Stray Fairy Tunnel To Compass Room'), Form('Zora') & Call('stray_fairy_req'))
+    set_rule(world.get_location('GB Compass Chest'), CanUse('Hookshot'))
+    set_rule(world.get_location('GB Compass Room Key Chest'), Form('Zora'))
+
+    set_rule(world.get_location('GB Stray Fairy Compass Room'), Call('can_pop_balloon') & Call('stray_fairy_req'))
     # ugh, test this check, there are probly lots of ways to do it
     # todo: lots of testing on this one
 
-    set_rule(world.get_location('GB Ice Arrows Chest'), lambda state: state.can_use('Hookshot'))
+    set_rule(world.get_location('GB Ice Arrows Chest'), CanUse('Hookshot'))
     # todo: look up all the ways of killing Wort
 
-    set_rule(world.get_location('GB Boss Key Chest'), lambda state: state.can_kill_gekkos() and state.has('Ice Arrows'))
-    set_rule(world.get_location('GB Stray Fairy First Green Crank Room'), lambda state: state.can_use('Hookshot') and state.has('Ice Arrows'))
-    set_rule(world.get_location('GB Stray Fairy Waterfall Room 1'), lambda state: state.can_use('Hookshot') and state.has('Ice Arrows'))
-    set_rule(world.get_location('GB Stray Fairy Waterfall Room 2'), lambda state: state.can_use('Hookshot') and state.has('Ice Arrows') and state.has('Fire Arrows'))
+    set_rule(world.get_location('GB Boss Key Chest'), Call('can_kill_gekkos') & Has('Ice Arrows'))
+    set_rule(world.get_location('GB Stray Fairy First Green Crank Room'), CanUse('Hookshot') & Has('Ice Arrows'))
+    set_rule(world.get_location('GB Stray Fairy Waterfall Room 1'), CanUse('Hookshot') & Has('Ice Arrows'))
+    set_rule(world.get_location('GB Stray Fairy Waterfall Room 2'), CanUse('Hookshot') & Has('Ice Arrows') & Has('Fire Arrows'))
     # including fire arrows here for sanity, otherwise you'd have to reenter the room or maybe dungeon if you messed up
 
-    set_rule(world.get_location('GB Stray Fairy Final Crank Room 1'), lambda state: state.form('Zora') and state.stray_fairy_req())
-    set_rule(world.get_location('GB Stray Fairy Final Crank Room 2'), lambda state: state.form('Zora') and state.stray_fairy_req())
+    set_rule(world.get_location('GB Stray Fairy Final Crank Room 1'), Form('Zora') & Call('stray_fairy_req'))
+    set_rule(world.get_location('GB Stray Fairy Final Crank Room 2'), Form('Zora') & Call('stray_fairy_req'))
     # I think just zora is enough for the second one? might have to test that
 
-    set_rule(world.get_location('GB Stray Fairy Before Gyorg Room 1'), lambda state: state.form('Zora') and state.stray_fairy_req())
-    set_rule(world.get_location('GB Stray Fairy Before Gyorg Room 2'), lambda state: (state.can_pop_balloon() or state.form('Zora')) and state.stray_fairy_req())
+    set_rule(world.get_location('GB Stray Fairy Before Gyorg Room 1'), Form('Zora') & Call('stray_fairy_req'))
+    set_rule(world.get_location('GB Stray Fairy Before Gyorg Room 2'), (Call('can_pop_balloon') | Form('Zora')) & Call('stray_fairy_req'))
 
     ## Boss: Gyorg
-    set_rule(world.get_location('Gyorgs Remains'), lambda state: state.form('Zora') and state.can_use('Bow'))
+    set_rule(world.get_location('Gyorgs Remains'), Form('Zora') & CanUse('Bow'))
 
 
     ### IKANA CANYON
-    set_rule(world.get_location('Ikana Entrance Bombchu Pit'), lambda state: state.form('Goron'))
+    set_rule(world.get_location('Ikana Entrance Bombchu Pit'), Form('Goron'))
     # todo: check this spot in the game
 
-    set_rule(world.get_location('Stone Mask'), lambda state: state.can_epona() and state.has('Bottle') and state.can_use('Lens of Truth'))
+    set_rule(world.get_location('Stone Mask'), Call('can_epona') & Has('Bottle') & CanUse('Lens of Truth'))
 
-    set_rule(world.get_location('Ikana Graveyard Bombchu Pit'), lambda state: state.can_blast())
+    set_rule(world.get_location('Ikana Graveyard Bombchu Pit'), Call('can_blast'))
     # todo: test if blast mask works here
 
-    set_rule(world.get_location('Ikana Graveyard Dampe 30 Rupee Prize'), lambda state: state.can_pop_balloon() or state.form('Human'))
+    set_rule(world.get_location('Ikana Graveyard Dampe 30 Rupee Prize'), Call('can_pop_balloon') | Form('Human'))
 
-    set_rule(world.get_location('Captains Hat'), lambda state: state.has('Sonata of Awakening') and (state.can_use('Bow') or state.can_use('Bunny Hood')))
+    set_rule(world.get_location('Captains Hat'), Has('Sonata of Awakening') & (CanUse('Bow') | CanUse('Bunny Hood')))
     # oh jeez, there are various glitches to get this chest huh?
     # todo: reaseach this chest
 
-    set_rule(world.get_location('Ikana Graveyard First Night Grave 50 Rupee Chest'), lambda state: state.can_use('Captains Hat'))
-    set_rule(world.get_location('Learn Song of Storms'), lambda state: state.can_use('Captains Hat') and state.has('Bow') and state.has('Fire Arrows'))
-    set_rule(world.get_location('Ikana Graveyard Second Night Grave HP'), lambda state: state.can_use('Captains Hat') and state.lens_req() and state.can_blast())
-    set_rule(world.get_location('Ikana Graveyard Third Night Grave Bottle'), lambda state: state.can_use('Captains Hat') and state.can_use('Bow'))
+    set_rule(world.get_location('Ikana Graveyard First Night Grave 50 Rupee Chest'), CanUse('Captains Hat'))
+    set_rule(world.get_location('Learn Song of Storms'), CanUse('Captains Hat') & Has('Bow') & Has('Fire Arrows'))
+    set_rule(world.get_location('Ikana Graveyard Second Night Grave HP'), CanUse('Captains Hat') & Call('lens_req') & Call('can_blast'))
+    set_rule(world.get_location('Ikana Graveyard Third Night Grave Bottle'), CanUse('Captains Hat') & CanUse('Bow'))
 
-    set_rule(world.get_location('Ikana Canyon Owl Statue'), lambda state: state.can_use('Bow') and state.has('Ice Arrows') and state.has('Hookshot'))
-    set_rule(world.get_location('Ikana Tingle Ikana Map'), lambda state: state.can_pop_balloon())
-    set_rule(world.get_location('Ikana Tingle Clock Town Map'), lambda state: state.can_pop_balloon())
+    set_rule(world.get_location('Ikana Canyon Owl Statue'), CanUse('Bow') & Has('Ice Arrows') & Has('Hookshot'))
+    set_rule(world.get_location('Ikana Tingle Ikana Map'), Call('can_pop_balloon'))
+    set_rule(world.get_location('Ikana Tingle Clock Town Map'), Call('can_pop_balloon'))
     # really this check depends on the logical area the statue is in; if it's just in the whole map, then there's a
     # bunch of reqs, but if it's in the upper region, then it's open
     # I'll leave it open for now, but we'll have to check in on this at some point
     # same with tingle actually
 
-    set_rule(world.get_location('Ikana Secret Shrine HP'), lambda state: state.has_hearts(16) and state.can_use('Light Arrows') and state.can_kill_lizalfos() and state.has('Hookshot'))
+    set_rule(world.get_location('Ikana Secret Shrine HP'), Call('has_hearts', 16) & CanUse('Light Arrows') & Call('can_kill_lizalfos') & Has('Hookshot'))
 
-    set_rule(world.get_location('Gibdo Mask'), lambda state: state.can_use('Bomb Bag') and state.form('Human') and state.has('Song of Healing'))
+    set_rule(world.get_location('Gibdo Mask'), CanUse('Bomb Bag') & Form('Human') & Has('Song of Healing'))
 
-    set_rule(world.get_location('Ghost Hut HP'), lambda state: state.can_use('Bow'))
+    set_rule(world.get_location('Ghost Hut HP'), CanUse('Bow'))
     # idek if you actually need the bow to do this, but probly; if not, the check is just for human form
 
     ## Beneath the Well
     set_rule(world.get_location('Beneath the Well 50 Rupee Chest 1'),
-             lambda state: state.can_use('Gibdo Mask') and state.has('Bottle') and state.has('Blue Potion') and state.lens_req())
+             CanUse('Gibdo Mask') & Has('Bottle') & Has('Blue Potion') & Call('lens_req'))
     set_rule(world.get_location('Beneath the Well 50 Rupee Chest 2'),
-             lambda state: state.can_use('Gibdo Mask') and state.has('Bottle') and state.has('Magic Beans', 5) and state.can_use('Deku Sticks'))
-    set_rule(world.get_location('Mirror Shield'),
-             lambda state: state.can_use('Gibdo Mask') and state.has('Bottle') and state.has('Blue Potion') and
-                           state.has('Magic Beans') and state.has('Bow') and state.has('Bomb Bag') and
-                           (state.has('Eponas Song') or state.has('Romani Mask')) and state.has('Fire Arrows'))
+             CanUse('Gibdo Mask') & Has('Bottle') & Count('Magic Beans', 5) & CanUse('Deku Sticks'))
+    set_rule(world.get_location('Mirror Shield'), CanUse('Gibdo Mask') & Has('Bottle') & Has('Blue Potion') & Has('Magic Beans') & Has('Bow') & Has('Bomb Bag') & (Has('Eponas Song') | Has('Romani Mask')) & Has('Fire Arrows'))
     # not actually as bad as I initially thought
     # the mirror shield is a bit much lol
 
     ## Ikana Castle
-    set_rule(world.get_location('Ikana Castle Pillar HP'), lambda state: state.form('Human') and state.form('Deku') and state.has('Bow'))
-    set_rule(world.get_location('Learn Elegy of Emptiness'), lambda state: state.can_use('Bow') and state.has('Fire Arrows') and state.has('Mirror Shield'))
+    set_rule(world.get_location('Ikana Castle Pillar HP'), Form('Human') & Form('Deku') & Has('Bow'))
+    set_rule(world.get_location('Learn Elegy of Emptiness'), CanUse('Bow') & Has('Fire Arrows') & Has('Mirror Shield'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Stone Tower Climb
     set_rule(world.get_location('Stone Tower Owl Statue'),
-             lambda state: state.form('Human') and state.form('Goron') and state.form('Zora') and state.has('Hookshot') and state.has('Elegy of Emptiness'))
+             Form('Human') & Form('Goron') & Form('Zora') & Has('Hookshot') & Has('Elegy of Emptiness'))
 
 
     ### STONE TOWER TEMPLE
     ## Regular
-    set_rule(world.get_location('ST Stray Fairy Entryway 1'), lambda state: state.can_use('Bow') and state.stray_fairy_req())
-    set_rule(world.get_location('ST Map Chest'), lambda state: state.can_use('Bomb Bag') and (state.has('Mirror Shield') or state.can_use('Light Arrows')) and state.form('Goron'))
-    set_rule(world.get_location('ST Map Room Key Chest'), lambda state: state.can_use('Bomb Bag') and state.form('Goron'))
-    set_rule(world.get_location('ST Stray Fairy Map Room'), lambda state: state.can_use('Bomb Bag') and state.has('Hookshot'))
-    set_rule(world.get_location('ST Pool Room Key Chest'), lambda state: state.form('Human') or state.form('Zora'))
-    set_rule(world.get_location('ST Compass Chest'), lambda state: (state.form('Zora') and state.can_use('Mirror Shield')) or state.can_use('Light Arrows'))
-    set_rule(world.get_location('ST Stray Fairy Mirror Network Room 1'), lambda state: (state.form('Goron') and state.can_use('Mirror Shield')) or state.can_use('Light Arrows'))
-    set_rule(world.get_location('ST Stray Fairy Mirror Network Room 2'), lambda state: (state.form('Goron') and state.can_use('Mirror Shield')) or state.can_use('Light Arrows'))
-    set_rule(world.get_location('ST Stray Fairy Lava Room Center Chest'), lambda state: state.form('Deku'))
-    set_rule(world.get_location('ST Stray Fairy Lava Room Switch Chest'), lambda state: state.form('Goron'))
-
-    set_rule(world.get_location('ST Light Arrows Chest'), lambda state: state.form('Human') or state.form('Zora'))
+    set_rule(world.get_location('ST Stray Fairy Entryway 1'), CanUse('Bow') & Call('stray_fairy_req'))
+    set_rule(world.get_location('ST Map Chest'), CanUse('Bomb Bag') & (Has('Mirror Shield') | CanUse('Light Arrows')) & Form('Goron'))
+    set_rule(world.get_location('ST Map Room Key Chest'), CanUse('Bomb Bag') & Form('Goron'))
+    set_rule(world.get_location('ST Stray Fairy Map Room'), CanUse('Bomb Bag') & Has('Hookshot'))
+    set_rule(world.get_location('ST Pool Room Key Chest'), Form('Human') | Form('Zora'))
+    set_rule(world.get_location('ST Compass Chest'), (Form('Zora') & CanUse('Mirror Shield')) | CanUse('Light Arrows'))
+    set_rule(world.get_location('ST Stray Fairy Mirror Network Room 1'), (Form('Goron') & CanUse('Mirror Shield')) | CanUse('Light Arrows'))
+    set_rule(world.get_location('ST Stray Fairy Mirror Network Room 2'), (Form('Goron') & CanUse('Mirror Shield')) | CanUse('Light Arrows'))
+    set_rule(world.get_location('ST Stray Fairy Lava Room Center Chest'), Form('Deku'))
+    set_rule(world.get_location('ST Stray Fairy Lava Room Switch Chest'), Form('Goron'))
+
+    set_rule(world.get_location('ST Light Arrows Chest'), Form('Human') | Form('Zora'))
     # todo: what forms/items can beat the garo master?
 
-    set_rule(world.get_location('ST Stray Fairy Pool Room Eyegore'), lambda state: state.can_use('Hookshot'))
-    set_rule(world.get_location('ST Stray Fairy Pool Room Behind Sun Block'), lambda state: state.can_use('Bomb Bag') and state.can_use('Light Arrows'))
+    set_rule(world.get_location('ST Stray Fairy Pool Room Eyegore'), CanUse('Hookshot'))
+    set_rule(world.get_location('ST Stray Fairy Pool Room Behind Sun Block'), CanUse('Bomb Bag') & CanUse('Light Arrows'))
     # set_rule(world.get_location(''), lambda state: state)
 
     ## Inverted
-    set_rule(world.get_location('ST Stray Fairy Inverted Entryway'), lambda state: state.can_use('Light Arrows') and state.can_reach(state.get_location('ST Entryway')))
-    set_rule(world.get_location('ST Inverted Compass Room Key Chest'), lambda state: state.can_use('Light Arrows') and state.form('Deku'))
+    # These used to be state.can_reach(state.get_location(...)), which always raised, CollectionState
+    # has no get_location. There are no spots named 'ST Entryway', 'ST Compass Room' or
+    # 'ST Post Garo Master Room' yet, so the Reach below still raises (RuntimeError: No such location).
+    set_rule(world.get_location('ST Stray Fairy Inverted Entryway'), CanUse('Light Arrows') & Reach('ST Entryway', 'Location'))
+    set_rule(world.get_location('ST Inverted Compass Room Key Chest'), CanUse('Light Arrows') & Form('Deku'))
     set_rule(world.get_location('ST Stray Fairy Inverted Compass Room 1'),
-             lambda state: state.can_reach(state.get_location('ST Compass Room')) and state.form('Zora') and state.can_use('Light Arrows') and state.form('Deku'))
-    set_rule(world.get_location('ST Stray Fairy Inverted Compass Room 2'),
-             lambda state: state.can_reach(state.get_location('ST Compass Room')) and state.can_use('Fire Arrows')
-                           and state.can_use('Light Arrows') and state.form('Deku') and state.has('Elegy of Emptiness'))
+             Reach('ST Compass Room', 'Location') & Form('Zora') & CanUse('Light Arrows') & Form('Deku'))
+    set_rule(world.get_location('ST Stray Fairy Inverted Compass Room 2'), Reach('ST Compass Room', 'Location') & CanUse('Fire Arrows') & CanUse('Light Arrows') & Form('Deku') & Has('Elegy of Emptiness'))
     set_rule(world.get_location('ST Stray Fairy Compass Room'),
-             lambda state: state.can_reach(state.get_location('ST Compass Room')) and state.can_use('Light Arrows'))
-    set_rule(world.get_location('ST Stray Fairy Wizrobe Room'), lambda state: state.can_use('Bow') and state.can_use('Hookshot'))
-    set_rule(world.get_location('ST Inverted Map Room Key'), lambda state: state.has('Elegy of Emptiness'))
-    set_rule(world.get_location('ST Boss Key Chest'), lambda state: state.can_use('Light Arrows'))
+             Reach('ST Compass Room', 'Location') & CanUse('Light Arrows'))
+    set_rule(world.get_location('ST Stray Fairy Wizrobe Room'), CanUse('Bow') & CanUse('Hookshot'))
+    set_rule(world.get_location('ST Inverted Map Room Key'), Has('Elegy of Emptiness'))
+    set_rule(world.get_location('ST Boss Key Chest'), CanUse('Light Arrows'))
     set_rule(world.get_location('ST Stray Fairy Entryway 2'),
-             lambda state: state.can_reach(state.get_location('ST Entryway')) and (state.can_use('Light Arrow') or state.can_use('Stone Mask')))
-    set_rule(world.get_location('ST Stray Fairy Post Garo Master Room'), lambda state: state.can_reach(state.get_location('ST Post Garo Master Room')) and state.can_use('Bow'))
+             Reach('ST Entryway', 'Location') & (CanUse('Light Arrow') | CanUse('Stone Mask')))
+    set_rule(world.get_location('ST Stray Fairy Post Garo Master Room'), Reach('ST Post Garo Master Room', 'Location') & CanUse('Bow'))
     # set_rule(world.get_location('Giants Mask'), lambda state: ([state.can_use(x) for x in ['Bow', 'Hookshot', 'Bomb Bag']].count(True) > 0) or state.form('Zora') or (state.form('Deku') and state.has('Magic Meter')))
     # leaving this as an open check because you need lights to get to the eyegore, which can beat him already
     # unless there's a possible path say in entrance shuffle that could allow you to reach here another way
     # figure that out later, that'll take more defined region logic
 
     ## Boss: Twinmold
-    set_rule(world.get_location('Twinmodls Remains'), lambda state: state.can_use('Giants Mask') or state.can_use('Bow'))
+    set_rule(world.get_location('Twinmodls Remains'), CanUse('Giants Mask') | CanUse('Bow'))
 
 
     ### THE MOON
-    set_rule(world.get_location('Moon Odolwa Child HP'), lambda state: state.form('Deku'))
-    set_rule(world.get_location('Moon Ghot Child HP'), lambda state: state.form('Goron'))
-    set_rule(world.get_location('Moon Gyorg Child HP'), lambda state: state.form('Zora'))
-    set_rule(world.get_location('Moon Twinmold Child Bombchu Chest'), lambda state: state.can_use('Light Arrows') and state.has('Hookshot') and state.can_kill_lizalfos())
-    set_rule(world.get_location('Moon Twinmold Child HP'), lambda state: state.can_use('Light Arrows') and state.has('Hookshot') and state.can_kill_lizalfos() and state.can_use('Bombchus'))
-    set_rule(world.get_location('Fierce Deity Mask'), lambda state: state.has('Mask', 20))
+    set_rule(world.get_location('Moon Odolwa Child HP'), Form('Deku'))
+    set_rule(world.get_location('Moon Ghot Child HP'), Form('Goron'))
+    set_rule(world.get_location('Moon Gyorg Child HP'), Form('Zora'))
+    set_rule(world.get_location('Moon Twinmold Child Bombchu Chest'), CanUse('Light Arrows') & Has('Hookshot') & Call('can_kill_lizalfos'))
+    set_rule(world.get_location('Moon Twinmold Child HP'), CanUse('Light Arrows') & Has('Hookshot') & Call('can_kill_lizalfos') & CanUse('Bombchus'))
+    set_rule(world.get_location('Fierce Deity Mask'), Count('Mask', 20))
     # we still need to determine how to deal with the counting of the masks for this section, but I'll leave it like this for now
 
 
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+import argparse
+import random
+import struct
+
+from Rom import ROM_SIZE
+from RomCompress import COMPRESSED_ROM_SIZE, RomCompressor, decompress_rom, update_crc
+
+'''
+Synthetic base ROM:
+A stand-in for the OoT 1.0 base ROM, so patching, compression and writing
+can be benchmarked and tested where the copyrighted ROM is not available.
+It has the size and the layout the ROM code relies on: a header, a boot
+file and a dmadata table listing files filled with generated data
+(random and repetitive blocks, so compression has real work to do).
+The files hold nothing the game could use. Like in the real ROM, the
+files follow each other without gaps up to FILES_END, so every address
+the randomizer patches is inside a file and survives compression. The
+boot file has the build string the Compress tool looks for, so the tool
+can compress the image too.
+
+The internal name in the header marks the image as synthetic; for such an
+image `Rom.read_base_rom` skips the checks for a real OoT ROM and
+decompresses the compressed variant in-process instead of running the
+Decompress tool.
+
+    python SyntheticRom.py ZOOTDEC.z64
+    python SyntheticRom.py ZOOT.z64 --compressed
+'''
+
+SYNTHETIC_MARKER = b'RANDO SYNTHETIC ROM '  # the 20 byte internal name at 0x20
+NAME_OFFSET = 0x20
+DMADATA_OFFSET = 0x7430                     # where OoT 1.0 keeps dmadata
+BOOT_END = 0x7430
+BUILD_STRING = b'zelda@srd'                 # ends boot, the Compress tool finds dmadata after it
+FILES_START = 0x10000                       # first file after the header, boot and dmadata
+FILES_END = 0x3500000                       # past the last patched address, 0x3480BD3
+
+_dma_entry = struct.Struct('>IIII')
+
+
+def is_synthetic_rom(buffer):
+    return bytes(buffer[NAME_OFFSET:NAME_OFFSET + len(SYNTHETIC_MARKER)]) == SYNTHETIC_MARKER
+
+
+def _file_data(rng, size):
+    data = bytearray()
+    while len(data) < size:
+        block = rng.randint(0x10, 0x400)
+        if rng.random() < 0.5:
+            data.extend(rng.getrandbits(8) for _ in range(block))
+        else:
+            pattern = bytes(rng.getrandbits(8) for _ in range(rng.randint(1, 16)))
+            data.extend((pattern * (block // len(pattern) + 1))[:block])
+    return data[:size]
+
+
+# Returns a decompressed synthetic ROM of ROM_SIZE bytes.
+# `data_size` -> total size of the generated data; more makes compression slower.
+#                The rest of the files is zeros.
+def make_synthetic_rom(seed=0, data_size=0x100000, file_count=64):
+    if data_size > FILES_END - FILES_START:
+        raise RuntimeError('Synthetic ROM data does not fit in %d bytes.' % (FILES_END - FILES_START))
+    rng = random.Random(seed)
+    buffer = bytearray(ROM_SIZE)
+
+    # big endian (.z64) header with the marker as internal name
+    struct.pack_into('>I', buffer, 0, 0x80371240)
+    buffer[NAME_OFFSET:NAME_OFFSET + len(SYNTHETIC_MARKER)] = SYNTHETIC_MARKER
+    buffer[0x40:0x1060] = _file_data(rng, 0x1060 - 0x40)
+    buffer[0x1060:BOOT_END - 0x10] = _file_data(rng, BOOT_END - 0x10 - 0x1060)
+    buffer[BOOT_END - 0x10:BOOT_END] = BUILD_STRING.ljust(0x10, b'\x00')
+
+    # makerom, boot and dmadata, then the generated files up to FILES_END,
+    # each starting with its share of the generated data
+    files = [(0, 0x1060), (0x1060, BOOT_END), (DMADATA_OFFSET, FILES_START)]
+    file_size = ((FILES_END - FILES_START) // file_count) & ~0xF
+    for index in range(file_count):
+        start = FILES_START + index * file_size
+        end = start + file_size if index < file_count - 1 else FILES_END
+        share = min(end - start, (data_size // file_count + rng.randint(-0x400, 0x400)) & ~0xF)
+        if share > 0:
+            buffer[start:start + share] = _file_data(rng, share)
+        files.append((start, end))
+
+    for index, (start, end) in enumerate(files):
+        _dma_entry.pack_into(buffer, DMADATA_OFFSET + index * 16, start, end, start, 0)
+    update_crc(buffer)
+    return buffer
+
+# Returns the compressed variant of a synthetic ROM, COMPRESSED_ROM_SIZE bytes
+def compress_synthetic_rom(buffer):
+    compressor = RomCompressor(workers=1)
+    return compressor.compress(buffer)
+
+# Decompresses a compressed synthetic ROM, like the Decompress tool does for the real one
+def decompress_synthetic_rom(buffer):
+    if len(buffer) != COMPRESSED_ROM_SIZE:
+        raise RuntimeError('Synthetic ROM is not a compressed image.')
+    return decompress_rom(buffer, ROM_SIZE)
+
+
+def write_synthetic_rom(path, compressed=False, seed=0, data_size=0x100000):
+    buffer = make_synthetic_rom(seed, data_size)
+    if compressed:
+        buffer = compress_synthetic_rom(buffer)
+    with open(path, 'wb') as outfile:
+        outfile.write(buffer)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic stand-in for the base ROM.')
+    parser.add_argument('path', help='File to write, should end in .z64.')
+    parser.add_argument('--compressed', action='store_true', help='Write the compressed variant instead of the decompressed one.')
+    parser.add_argument('--seed', default=0, type=int, help='Seed for the generated data. (default: %(default)s)')
+    parser.add_argument('--data_size', default=0x100000, type=int, help='Total size of the generated files in bytes. (default: %(default)s)')
+    args = parser.parse_args()
+    write_synthetic_rom(args.path, args.compressed, args.seed, args.data_size)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import argparse
+from collections import OrderedDict
+import json
+import math
+import os
+
+'''
+Timing records:
+With `--timing_report PATH` every seed appends one JSON record to PATH:
+
+  {"seed": 123, "version": "...", "settings": {"bridge": "medallions", ...},
+   "cached": false, "wall": 2.31, "cpu": 2.25,
+   "stages": {"create_regions": {"wall": 0.01, "cpu": 0.01}, ...}}
+
+`wall` is measured with time.perf_counter and `cpu` with time.process_time,
+both in seconds. The build stages (create_regions, create_dungeons,
+link_fixed_entrances, set_rules) are inside the `world` stage and only show
+up for the seed that built the world. When the rom is handed to a
+background writer, `write_rom` only measures queueing it. With
+`--reach_stats` every stage also has the `counters` of ReachStats.py and
+with `--trace_memory` the `memory` of MemoryTrace.py.
+
+Every record is written with a single append, so the worker processes of a
+batch can share one report file.
+'''
+
+
+# Appends `record` to the report at `path`
+def write_timing_record(path, record):
+    line = (json.dumps(record) + '\n').encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def load_timing_records(path):
+    with open(path, 'r') as report:
+        return [json.loads(line, object_pairs_hook=OrderedDict) for line in report if line.strip()]
+
+
+# Nearest rank percentile of a sorted list
+def percentile(values, fraction):
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def describe(values):
+    values = sorted(values)
+    return OrderedDict([('p50', percentile(values, 0.5)), ('p95', percentile(values, 0.95)), ('max', values[-1])])
+
+
+# Returns p50/p95/max of the wall and CPU time of the whole seed and of every
+# stage, over the records that generated their seed (not served from the cache
+# unless `include_cached`).
+def summarize(records, include_cached=False):
+    if not include_cached:
+        records = [record for record in records if not record.get('cached')]
+    summary = OrderedDict([('seeds', len(records)), ('stages', OrderedDict())])
+    if not records:
+        return summary
+
+    summary['total'] = OrderedDict((clock, describe([record[clock] for record in records])) for clock in ['wall', 'cpu'])
+    stage_names = []
+    for record in records:
+        stage_names.extend(name for name in record['stages'] if name not in stage_names)
+    for name in stage_names:
+        timings = [record['stages'][name] for record in records if name in record['stages']]
+        stage = OrderedDict([('count', len(timings))])
+        stage.update((clock, describe([timing[clock] for timing in timings])) for clock in ['wall', 'cpu'])
+        peaks = [timing['memory']['peak'] for timing in timings if timing.get('memory', {}).get('peak') is not None]
+        if peaks:
+            stage['peak_memory'] = describe(peaks)
+        summary['stages'][name] = stage
+    return summary
+
+
+def format_summary(summary):
+    lines = ['%d seeds' % summary['seeds']]
+    if not summary['seeds']:
+        return '\n'.join(lines)
+    lines.append('%-22s %6s  %8s %8s %8s  %8s %8s %8s' % ('stage', 'count', 'wall p50', 'p95', 'max', 'cpu p50', 'p95', 'max'))
+    rows = [('total', summary['seeds'], summary['total'])] + [(name, stage['count'], stage) for name, stage in summary['stages'].items()]
+    for name, count, timing in rows:
+        lines.append('%-22s %6d  %8.3f %8.3f %8.3f  %8.3f %8.3f %8.3f' % ((name, count) + tuple(timing['wall'].values()) + tuple(timing['cpu'].values())))
+    memory = [(name, stage['peak_memory']) for name, stage in summary['stages'].items() if 'peak_memory' in stage]
+    if memory:
+        lines.append('')
+        lines.append('%-22s %10s %10s %10s' % ('peak memory (MB)', 'p50', 'p95', 'max'))
+        for name, peak in memory:
+            lines.append('%-22s %10.1f %10.1f %10.1f' % ((name,) + tuple(value / 2**20 for value in peak.values())))
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize the --timing_report of one or more runs.')
+    parser.add_argument('reports', nargs='+', help='Timing report files to read.')
+    parser.add_argument('--include_cached', action='store_true', help='Also count seeds served from the result cache.')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON.')
+    args = parser.parse_args()
+
+    records = []
+    for path in args.reports:
+        records.extend(load_timing_records(path))
+    summary = summarize(records, args.include_cached)
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import subprocess
 import sys
@@ -57,6 +58,20 @@ def output_path(path):
 
 output_path.cached_path = None
 
+# Returns a digest of the source files `names`, for the keys of caches
+# holding data derived from them
+def source_digest(names):
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in names:
+        digest.update(name.encode('utf-8'))
+        try:
+            with open(os.path.join(directory, name), 'rb') as stream:
+                digest.update(stream.read())
+        except OSError:
+            pass # bundled builds don't ship their sources, their caches are keyed by the version
+    return digest.hexdigest()
+
 def open_file(filename):
     if sys.platform == 'win32':
         os.startfile(filename)
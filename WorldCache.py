@@ -0,0 +1,170 @@
+import hashlib
+import json
+import logging
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+
+from BaseClasses import World, Region, Entrance, Location, never_allow
+from Dungeons import create_dungeons
+from LocationWriters import get_location_writer
+from RuleNodes import TRUE, compile_rules, load_rules
+from Rules import set_rule, set_item_rule
+from Utils import source_digest
+
+'''
+World cache:
+Building a world (`Main.build_world`) makes every region, exit and
+location from the literals in Regions.py, connects the fixed entrances of
+EntranceShuffle.py and compiles the rules of Rules.py, for every settings
+profile a process sees. The cache keeps the result of that per settings
+profile in one file, world_<key>.pickle in the --cache_dir:
+
+  regions     name, type, exits, locations (with their addresses), and
+              the order of their entrances
+  exits       connected region, addresses, target and the rule tree
+  locations   the rule and item rule trees
+  rules       the code of every rule function, compiled as one module
+              (see `RuleNodes.compile_rules`)
+
+so a cold process builds the world with one read and no compiling.
+Dungeons are made fresh, their items must not be shared.
+
+The key covers the settings, FORMAT, the Python version (the code is
+marshalled), the release (`Main.__version__`, bundled builds don't ship
+their sources) and the sources in SOURCES, so a change to any of the
+modules the world is built from invalidates the cache. A world that can't be
+stored (a rule that is a plain function can't be pickled, nor can an
+`always_allow`, which has no RuleNodes tree) is simply built every time.
+'''
+
+FORMAT = 1
+
+SOURCES = ['BaseClasses.py', 'Regions.py', 'EntranceShuffle.py', 'Rules.py', 'RuleNodes.py', 'LocationWriters.py', 'WorldCache.py']
+
+
+# Returns the contents of a world built by `Main.build_world`, as plain data.
+# Names aren't unique for every exit, so regions and exits are referred to by position.
+def dump_world(world):
+    region_index = dict((region, index) for index, region in enumerate(world.regions))
+    exit_index = {}
+    for region in world.regions:
+        for index, entrance in enumerate(region.exits):
+            exit_index[entrance] = (region_index[region], index)
+
+    regions = []
+    rules = []
+    for region in world.regions:
+        exits = []
+        for entrance in region.exits:
+            connected = region_index[entrance.connected_region] if entrance.connected_region is not None else None
+            exits.append((entrance.name, connected, entrance.addresses, entrance.target, entrance.vanilla, entrance.rule))
+            rules.append((entrance.rule, 'state'))
+        locations = []
+        for location in region.locations:
+            if location.always_allow is not never_allow:
+                raise TypeError('always_allow of %s can\'t be stored' % location.name)
+            locations.append((location.name, location.address, location.address2, location.default, location.type, location.rule, location.item_rule_node))
+            rules.append((location.rule, 'state'))
+            rules.append((location.item_rule_node, 'item'))
+        regions.append((region.name, region.type, exits, locations, [exit_index[entrance] for entrance in region.entrances]))
+
+    entries, code = compile_rules(rules)
+    return {'format': FORMAT, 'regions': regions, 'rules': entries, 'code': marshal.dumps(code)}
+
+# Builds a world with `settings` from the data of `dump_world`
+def restore_world(settings, data):
+    load_rules(data['rules'], marshal.loads(data['code']))
+
+    world = World(*settings)
+    for name, type, exits, locations, _ in data['regions']:
+        region = Region(name, type)
+        for exit_name, _, addresses, target, vanilla, rule in exits:
+            entrance = Entrance(exit_name, region)
+            entrance.addresses = addresses
+            entrance.target = target
+            entrance.vanilla = vanilla
+            if rule is not TRUE:
+                set_rule(entrance, rule)
+            region.exits.append(entrance)
+        for location_name, address, address2, default, location_type, rule, item_rule in locations:
+            location = Location(location_name, address, address2, default, location_type, region)
+            location.writer = get_location_writer(location)
+            if rule is not TRUE:
+                set_rule(location, rule)
+            if item_rule is not TRUE:
+                set_item_rule(location, item_rule)
+            region.locations.append(location)
+        world.regions.append(region)
+
+    for region, (_, _, exits, _, entrances) in zip(world.regions, data['regions']):
+        for entrance, exit in zip(region.exits, exits):
+            if exit[1] is not None:
+                entrance.connected_region = world.regions[exit[1]]
+        region.entrances = [world.regions[parent].exits[index] for parent, index in entrances]
+    world.intialize_regions()
+
+    create_dungeons(world)
+    return world
+
+
+'''
+WorldCache object:
+The world files of every settings profile in `path`.
+'''
+class WorldCache(object):
+
+    def __init__(self, path):
+        self.path = path
+        self.digest = source_digest(SOURCES)
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+    def key(self, settings):
+        from Main import __version__
+        data = json.dumps({'settings': list(settings), 'format': FORMAT, 'python': list(sys.version_info[:2]), 'version': __version__, 'sources': self.digest}, sort_keys=True)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def _file(self, settings):
+        return os.path.join(self.path, 'world_%s.pickle' % self.key(settings))
+
+    # Returns a world built from the cache, None if `settings` aren't in it
+    def load(self, settings):
+        try:
+            with open(self._file(settings), 'rb') as stream:
+                data = pickle.loads(stream.read())
+        except (OSError, EOFError, ValueError, AttributeError, ImportError, pickle.UnpicklingError):
+            return None
+        if data.get('format') != FORMAT:
+            return None
+        return restore_world(settings, data)
+
+    def store(self, world):
+        try:
+            data = pickle.dumps(dump_world(world), pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            logging.getLogger('').debug('World not cached: %s', e)
+            return
+        handle, temp_path = tempfile.mkstemp(prefix='.tmp-', dir=self.path)
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                stream.write(data)
+            os.replace(temp_path, self._file(world.settings))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+_caches = {}
+
+# Returns the world cache configured by `args`, None if caching is off
+def get_world_cache(args):
+    path = args.cache_dir
+    if path is None:
+        return None
+    cache = _caches.get(path)
+    if cache is None:
+        cache = _caches[path] = WorldCache(path)
+    return cache
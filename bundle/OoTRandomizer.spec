@@ -6,7 +6,7 @@ block_cipher = None
 a = Analysis(['../OoTRandomizer.py'],
              pathex=['bundle'],
              binaries=[],
-             datas=[('../data/', 'data/'), ('../Compress/', 'Compress/'), ('../Decompress/', 'Decompress/'), ('../README.html', '.')],
+             datas=[('../data/', 'data/'), ('../Compress/', 'Compress/'), ('../table.txt', '.'), ('../Decompress/', 'Decompress/'), ('../README.html', '.')],
              hiddenimports=[],
              hookspath=[],
              runtime_hooks=['bundle/_rt_hook.py'],
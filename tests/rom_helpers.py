@@ -0,0 +1,11 @@
+from RomCompress import find_dmadata, read_dmadata
+
+
+# Clears the CRC and the dmadata table, which compressing rewrites
+def without_header(rom):
+    rom = bytearray(rom)
+    offset = find_dmadata(rom)
+    size = len(read_dmadata(rom, offset)) * 16
+    rom[0x10:0x18] = bytes(8)
+    rom[offset:offset + size] = bytes(size)
+    return rom
@@ -0,0 +1,26 @@
+import unittest
+
+from MMRandomizer import get_parser
+
+
+class ArgumentsTest(unittest.TestCase):
+
+    def test_workers_must_be_positive(self):
+        parser = get_parser()
+        self.assertEqual(parser.parse_args(['--count', '4', '--workers', '2']).workers, 2)
+        for value in ['0', '-1', 'x']:
+            with self.assertRaises(SystemExit):
+                parser.parse_args(['--count', '4', '--workers', value])
+        with self.assertRaises(SystemExit):
+            parser.parse_args(['--count', '0'])
+
+    def test_cache_size_must_be_positive(self):
+        parser = get_parser()
+        self.assertEqual(parser.parse_args(['--cache_size', '64']).cache_size, 64)
+        for value in ['0', '-1']:
+            with self.assertRaises(SystemExit):
+                parser.parse_args(['--cache_size', value])
+
+
+if __name__ == '__main__':
+    unittest.main()
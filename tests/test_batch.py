@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+
+import Batch
+from MMRandomizer import get_parser
+
+
+class BatchTest(unittest.TestCase):
+
+    def run_batch(self, failing):
+        seeds = Batch.derive_seeds(1, 3)
+
+        def write(seed):
+            if seed == failing:
+                raise OSError('disk full writing %s' % seed)
+
+        # stands in for `Main.main`, writes one file per seed
+        def generate(seed, args, base_rom, output, progress):
+            output.submit(write, seed)
+
+        args = get_parser().parse_args(['--count', '3', '--seed', '1', '--suppress_rom'])
+        with mock.patch('Batch.main', generate):
+            return seeds, Batch.generate_batch(args)
+
+    def test_write_failure_is_reported_against_its_seed(self):
+        seeds, result = self.run_batch(Batch.derive_seeds(1, 3)[1])
+        self.assertEqual(sorted(result.succeeded), sorted([seeds[0], seeds[2]]))
+        self.assertEqual([seed for seed, _ in result.failed], [seeds[1]])
+        self.assertIn('disk full writing %s' % seeds[1], result.failed[0][1])
+
+    def test_last_write_failure_is_reported(self):
+        seeds, result = self.run_batch(Batch.derive_seeds(1, 3)[2])
+        self.assertEqual(sorted(result.succeeded), sorted(seeds[:2]))
+        self.assertEqual([seed for seed, _ in result.failed], [seeds[2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import unittest
+
+from Daemon import GenerationDaemon, _DaemonServer
+from MMRandomizer import get_parser
+
+
+class DaemonTest(unittest.TestCase):
+
+    def setUp(self):
+        self.daemon = GenerationDaemon(get_parser().parse_args([]))
+
+    def test_settings_are_checked(self):
+        args = self.daemon.get_args({'bridge': 'open', 'hints': True, 'create_spoiler': True})
+        self.assertEqual((args.bridge, args.hints, args.create_spoiler), ('open', True, True))
+        for settings in [{'bridge': 'nowhere'}, {'bridge': 5}, {'create_spoiler': 1}, {'unknown': 1}, {'count': 2}]:
+            with self.assertRaises(RuntimeError):
+                self.daemon.get_args(settings)
+        # typed options are parsed like the command line would
+        cache_size = self.daemon.actions['cache_size']
+        self.assertEqual(GenerationDaemon.parse_setting(cache_size, 12), 12)
+        for value in [1.5, 'x']:
+            with self.assertRaises(RuntimeError):
+                GenerationDaemon.parse_setting(cache_size, value)
+
+    def test_paths_caches_and_diagnostics_are_refused(self):
+        for name, value in [('cache_dir', '/tmp'), ('cache_size', '0'), ('rom', '/etc/passwd'), ('output_dir', '/tmp'),
+                            ('compress_rom', True), ('rule_profile', True), ('trace_memory', True), ('reach_stats', True),
+                            ('profile', '/tmp'), ('timing_report', '/tmp/report')]:
+            with self.assertRaises(RuntimeError):
+                self.daemon.get_args({name: value})
+        self.assertIsNone(self.daemon.get_args({}).cache_dir)
+
+    @unittest.skipUnless(hasattr(socketserver, 'UnixStreamServer'), 'needs Unix sockets')
+    def test_idle_client_does_not_block_others(self):
+        path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+        server = _DaemonServer(path, self.daemon)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            idle = socket.socket(socket.AF_UNIX)
+            idle.connect(path)
+            client = socket.socket(socket.AF_UNIX)
+            client.settimeout(10)
+            client.connect(path)
+            client.sendall(b'{"id": 7, "settings": {"bridge": "nowhere"}}\n')
+            response = json.loads(client.makefile('rb').readline().decode('utf-8'))
+            self.assertEqual((response['id'], response['ok']), (7, False))
+            idle.close()
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
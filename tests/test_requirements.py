@@ -0,0 +1,148 @@
+from collections import Counter, defaultdict
+import random
+import unittest
+from unittest import mock
+
+from BaseClasses import CollectionState, Entrance, Location, Region, RegionType, World
+import EntranceShuffle
+import Main
+import Regions
+from Progress import SeedProgress
+from Requirements import RequirementCache, RuleRequirements, Requirements, rule_terms
+from RuleNodes import HELPERS
+
+SETTINGS = ('medallions', False, False, True, False, False)
+
+
+# CollectionState without tricks, options or events: the methods the rules
+# call that it doesn't have yet (`event`, `options`, ...) are False
+class _State(CollectionState):
+
+    def __init__(self, world):
+        super().__init__(world)
+        self.tricks = defaultdict(bool)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return lambda *arguments: False
+
+
+class _Locations(dict):
+
+    def __missing__(self, name):
+        return (None, None, None, 'Chest')
+
+
+# Builds the world of SETTINGS with `Main.build_world`. The region data is
+# unfinished (see the TODOs in Regions.py), so the regions, exits and
+# locations the rules refer to but Regions.py doesn't have yet are added
+# as empty placeholders, and the connections to them are left out.
+def build_world():
+    get_region, get_entrance, get_location = World.get_region, World.get_entrance, World.get_location
+
+    def placeholder_region(world, name):
+        try:
+            return get_region(world, name)
+        except RuntimeError:
+            region = Region(name, RegionType.Overworld)
+            region.world = world
+            world.regions.append(region)
+            return region
+
+    def placeholder_entrance(world, name):
+        try:
+            return get_entrance(world, name)
+        except RuntimeError:
+            region = placeholder_region(world, 'Placeholder %s' % name)
+            entrance = Entrance(name, region)
+            region.exits.append(entrance)
+            return entrance
+
+    def placeholder_location(world, name):
+        try:
+            return get_location(world, name)
+        except RuntimeError:
+            region = placeholder_region(world, 'Placeholder %s' % name)
+            location = Location(name, parent=region)
+            region.locations.append(location)
+            world._cached_locations = None
+            return location
+
+    with mock.patch.object(Regions, 'location_table', _Locations(Regions.location_table)), \
+         mock.patch.object(World, 'get_region', placeholder_region), \
+         mock.patch.object(World, 'get_entrance', placeholder_entrance), \
+         mock.patch.object(World, 'get_location', placeholder_location), \
+         mock.patch.object(EntranceShuffle, 'default_connections', [connection for connection in EntranceShuffle.default_connections if len(connection) == 2]), \
+         mock.patch.object(EntranceShuffle, 'default_dungeon_connections', [connection for connection in EntranceShuffle.default_dungeon_connections if len(connection) == 2]), \
+         mock.patch.object(Main, 'create_dungeons', lambda world: None):
+        return Main.build_world(SETTINGS, SeedProgress())
+
+
+class RequirementsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.world = build_world()
+        # the regions aren't all connected to 'Beginning' yet, so every overworld region is a start
+        cls.start = [region for region in cls.world.regions if region.type == RegionType.Overworld]
+        cls.rules = RuleRequirements.from_world(cls.world)
+        cls.requirements = Requirements.solve(cls.world, cls.rules, start=[region.name for region in cls.start])
+        requirements = list(cls.rules.locations.values()) + list(cls.rules.entrances.values())
+        cls.items = sorted(set(item for terms in requirements if terms for term in terms for item, _ in term) | set(['Heart Container', 'Piece of Heart']))
+
+    # A state with `inventory` that has reached the start regions
+    def make_state(self, inventory):
+        state = _State(self.world)
+        state.prog_items = inventory
+        for region in self.start:
+            state.region_cache[region] = True
+        return state
+
+    def random_inventory(self, rng):
+        inventory = []
+        for item in self.items:
+            if rng.random() < 0.6:
+                inventory.extend([item] * rng.choice([1, 1, 2, 4, 8]))
+        return inventory
+
+    def test_fast_path_matches_reachability(self):
+        known = [location for location in self.world.get_locations() if self.requirements.locations.get(location.name) is not None]
+        self.assertGreater(len(known), 100)
+
+        rng = random.Random(0)
+        for _ in range(50):
+            state = self.make_state(self.random_inventory(rng))
+            inventory = Requirements.inventory(state)
+            for location in known:
+                fast = self.requirements.can_reach(location, inventory)
+                try:
+                    full = bool(state.can_reach(location))
+                except RuntimeError:
+                    # a rule naming a spot that doesn't exist yet, only known
+                    # because the region of its location can't be reached
+                    full = False
+                self.assertEqual(fast, full, location.name)
+
+    def test_helpers_match_their_rules(self):
+        calls = [(method, ()) for method in HELPERS if method not in ['any_form_but', 'has_hearts']]
+        calls += [('any_form_but', (form,)) for form in ['Deku', 'Human', 'Goron', 'Zora']]
+        calls += [('has_hearts', (count,)) for count in range(12)]
+        rng = random.Random(1)
+        for _ in range(200):
+            state = self.make_state(self.random_inventory(rng))
+            inventory = Counter(state.prog_items)
+            for method, arguments in calls:
+                terms = rule_terms(HELPERS[method](*arguments))
+                fast = any(all(inventory[item] >= count for item, count in term) for term in terms)
+                self.assertEqual(fast, bool(getattr(state, method)(*arguments)), (method, arguments))
+
+    def test_cache_key_covers_the_release(self):
+        cache = RequirementCache()
+        key = cache.profile_key(self.world)
+        with mock.patch('Main.__version__', 'next'):
+            self.assertNotEqual(cache.profile_key(self.world), key)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from ResultCache import ResultCache, base_rom_digest, make_key
+from Rom import LocalRom, SharedBaseRom
+from SyntheticRom import write_synthetic_rom
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def test_size_is_tracked(self):
+        cache = ResultCache(os.path.join(self.path, 'cache'), max_size=3000)
+        for seed in range(4):
+            cache.put(make_key([], seed, '1'), [('Location', 'Item', False)], 'x' * 1000)
+        self.assertLessEqual(cache.total, 3000)
+        self.assertIsNone(cache.get(make_key([], 0, '1')))
+        self.assertIsNotNone(cache.get(make_key([], 3, '1')))
+
+        # a new process counts what is on disk
+        reopened = ResultCache(cache.path, max_size=3000)
+        self.assertEqual((reopened.total, list(reopened.sizes)), (cache.total, list(cache.sizes)))
+
+    def test_local_rom_patches(self):
+        rom_path = os.path.join(self.path, 'base.z64')
+        write_synthetic_rom(rom_path, data_size=0x10000)
+        rom = LocalRom(rom_path)
+        rom.write_bytes(0x20000, [1, 2, 3])
+        rom.write_block(0x20003, b'\x04\x05')
+        rom.write_byte(0x30000, 0xDE)
+        self.assertEqual(rom.get_patches(), [(0x20000, bytearray(b'\x01\x02\x03\x04\x05')), (0x30000, bytearray(b'\xde'))])
+
+        cache = ResultCache(os.path.join(self.path, 'cache'))
+        key = make_key([], 1, '1', base_rom_digest(rom_path))
+        cache.put(key, [], patches=rom.get_patches())
+        patched = LocalRom(rom_path)
+        cache.get(key).apply_patches(patched)
+        self.assertTrue(patched.buffer == rom.buffer)
+
+    def test_rom_view_checks_bytes(self):
+        rom_path = os.path.join(self.path, 'base.z64')
+        write_synthetic_rom(rom_path, data_size=0x10000)
+        base = SharedBaseRom(rom_path)
+        self.addCleanup(base.close)
+        for rom in [LocalRom(rom_path), base.create_view()]:
+            with self.assertRaises(ValueError):
+                rom.write_block(0x20000, [1, 256])
+            with self.assertRaises(ValueError):
+                rom.write_byte(0x20000, -1)
+
+    def test_key_covers_base_rom(self):
+        self.assertNotEqual(make_key([], 1, '1', 'a'), make_key([], 1, '1', 'b'))
+        self.assertIsNone(base_rom_digest(os.path.join(self.path, 'missing.z64')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from Rom import ROM_SIZE
+from RomCompress import RomCompressor, decompress_rom, read_compression_table, read_dmadata, yaz0_compress, yaz0_decompress
+from SyntheticRom import make_synthetic_rom
+from rom_helpers import without_header
+
+
+class RomCompressTest(unittest.TestCase):
+
+    def test_yaz0_round_trip(self):
+        data = bytes(range(256)) * 3 + b'\x00' * 0x200 + b'abc' * 0x100
+        self.assertEqual(yaz0_decompress(yaz0_compress(data)), data)
+
+    def test_rom_round_trip(self):
+        rom = make_synthetic_rom(data_size=0x20000)
+        compressed = RomCompressor(workers=1).compress(rom)
+        decompressed = decompress_rom(compressed, ROM_SIZE)
+
+        self.assertEqual([entry[:2] for entry in read_dmadata(decompressed)], [entry[:2] for entry in read_dmadata(rom)])
+        self.assertTrue(without_header(decompressed) == without_header(rom))
+
+    def test_compression_table(self):
+        rom = make_synthetic_rom(data_size=0x20000)
+        table = read_compression_table()
+        for index, (_, _, _, prom_end) in enumerate(read_dmadata(RomCompressor(workers=1).compress(rom))):
+            self.assertEqual(prom_end != 0, index in table)
+
+    def test_blob_cache(self):
+        rom = make_synthetic_rom(data_size=0x20000)
+        table = read_compression_table()
+        files = [(index, entry) for index, entry in enumerate(read_dmadata(rom)) if index in table and entry[0] != entry[1]]
+        # a seed patching one compressed file
+        _, (vrom_start, _, _, _) = files[0]
+        rom[vrom_start] ^= 0xFF
+
+        with tempfile.TemporaryDirectory() as directory, mock.patch('RomCompress.MEMORY_CACHE_SIZE', 0x400):
+            compressor = RomCompressor(workers=1, cache_dir=directory)
+            compressor.compress(rom, written=[vrom_start])
+            # only the base ROM's files are stored on disk
+            self.assertEqual(len(os.listdir(directory)), len(set(bytes(rom[entry[0]:entry[1]]) for _, entry in files[1:])))
+            self.assertLessEqual(compressor.cache_bytes, 0x400)
+            self.assertEqual(compressor.cache_bytes, sum(len(blob) for blob in compressor.cache.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from Requirements import ALWAYS, rule_terms
+from RuleNodes import Count, Has
+
+
+class _State(object):
+
+    def __init__(self, items):
+        self.prog_items = items
+
+
+class RuleNodesTest(unittest.TestCase):
+
+    def test_count(self):
+        for count, needs in [(-1, 0), (0, 0), (1, 1), (3, 3)]:
+            rule = Count('Piece of Heart', count).compile()
+            self.assertEqual([rule(_State(['Piece of Heart'] * have)) for have in range(4)], [have >= needs for have in range(4)])
+        self.assertEqual(rule_terms(Count('Piece of Heart', 0)), ALWAYS)
+        self.assertEqual(rule_terms(Count('Piece of Heart', 1)), rule_terms(Has('Piece of Heart')))
+
+
+if __name__ == '__main__':
+    unittest.main()
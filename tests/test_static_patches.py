@@ -0,0 +1,17 @@
+import unittest
+
+from PatchManifest import load_patch_manifest
+from StaticPatches import MANIFEST_PATH, build_records
+from Utils import local_path
+
+
+class StaticPatchesTest(unittest.TestCase):
+
+    def test_manifest_is_built_from_source(self):
+        # fails when StaticPatches.py was changed without running it
+        manifest = [(address, bytes(data), label) for address, data, label in load_patch_manifest(local_path(MANIFEST_PATH), cache=False)]
+        self.assertEqual(manifest, build_records())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from PatchManifest import apply_patch_manifest, load_patch_manifest
+from Rom import ROM_SIZE
+from RomCompress import RomCompressor, decompress_rom, read_dmadata
+from StaticPatches import MANIFEST_PATH
+from SyntheticRom import is_synthetic_rom, make_synthetic_rom
+from Utils import local_path
+from rom_helpers import without_header
+
+
+# Patches a buffer the way `LocalRom.write_block` does
+class _BufferRom(object):
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def write_block(self, address, data):
+        self.buffer[address:address + len(data)] = data
+
+
+class SyntheticRomTest(unittest.TestCase):
+
+    def test_files_cover_every_patch(self):
+        rom = make_synthetic_rom(data_size=0x20000)
+        self.assertTrue(is_synthetic_rom(rom))
+        entries = read_dmadata(rom)
+        self.assertEqual(entries[0][0], 0)
+        for entry, next_entry in zip(entries, entries[1:]):
+            self.assertEqual(entry[1], next_entry[0])
+        for address, data, _ in load_patch_manifest(local_path(MANIFEST_PATH), cache=False):
+            self.assertLessEqual(address + len(data), entries[-1][1])
+
+    def test_patches_survive_compression(self):
+        rom = make_synthetic_rom(data_size=0x20000)
+        apply_patch_manifest(_BufferRom(rom), local_path(MANIFEST_PATH), cache=False)
+        decompressed = decompress_rom(RomCompressor(workers=1).compress(rom), ROM_SIZE)
+        self.assertTrue(without_header(decompressed) == without_header(rom))
+
+
+if __name__ == '__main__':
+    unittest.main()
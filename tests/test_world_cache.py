@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from BaseClasses import Location, Region, RegionType, World
+from Rules import set_always_allow, set_rule
+from RuleNodes import Has
+from WorldCache import WorldCache
+
+SETTINGS = ('medallions', False, False, True, False, False)
+
+
+# A world of one region with one location
+def small_world():
+    world = World(*SETTINGS)
+    region = Region('Beginning', RegionType.Overworld)
+    region.world = world
+    location = Location('Chest', parent=region)
+    set_rule(location, Has('Bow'))
+    region.locations.append(location)
+    world.regions.append(region)
+    return world
+
+
+class WorldCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = WorldCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        self.cache.store(small_world())
+        # the dungeons need regions the small world doesn't have
+        with mock.patch('WorldCache.create_dungeons'):
+            world = self.cache.load(SETTINGS)
+        self.assertIsNotNone(world)
+        location = world.get_location('Chest')
+        self.assertEqual(location.rule, Has('Bow'))
+        self.assertFalse(location.always_allow(None, None))
+
+    def test_always_allow_is_not_cached(self):
+        world = small_world()
+        set_always_allow(world.get_location('Chest'), lambda item, state: item.name == 'Bow')
+        self.cache.store(world)
+        self.assertEqual(os.listdir(self.directory.name), [])
+        self.assertIsNone(self.cache.load(SETTINGS))
+
+    def test_key_covers_the_release(self):
+        key = self.cache.key(SETTINGS)
+        with mock.patch('Main.__version__', 'next'):
+            self.assertNotEqual(self.cache.key(SETTINGS), key)
+
+
+if __name__ == '__main__':
+    unittest.main()